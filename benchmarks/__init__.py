@@ -0,0 +1 @@
+"""Performance benchmarks. Run scripts directly, e.g. python benchmarks/bench_auth.py."""
@@ -0,0 +1,118 @@
+"""Microbenchmarks for src.security.auth.
+
+Usage:
+    python benchmarks/bench_auth.py                      # print results
+    python benchmarks/bench_auth.py --save baseline.json # record a baseline
+    python benchmarks/bench_auth.py --compare baseline.json --threshold 0.2
+
+With --compare the exit status is 1 when any case regresses beyond the
+threshold (a fraction of baseline ops/sec or p50 latency).
+"""
+import argparse
+import base64
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.harness import compare, load_baseline, measure, print_table, save_baseline
+from src.security import auth
+
+SECRET = "bench-secret"
+NOW = datetime(2026, 2, 20, 12, 0, 0, tzinfo=timezone.utc)
+PAYLOAD_SIZES = (0, 256, 4096)
+SCOPE_COUNTS = (1, 8, 64)
+
+
+def _scopes(count: int) -> list[str]:
+    return [f"resource{i}:read" for i in range(count)]
+
+
+def _padded_scopes(payload_bytes: int) -> list[str]:
+    return ["alerts:read"] + (["p" * payload_bytes] if payload_bytes else [])
+
+
+def build_cases() -> dict:
+    cases = {}
+
+    for size in PAYLOAD_SIZES:
+        scopes = _padded_scopes(size)
+        token = auth.create_hs256_jwt("user-1", SECRET, scopes=scopes, now=NOW)
+        expired = auth.create_hs256_jwt(
+            "user-1", SECRET, expires_in_seconds=-1, scopes=scopes, now=NOW
+        )
+        bad_sig = token[:-4] + ("AAAA" if not token.endswith("AAAA") else "BBBB")
+
+        cases[f"create_jwt/payload={size}"] = (
+            lambda scopes=scopes: auth.create_hs256_jwt("user-1", SECRET, scopes=scopes, now=NOW)
+        )
+        cases[f"verify_jwt/valid/payload={size}"] = (
+            lambda token=token: auth.verify_hs256_jwt(token, SECRET, now=NOW)
+        )
+        cases[f"verify_jwt/expired/payload={size}"] = _expect_error(expired)
+        cases[f"verify_jwt/bad_signature/payload={size}"] = _expect_error(bad_sig)
+
+    for size in (8, 64, 512):
+        header = "Basic " + base64.b64encode(
+            f"{'u' * size}:{'p' * size}".encode("utf-8")
+        ).decode("ascii")
+        cases[f"parse_basic/credential_bytes={size}"] = (
+            lambda header=header: auth.parse_basic_auth_header(header)
+        )
+
+    for count in SCOPE_COUNTS:
+        claims = {"scope": " ".join(_scopes(count))}
+        required = set(_scopes(count)[: max(1, count // 2)])
+        cases[f"has_scopes/granted={count}"] = (
+            lambda claims=claims, required=required: auth.token_has_required_scopes(
+                claims, required
+            )
+        )
+
+    return cases
+
+
+def _expect_error(token: str):
+    def run():
+        try:
+            auth.verify_hs256_jwt(token, SECRET, now=NOW + timedelta(seconds=1))
+        except ValueError:
+            return
+        raise AssertionError("expected verification to fail")
+
+    return run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.20)
+    args = parser.parse_args(argv)
+
+    results = {
+        name: measure(fn, iterations=args.iterations)
+        for name, fn in build_cases().items()
+        if args.filter in name
+    }
+    print_table(results)
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"baseline written to {args.save}")
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
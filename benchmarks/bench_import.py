@@ -0,0 +1,113 @@
+"""Cold-start import time of the package entry points.
+
+Each measurement runs a fresh interpreter with `python -X importtime` and
+reads the cumulative time of the entry point module from its stderr.
+
+Usage:
+    python benchmarks/bench_import.py               # print results
+    python benchmarks/bench_import.py --runs 9      # more samples per module
+    python benchmarks/bench_import.py --check       # exit 1 over budget
+    python benchmarks/bench_import.py --top 15      # show slowest imports
+
+Budgets are generous multiples of the measured cost so that only real
+regressions (a heavy dependency imported eagerly again) trip them; the
+module lists in HEAVY_MODULES are the precise guard. The test suite
+always checks HEAVY_MODULES; the timing budgets only run with --check or
+RUN_IMPORT_BUDGET=1, as wall-clock time is noisy on shared CI runners.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Entry point -> cumulative import budget in milliseconds.
+IMPORT_BUDGET_MS = {
+    "src.main": 60.0,
+    "src.security.auth": 40.0,
+}
+
+# Entry point -> modules it must not import at load time.
+HEAVY_MODULES = {
+    "src.main": ("pydantic", "dotenv", "sqlite3", "src.config.settings", "logging.handlers"),
+    "src.security.auth": ("pydantic", "dotenv", "sqlite3", "logging", "concurrent.futures"),
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name to (self_us, cumulative_us) from -X importtime output."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def run_import(module: str) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Import `module` in a fresh interpreter.
+
+    Returns the importtime table and the sorted names in sys.modules.
+    """
+    code = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return parse_importtime(proc.stderr), json.loads(proc.stdout)
+
+
+def measure_import(module: str, runs: int = 5) -> dict:
+    """Median cumulative import time of `module` over `runs` cold starts."""
+    totals = []
+    timings = {}
+    loaded = []
+    for _ in range(runs):
+        timings, loaded = run_import(module)
+        totals.append(timings[module][1])
+    totals.sort()
+    heavy = [name for name in HEAVY_MODULES.get(module, ()) if name in loaded]
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    return {
+        "runs": runs,
+        "median_ms": totals[len(totals) // 2] / 1000,
+        "min_ms": totals[0] / 1000,
+        "heavy_imported": heavy,
+        "slowest_self_us": [(name, self_us) for name, (self_us, _) in slowest],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per module")
+    parser.add_argument("--check", action="store_true", help="exit 1 when over budget")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, budget_ms in IMPORT_BUDGET_MS.items():
+        result = measure_import(module, runs=args.runs)
+        over = result["median_ms"] > budget_ms or result["heavy_imported"]
+        failed = failed or bool(over)
+        print(
+            f"{module:<20} median {result['median_ms']:7.2f} ms  "
+            f"min {result['min_ms']:7.2f} ms  budget {budget_ms:5.1f} ms"
+            + ("  OVER" if over else "")
+        )
+        if result["heavy_imported"]:
+            print(f"  heavy modules imported: {', '.join(result['heavy_imported'])}")
+        for name, self_us in result["slowest_self_us"][:args.top]:
+            print(f"  {self_us:>8} us  {name}")
+
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""End-to-end ingest throughput benchmark.
+
+Drives a seeded synthetic workload (see benchmarks/workload.py) through
+each ingest path against a fresh temp database:
+
+- single:     process_alert_event, one call per event
+- batch:      process_alert_batch, one call per `--batch-size` events
+- concurrent: ingest_events with `--pool-size` workers, one call per
+              batch_size * pool_size events
+- journal:    accept_alert_event into an IngestJournal with a background
+              JournalApplier; the final drain is reported separately
+
+Each path runs in its own subprocess so peak RSS is per path. Latency
+percentiles are per call (an event or a batch, as listed above).
+
+Usage:
+    python benchmarks/bench_ingest.py
+    python benchmarks/bench_ingest.py --events 20000 --invalid-ratio 0.05 \\
+        --burst-every 100 --burst-size 50 --output results.json
+    python benchmarks/bench_ingest.py --compare results.json --threshold 0.2
+
+Results (JSON) hold per path: alerts, invalid, seconds, ops_per_sec
+(persisted alerts per second), p50_us, p99_us, db_bytes, peak_rss_kib.
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.harness import compare, environment, load_baseline, percentile, print_table
+from benchmarks.workload import generate_events
+
+PATHS = ("single", "batch", "concurrent", "journal")
+
+
+def peak_rss_kib() -> int | None:
+    """Peak resident set size of this process in KiB, where available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux KiB.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _db_bytes(db_path: str) -> int:
+    return sum(
+        os.path.getsize(path)
+        for path in (db_path, db_path + "-wal", db_path + "-journal")
+        if os.path.exists(path)
+    )
+
+
+def _chunks(events: list, size: int):
+    for start in range(0, len(events), size):
+        yield events[start:start + size]
+
+
+def run_path(path: str, events: list[dict], workdir: str, batch_size: int = 500,
+             pool_size: int = 4) -> dict:
+    """Run one ingest path over `events` in `workdir`. Return its result row."""
+    from pydantic import ValidationError
+
+    import src.main as app
+    from src.config.settings import PerformanceSettings, Settings
+    from src.infrastructure.database import get_connection, initialize_database
+    from src.infrastructure.retry import RetryPolicy
+
+    if path not in PATHS:
+        raise ValueError("path must be one of: " + ", ".join(PATHS))
+
+    db_path = os.path.join(workdir, f"{path}.db")
+    logger = app.build_logger("WARNING", stream=io.StringIO())
+    policy = RetryPolicy(max_retries=2)
+    clock = time.perf_counter_ns
+    latencies = []
+    alerts = 0
+    invalid = 0
+    extra = {}
+
+    conn = get_connection(db_path, check_same_thread=False)
+    initialize_database(conn)
+    started = clock()
+
+    if path == "single":
+        for event in events:
+            call_start = clock()
+            try:
+                app.process_alert_event(conn, logger, **event, retry_policy=policy)
+                alerts += 1
+            except ValidationError:
+                invalid += 1
+            latencies.append(clock() - call_start)
+
+    elif path == "batch":
+        for chunk in _chunks(events, batch_size):
+            call_start = clock()
+            persisted, rejected = app.process_alert_batch(
+                conn, logger, chunk, batch_size=batch_size, retry_policy=policy
+            )
+            latencies.append(clock() - call_start)
+            alerts += len(persisted)
+            invalid += len(rejected)
+
+    elif path == "concurrent":
+        settings = Settings(
+            env="test",
+            database_url=db_path,
+            api_token="bench",
+            performance=PerformanceSettings(batch_size=batch_size, pool_size=pool_size),
+        )
+        for window in _chunks(events, batch_size * pool_size):
+            call_start = clock()
+            persisted, rejected = app.ingest_events(settings, logger, window)
+            latencies.append(clock() - call_start)
+            alerts += len(persisted)
+            invalid += len(rejected)
+
+    else:
+        from src.infrastructure.journal import IngestJournal, JournalApplier
+
+        journal = IngestJournal(os.path.join(workdir, "journal"))
+        applier = JournalApplier(journal, conn, batch_size=batch_size)
+        applier.start()
+        for event in events:
+            call_start = clock()
+            try:
+                app.accept_alert_event(journal, logger, **event)
+                alerts += 1
+            except ValidationError:
+                invalid += 1
+            latencies.append(clock() - call_start)
+        accepted = clock()
+        applier.stop()
+        journal.close()
+        extra["drain_seconds"] = (clock() - accepted) / 1e9
+
+    seconds = (clock() - started) / 1e9
+    if path == "journal":
+        seconds -= extra["drain_seconds"]
+    conn.close()
+
+    latencies.sort()
+    return {
+        "alerts": alerts,
+        "invalid": invalid,
+        "calls": len(latencies),
+        "seconds": seconds,
+        "ops_per_sec": alerts / seconds if seconds else float("inf"),
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "db_bytes": _db_bytes(db_path),
+        "peak_rss_kib": peak_rss_kib(),
+        **extra,
+    }
+
+
+def _workload(args) -> list[dict]:
+    return generate_events(
+        args.events,
+        seed=args.seed,
+        sites=args.sites,
+        burst_every=args.burst_every,
+        burst_size=args.burst_size,
+        invalid_ratio=args.invalid_ratio,
+    )
+
+
+def _worker(args) -> int:
+    events = _workload(args)
+    with tempfile.TemporaryDirectory(prefix="bench-ingest-") as workdir:
+        result = run_path(args.worker, events, workdir, args.batch_size, args.pool_size)
+    print(json.dumps(result))
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sites", type=int, default=100)
+    parser.add_argument("--burst-every", type=int, default=0, help="seconds between bursts")
+    parser.add_argument("--burst-size", type=int, default=0, help="extra events per burst")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--paths", default=",".join(PATHS), help="comma-separated subset")
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against earlier JSON results")
+    parser.add_argument("--threshold", type=float, default=0.20)
+    parser.add_argument("--worker", choices=PATHS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return _worker(args)
+
+    passthrough = [
+        "--events", str(args.events), "--seed", str(args.seed), "--sites", str(args.sites),
+        "--burst-every", str(args.burst_every), "--burst-size", str(args.burst_size),
+        "--invalid-ratio", str(args.invalid_ratio), "--batch-size", str(args.batch_size),
+        "--pool-size", str(args.pool_size),
+    ]
+    results = {}
+    for path in args.paths.split(","):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", path, *passthrough],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[path] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    print_table(results)
+    for path, row in results.items():
+        print(
+            f"{path}: alerts={row['alerts']} invalid={row['invalid']} "
+            f"db_bytes={row['db_bytes']} peak_rss_kib={row['peak_rss_kib']}"
+            + (f" drain_seconds={row['drain_seconds']:.3f}" if "drain_seconds" in row else "")
+        )
+
+    if args.output:
+        workload = {key: value for key, value in vars(args).items()
+                    if key not in ("output", "compare", "threshold", "worker")}
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"environment": environment(), "workload": workload, "results": results},
+                      fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Per-event logging cost: queue vs synchronous handler, text vs JSON format.
+
+Usage:
+    python benchmarks/bench_logging.py [--events 50000] [--queue-size 10000]
+
+Records are written to a real file so the synchronous handler pays for
+its write on the calling thread, as it does on the ingest path. The
+formatter section times format() alone on prebuilt records, against a
+target of 100k records/sec.
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.harness import measure, print_table
+from src.main import build_logger
+from src.observability.context import CorrelationFormatter
+from src.observability.logs import JsonFormatter
+
+TARGET_RECORDS_PER_SEC = 100_000
+
+
+def _close(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        handler.close()
+    logger.handlers.clear()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = {
+            "sync_stream_handler": {},
+            "queue_handler/drop": {"queue_size": args.queue_size, "queue_policy": "drop"},
+            "queue_handler/block": {"queue_size": args.queue_size, "queue_policy": "block"},
+        }
+        for name, options in variants.items():
+            with open(os.path.join(tmp, f"{name.replace('/', '_')}.log"), "w") as stream:
+                logger = build_logger("INFO", stream=stream, **options)
+                results[name] = measure(
+                    lambda: logger.info("alert_recorded site_id=%s", "SITE_001"),
+                    iterations=args.events,
+                    warmup=100,
+                )
+                dropped = getattr(logger.handlers[0], "dropped", 0)
+                _close(logger)
+            results[name]["dropped"] = dropped
+
+        logger = build_logger("INFO", stream=open(os.devnull, "w"))
+        results["disabled_level_debug"] = measure(
+            lambda: logger.debug("processing_alert site_id=%s", "SITE_001"),
+            iterations=args.events,
+        )
+        _close(logger)
+
+    print_table(results)
+    for name, row in results.items():
+        if row.get("dropped"):
+            print(f"{name}: dropped {row['dropped']} of {args.events + 100} records")
+
+    print()
+    formatters = bench_formatters(args.events)
+    print_table(formatters)
+    for name, row in formatters.items():
+        verdict = "meets" if row["ops_per_sec"] >= TARGET_RECORDS_PER_SEC else "misses"
+        print(f"{name}: {verdict} {TARGET_RECORDS_PER_SEC} records/sec target")
+    return 0
+
+
+def bench_formatters(events: int) -> dict:
+    record = logging.LogRecord(
+        "oil_well_monitoring", logging.INFO, __file__, 1,
+        "processing_alert site_id=%s alert_type=%s", ("SITE_001", "LEAK"), None,
+    )
+    record.site_id = "SITE_001"
+    record.alert_type = "LEAK"
+    record.correlation_id = "0123456789abcdef-0000000000000001"
+    text = CorrelationFormatter(
+        "%(asctime)s,%(levelname)s,%(message)s", datefmt="%Y-%m-%dT%H:%M:%S"
+    )
+    json_formatter = JsonFormatter()
+    return {
+        "format/text": measure(lambda: text.format(record), iterations=events),
+        "format/json": measure(lambda: json_formatter.format(record), iterations=events),
+    }
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
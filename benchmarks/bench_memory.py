@@ -0,0 +1,153 @@
+"""Memory cost of in-flight alerts, per representation.
+
+Builds `--alerts` alerts from a seeded workload (see benchmarks/workload.py)
+in each representation and reports the bytes tracemalloc sees per held
+alert:
+
+- dict:        the raw event dict (copied)
+- Alert:       the pydantic model, as the single-event path holds it
+- AlertRecord: the NamedTuple process_alert_batch holds between
+               validation and persistence
+- tuple:       a plain tuple, the floor for six fields
+- batch:       one process_alert_batch call on an in-memory database;
+               retained is the returned Alert models, peak is what a
+               burst actually costs
+- batch/records: the same with as_records=True, returning the records
+
+Strings are shared with the source events, so the numbers are container
+overhead: what an extra in-flight alert adds to RSS.
+
+Usage:
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --alerts 100000 --output memory.json
+    python benchmarks/bench_memory.py --compare memory.json --threshold 0.1
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.harness import environment, load_baseline
+from benchmarks.workload import generate_events
+from src.domain.models import Alert, AlertRecord
+from src.domain.processor import classify_alert
+
+
+def _alert(event: dict) -> Alert:
+    return Alert(severity=classify_alert(event["alert_type"]), **event)
+
+
+REPRESENTATIONS = {
+    "dict": dict,
+    "Alert": _alert,
+    "AlertRecord": lambda event: AlertRecord.from_alert(_alert(event)),
+    "tuple": lambda event: tuple(AlertRecord.from_alert(_alert(event))),
+}
+
+
+def _traced(fn) -> tuple[int, int]:
+    """Run fn() under tracemalloc; return (bytes still held by its result, peak bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current - before, peak - before
+
+
+def _per_alert(count: int, retained: int, peak: int) -> dict:
+    return {
+        "alerts": count,
+        "bytes_per_alert": retained / count,
+        "peak_bytes_per_alert": peak / count,
+    }
+
+
+def measure_bytes(build, events: list) -> dict:
+    """Bytes per alert while holding build(event) for every event."""
+    return _per_alert(len(events), *_traced(lambda: [build(event) for event in events]))
+
+
+def measure_batch(events: list, as_records: bool = False) -> dict:
+    """Bytes per alert for one process_alert_batch over `events` (retained: the result)."""
+    import src.main as app
+    from src.infrastructure.database import get_connection, initialize_database
+
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    logger = app.build_logger("WARNING", stream=io.StringIO())
+    try:
+        return _per_alert(len(events), *_traced(
+            lambda: app.process_alert_batch(conn, logger, events, batch_size=len(events),
+                                            as_records=as_records)
+        ))
+    finally:
+        conn.close()
+
+
+def run(count: int, seed: int = 0) -> dict:
+    events = generate_events(count, seed=seed)
+    results = {name: measure_bytes(build, events) for name, build in REPRESENTATIONS.items()}
+    results["batch"] = measure_batch(events)
+    results["batch/records"] = measure_batch(events, as_records=True)
+    return results
+
+
+def compare_bytes(results: dict, baseline: dict, threshold: float = 0.10) -> list[str]:
+    """Return a message per case whose bytes per alert grew beyond `threshold`."""
+    return [
+        f"{name}: {current['bytes_per_alert']:.0f} B/alert > "
+        f"baseline {baseline[name]['bytes_per_alert']:.0f} B/alert"
+        for name, current in sorted(results.items())
+        if name in baseline
+        and current["bytes_per_alert"] > baseline[name]["bytes_per_alert"] * (1 + threshold)
+    ]
+
+
+def print_table(results: dict) -> None:
+    width = max(len(name) for name in results)
+    print(f"{'case':<{width}}  {'B/alert':>9}  {'peak B/alert':>12}")
+    for name, row in results.items():
+        print(f"{name:<{width}}  {row['bytes_per_alert']:>9.0f}  {row['peak_bytes_per_alert']:>12.0f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against earlier JSON output")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    results = run(args.alerts, args.seed)
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"environment": environment(), "results": results}, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"results written to {args.output}")
+
+    if args.compare:
+        problems = compare_bytes(results, load_baseline(args.compare), args.threshold)
+        for line in problems:
+            print(f"REGRESSION {line}")
+        if problems:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,224 @@
+"""Read-path benchmarks over large generated alert databases.
+
+Builds (or reuses) an `alerts` database of `--rows` deterministic rows
+(see benchmarks/workload.py; one row per second across `--sites` sites)
+and times the representative queries from src.infrastructure.repositories:
+latest alert per site, time windows, severity counts, radius search and
+full export.
+
+`EXPLAIN QUERY PLAN` output is recorded for every query, so a missing or
+unused index shows up as a plan change in --compare, not only as a
+slower number.
+
+Usage:
+    python benchmarks/bench_queries.py --rows 1000000
+    python benchmarks/bench_queries.py --rows 10000000 --db /data/alerts-10m.db
+    python benchmarks/bench_queries.py --rows 1000000 --output queries.json
+    python benchmarks/bench_queries.py --rows 1000000 --compare queries.json
+
+Databases are cached (default: the system temp dir) and rebuilt only
+when rows, seed or sites change.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import timedelta
+from itertools import islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.harness import compare, environment, measure, print_table
+from benchmarks.workload import START, generate_rows, site_locations
+from src.infrastructure import repositories
+from src.infrastructure.database import initialize_database
+
+INDEXES = ("idx_alerts_timestamp", "idx_alerts_site_timestamp", "idx_alerts_latitude")
+LOAD_CHUNK_ROWS = 50_000
+
+
+def _dataset(rows: int, seed: int, sites: int) -> dict:
+    return {"rows": rows, "seed": seed, "sites": sites}
+
+
+def _stored_dataset(path: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute("SELECT value FROM bench_meta WHERE key = 'dataset'").fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    return json.loads(row[0]) if row else None
+
+
+def build_database(path: str, rows: int, seed: int = 0, sites: int = 1000) -> None:
+    """Create `path` with `rows` generated alerts and the schema's indexes."""
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        initialize_database(conn)
+        # Loading first and indexing afterwards is much faster than
+        # maintaining the indexes row by row.
+        for name in INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        generated = generate_rows(rows, seed=seed, sites=sites)
+        while True:
+            chunk = list(islice(generated, LOAD_CHUNK_ROWS))
+            if not chunk:
+                break
+            repositories.insert_alerts(conn, chunk)
+        initialize_database(conn)
+        conn.execute("CREATE TABLE bench_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "INSERT INTO bench_meta VALUES ('dataset', ?)",
+            (json.dumps(_dataset(rows, seed, sites), sort_keys=True),),
+        )
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def open_database(path: str, rows: int, seed: int = 0, sites: int = 1000) -> sqlite3.Connection:
+    """Open `path`, building it first unless it already holds this dataset."""
+    if _stored_dataset(path) != _dataset(rows, seed, sites):
+        build_database(path, rows, seed, sites)
+    return sqlite3.connect(path)
+
+
+def _iso(second: int) -> str:
+    return (START + timedelta(seconds=second)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_cases(conn, rows: int, seed: int = 0, sites: int = 1000) -> dict:
+    """Return {name: (sql, params, fn)} for every benchmarked query."""
+    middle = rows // 2
+    hour = (_iso(middle), _iso(middle + 3600))
+    day = (_iso(middle), _iso(middle + 86_400))
+    _, latitude, longitude = site_locations(sites, seed)[0]
+    radius_km = 10.0
+    [box] = repositories.radius_bounding_boxes(latitude, longitude, radius_km)
+
+    return {
+        "latest_per_site": (
+            repositories.LATEST_PER_SITE_SQL, (),
+            lambda: repositories.get_latest_alert_per_site(conn),
+        ),
+        "time_window/1h": (
+            repositories.TIME_WINDOW_SQL, hour,
+            lambda: repositories.get_alerts_between(conn, *hour),
+        ),
+        "time_window/1d": (
+            repositories.TIME_WINDOW_SQL, day,
+            lambda: repositories.get_alerts_between(conn, *day),
+        ),
+        "severity_counts/all": (
+            repositories.SEVERITY_COUNTS_SQL, (),
+            lambda: repositories.count_alerts_by_severity(conn),
+        ),
+        "severity_counts/1d": (
+            repositories.SEVERITY_COUNTS_WINDOW_SQL, day,
+            lambda: repositories.count_alerts_by_severity(conn, *day),
+        ),
+        f"radius/{radius_km:g}km": (
+            repositories.BOUNDING_BOX_SQL, box,
+            lambda: repositories.get_alerts_within_radius(conn, latitude, longitude, radius_km),
+        ),
+        "export": (
+            repositories.EXPORT_SQL, (),
+            lambda: sum(1 for _ in repositories.iter_all_alerts(conn)),
+        ),
+    }
+
+
+def explain(conn, sql: str, params=()) -> list[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for `sql`."""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def compare_plans(plans: dict, baseline: dict) -> list[str]:
+    """Return a message per query whose plan differs from the baseline."""
+    return [
+        f"{name}: plan {baseline[name]} -> {plan}"
+        for name, plan in sorted(plans.items())
+        if name in baseline and baseline[name] != plan
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sites", type=int, default=1000)
+    parser.add_argument("--db", metavar="PATH", help="database file (default: cached in temp dir)")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--output", metavar="PATH", help="write results and plans as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against earlier JSON output")
+    parser.add_argument("--threshold", type=float, default=0.20)
+    args = parser.parse_args(argv)
+
+    path = args.db or os.path.join(
+        tempfile.gettempdir(), f"bench-alerts-{args.rows}-s{args.seed}-n{args.sites}.db"
+    )
+    conn = open_database(path, args.rows, args.seed, args.sites)
+    try:
+        cases = {
+            name: case
+            for name, case in build_cases(conn, args.rows, args.seed, args.sites).items()
+            if args.filter in name
+        }
+        plans = {name: explain(conn, sql, params) for name, (sql, params, _) in cases.items()}
+        results = {
+            name: measure(fn, iterations=args.iterations, warmup=1)
+            for name, (_, _, fn) in cases.items()
+        }
+    finally:
+        conn.close()
+
+    print(f"database: {path} ({os.path.getsize(path) / 1e6:.1f} MB, {args.rows} rows)")
+    print_table(results)
+    for name, plan in plans.items():
+        print(f"{name}: " + " | ".join(plan))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "dataset": _dataset(args.rows, args.seed, args.sites),
+                    "results": results,
+                    "plans": plans,
+                },
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+            fh.write("\n")
+        print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        problems = compare(results, baseline["results"], args.threshold)
+        problems += compare_plans(plans, baseline.get("plans", {}))
+        for line in problems:
+            print(f"REGRESSION {line}")
+        if problems:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} and no plan changes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Shared timing, baseline and comparison helpers for benchmark scripts."""
+import json
+import platform
+import sys
+import time
+
+
+def percentile(sorted_samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+def measure(fn, iterations: int = 10_000, warmup: int = 200) -> dict:
+    """Time `fn()` per call and summarize throughput and latency.
+
+    Returns ops_per_sec plus p50/p99 latency in microseconds.
+    """
+    for _ in range(warmup):
+        fn()
+
+    clock = time.perf_counter_ns
+    samples = [0] * iterations
+    for i in range(iterations):
+        start = clock()
+        fn()
+        samples[i] = clock() - start
+
+    total_ns = sum(samples)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / (total_ns / 1e9) if total_ns else float("inf"),
+        "p50_us": percentile(samples, 0.50) / 1000,
+        "p99_us": percentile(samples, 0.99) / 1000,
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+    }
+
+
+def save_baseline(results: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"environment": environment(), "results": results}, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)["results"]
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.20) -> list[str]:
+    """Return a message per case that regressed beyond `threshold`.
+
+    A case regresses when ops/sec drops, or p50 latency grows, by more
+    than `threshold` (a fraction) relative to the baseline. Cases missing
+    from either side are ignored.
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: ops/sec {current['ops_per_sec']:.0f} < baseline {base['ops_per_sec']:.0f}"
+            )
+        elif current["p50_us"] > base["p50_us"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p50 {current['p50_us']:.2f}us > baseline {base['p50_us']:.2f}us"
+            )
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    width = max((len(name) for name in results), default=10)
+    print(f"{'case':<{width}}  {'ops/sec':>12}  {'p50 us':>9}  {'p99 us':>9}")
+    for name, row in results.items():
+        print(
+            f"{name:<{width}}  {row['ops_per_sec']:>12.0f}  "
+            f"{row['p50_us']:>9.2f}  {row['p99_us']:>9.2f}"
+        )
@@ -0,0 +1,117 @@
+"""Seeded synthetic alert workloads for the ingest and query benchmarks.
+
+The same seed and parameters always produce the same events, so results
+are comparable across commits.
+
+- Sites are spread over a fixed region (SITE-00000 ... SITE-nnnnn)
+- Alert types follow `type_mix` weights
+- Baseline traffic is one event per second; every `burst_every` events a
+  single site emits `burst_size` extra events within the same second
+- A fraction `invalid_ratio` of events fails Alert validation
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+ALERT_TYPES = ("LEAK", "BLOCKAGE", "PRESSURE", "TEMPERATURE", "ACOUSTIC")
+DEFAULT_TYPE_MIX = {"PRESSURE": 40, "TEMPERATURE": 30, "ACOUSTIC": 15, "LEAK": 10, "BLOCKAGE": 5}
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Region the sites are placed in (roughly the Permian Basin).
+LATITUDE_RANGE = (31.0, 33.0)
+LONGITUDE_RANGE = (-104.0, -101.0)
+
+_INVALID_FIELDS = (
+    ("latitude", 123.0),
+    ("longitude", -200.0),
+    ("alert_type", "EXPLOSION"),
+)
+
+
+def _timestamp(second: int) -> str:
+    return (START + timedelta(seconds=second)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def site_locations(sites: int, seed: int = 0) -> list[tuple[str, float, float]]:
+    """Return (site_id, latitude, longitude) for each site."""
+    rng = random.Random(seed)
+    return [
+        (
+            f"SITE-{i:05d}",
+            round(rng.uniform(*LATITUDE_RANGE), 5),
+            round(rng.uniform(*LONGITUDE_RANGE), 5),
+        )
+        for i in range(sites)
+    ]
+
+
+def generate_events(
+    count: int,
+    seed: int = 0,
+    sites: int = 100,
+    type_mix: dict[str, float] | None = None,
+    burst_every: int = 0,
+    burst_size: int = 0,
+    invalid_ratio: float = 0.0,
+) -> list[dict]:
+    """Return `count` process_alert_event keyword dicts in arrival order."""
+    if not 0 <= invalid_ratio <= 1:
+        raise ValueError("invalid_ratio must be between 0 and 1")
+    type_mix = type_mix or DEFAULT_TYPE_MIX
+    unknown = set(type_mix) - set(ALERT_TYPES)
+    if unknown:
+        raise ValueError(f"unknown alert types in type_mix: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(seed)
+    locations = site_locations(sites, seed)
+    types = list(type_mix)
+    weights = [type_mix[name] for name in types]
+
+    events = []
+    second = 0
+    burst_site = None
+    burst_left = 0
+    while len(events) < count:
+        if burst_left:
+            site_id, latitude, longitude = burst_site
+            burst_left -= 1
+        else:
+            second += 1
+            site_id, latitude, longitude = locations[rng.randrange(sites)]
+            if burst_every and burst_size and second % burst_every == 0:
+                burst_site = (site_id, latitude, longitude)
+                burst_left = burst_size
+
+        event = {
+            "timestamp": _timestamp(second),
+            "site_id": site_id,
+            "alert_type": rng.choices(types, weights)[0],
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+        if invalid_ratio and rng.random() < invalid_ratio:
+            field, value = _INVALID_FIELDS[rng.randrange(len(_INVALID_FIELDS))]
+            event[field] = value
+        events.append(event)
+    return events
+
+
+def generate_rows(count: int, seed: int = 0, sites: int = 1000,
+                  type_mix: dict[str, float] | None = None, seconds_per_row: int = 1):
+    """Yield classified alert rows for bulk loading, oldest first.
+
+    Rows are (timestamp, site_id, alert_type, severity, latitude, longitude)
+    tuples `seconds_per_row` apart; all of them pass Alert validation.
+    """
+    from src.domain.processor import classify_alert
+
+    rng = random.Random(seed)
+    locations = site_locations(sites, seed)
+    type_mix = type_mix or DEFAULT_TYPE_MIX
+    types = list(type_mix)
+    weights = [type_mix[name] for name in types]
+    severities = {name: classify_alert(name) for name in types}
+    for i in range(count):
+        site_id, latitude, longitude = locations[rng.randrange(sites)]
+        alert_type = rng.choices(types, weights)[0]
+        yield (_timestamp(i * seconds_per_row), site_id, alert_type, severities[alert_type],
+               latitude, longitude)
@@ -0,0 +1,166 @@
+"""
+Process-wide cached settings with hot reload.
+
+Settings.from_env re-reads the environment and re-validates on every
+call. SettingsProvider loads once, hands out the same frozen Settings
+instance, and reloads when the `.env` file's mtime changes:
+
+- checked at most every `check_interval_seconds` on get(), or on a
+  background thread via start()
+- a reload that fails validation keeps the current settings
+- subscribers are called with (old, new) after the new instance is
+  swapped in
+- real environment variables keep precedence over `.env` values
+- the provider owns `.env`: Settings.from_env is called without its own
+  load_dotenv(), so every key from the file stays reloadable. Like
+  load_dotenv(), the default file is located with find_dotenv() and
+  PYTHON_DOTENV_DISABLED=1 skips it
+"""
+import logging
+import os
+import threading
+import time
+
+from dotenv import dotenv_values, find_dotenv
+
+from src.config.settings import Settings
+
+logger = logging.getLogger("oil_well_monitoring.config")
+
+
+class SettingsProvider:
+    """Cache Settings and reload them when `.env` changes."""
+
+    def __init__(self, env_file: str | None = None, check_interval_seconds: float = 1.0):
+        # find_dotenv() returns "" when there is no file; nothing is read then.
+        self.env_file = env_file if env_file is not None else find_dotenv()
+        self.check_interval_seconds = check_interval_seconds
+        self._settings: Settings | None = None
+        self._mtime: float | None = None
+        self._checked_at = 0.0
+        self._owned_keys: set[str] = set()
+        self._subscribers: list = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _file_mtime(self) -> float | None:
+        try:
+            return os.stat(self.env_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _apply_env_file(self) -> None:
+        """Copy `.env` values into os.environ without overriding real env vars."""
+        values = {}
+        if not _dotenv_disabled() and os.path.exists(self.env_file):
+            values = dotenv_values(self.env_file)
+        for key, value in values.items():
+            if value is None or (key in os.environ and key not in self._owned_keys):
+                continue
+            os.environ[key] = value
+            self._owned_keys.add(key)
+        for key in self._owned_keys - values.keys():
+            os.environ.pop(key, None)
+            self._owned_keys.discard(key)
+
+    def _load(self) -> Settings:
+        self._apply_env_file()
+        return Settings.from_env(load_env_file=False)
+
+    def get(self) -> Settings:
+        """Return the current settings, reloading if `.env` changed."""
+        settings = self._settings
+        if settings is not None and time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return settings
+        return self.check()
+
+    def check(self) -> Settings:
+        """Stat `.env` now and reload if it changed; return current settings."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            mtime = self._file_mtime()
+            if self._settings is not None and mtime == self._mtime:
+                return self._settings
+
+            old = self._settings
+            try:
+                new = self._load()
+            except ValueError:
+                if old is None:
+                    raise
+                logger.exception("settings_reload_failed env_file=%s", self.env_file)
+                self._mtime = mtime
+                return old
+
+            self._settings = new
+            self._mtime = mtime
+            subscribers = list(self._subscribers) if old is not None and new != old else []
+
+        for callback in subscribers:
+            try:
+                callback(old, new)
+            except Exception:
+                logger.exception("settings_subscriber_failed")
+        return new
+
+    def subscribe(self, callback):
+        """Call `callback(old, new)` after each successful reload that
+        changes a value. Return a function that unsubscribes."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def start(self) -> None:
+        """Poll `.env` on a daemon thread so subscribers fire while idle."""
+        if self._thread is not None:
+            return
+        self.get()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="settings-watch", daemon=True)
+        self._thread.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.check_interval_seconds):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("settings_watch_failed")
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+
+def _dotenv_disabled() -> bool:
+    """Mirror python-dotenv's PYTHON_DOTENV_DISABLED check."""
+    return os.environ.get("PYTHON_DOTENV_DISABLED", "").casefold() in {"1", "true", "t", "yes", "y"}
+
+
+_default_provider: SettingsProvider | None = None
+_default_lock = threading.Lock()
+
+
+def get_provider() -> SettingsProvider:
+    """Return the process-wide provider, creating it on first use."""
+    global _default_provider
+    if _default_provider is None:
+        with _default_lock:
+            if _default_provider is None:
+                _default_provider = SettingsProvider()
+    return _default_provider
+
+
+def get_settings() -> Settings:
+    """Return the process-wide cached Settings."""
+    return get_provider().get()
+
+
+def reset_provider() -> None:
+    """Stop and drop the process-wide provider; the next get_settings() loads afresh."""
+    global _default_provider
+    with _default_lock:
+        if _default_provider is not None:
+            _default_provider.stop()
+        _default_provider = None
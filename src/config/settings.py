@@ -4,7 +4,117 @@ Configuration settings loaded from environment variables.
 import os
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+PROFILE_MODES = {"off", "signal", "startup"}
+
+# Environment variable -> PerformanceSettings field
+PERFORMANCE_ENV_VARS = {
+    "INGEST_MAX_RETRIES": "max_retries",
+    "INGEST_BATCH_SIZE": "batch_size",
+    "INGEST_POOL_SIZE": "pool_size",
+    "INGEST_RETRY_BASE_DELAY_MS": "retry_base_delay_ms",
+    "INGEST_RETRY_MAX_DELAY_MS": "retry_max_delay_ms",
+    "INGEST_RETRY_DEADLINE_MS": "retry_deadline_ms",
+    "LOG_QUEUE_SIZE": "log_queue_size",
+    "SQLITE_BUSY_TIMEOUT_MS": "sqlite_busy_timeout_ms",
+    "SQLITE_JOURNAL_MODE": "sqlite_journal_mode",
+    "SQLITE_SYNCHRONOUS": "sqlite_synchronous",
+    "SQLITE_CACHE_SIZE_KIB": "sqlite_cache_size_kib",
+    "PROFILE_MODE": "profile_mode",
+    "PROFILE_SECONDS": "profile_seconds",
+    "PROFILE_INTERVAL_MS": "profile_interval_ms",
+    "PROFILE_DIR": "profile_dir",
+}
+
+
+class PerformanceSettings(BaseModel):
+    """
+    Throughput tuning knobs. Defaults match the previous hardcoded behavior.
+
+    - max_retries: persistence retries per alert or batch
+    - retry_*: backoff base/cap and overall deadline (None: no deadline)
+    - batch_size: alerts per bulk insert transaction
+    - pool_size: worker threads for concurrent ingest
+    - log_queue_size: 0 logs synchronously; N > 0 uses a bounded log queue
+    - sqlite_*: connection PRAGMAs; None leaves SQLite's default
+    - profile_*: stack sampling; "signal" samples for profile_seconds on
+      SIGUSR1, "startup" also samples once at startup
+    """
+    model_config = ConfigDict(frozen=True)
+
+    max_retries: int = 2
+    batch_size: int = 500
+    pool_size: int = 4
+    retry_base_delay_ms: int = 10
+    retry_max_delay_ms: int = 1000
+    retry_deadline_ms: int | None = None
+    log_queue_size: int = 0
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_journal_mode: str | None = None
+    sqlite_synchronous: str | None = None
+    sqlite_cache_size_kib: int | None = None
+    profile_mode: str = "off"
+    profile_seconds: float = 30.0
+    profile_interval_ms: int = 5
+    profile_dir: str = "."
+
+    @field_validator("max_retries", "log_queue_size", "sqlite_busy_timeout_ms",
+                     "retry_base_delay_ms", "retry_deadline_ms")
+    def validate_non_negative(cls, value, info):
+        if value is not None and value < 0:
+            raise ValueError(f"{info.field_name} must be >= 0")
+        return value
+
+    @field_validator("batch_size", "pool_size", "sqlite_cache_size_kib", "profile_interval_ms")
+    def validate_positive(cls, value, info):
+        if value is not None and value < 1:
+            raise ValueError(f"{info.field_name} must be >= 1")
+        return value
+
+    @field_validator("retry_max_delay_ms")
+    def validate_retry_max_delay(cls, value, info):
+        base = info.data.get("retry_base_delay_ms")
+        if base is not None and value < base:
+            raise ValueError("retry_max_delay_ms must be >= retry_base_delay_ms")
+        return value
+
+    @field_validator("profile_mode")
+    def validate_profile_mode(cls, value):
+        normalized = value.lower()
+        if normalized not in PROFILE_MODES:
+            allowed_values = ", ".join(sorted(PROFILE_MODES))
+            raise ValueError(f"profile_mode must be one of: {allowed_values}")
+        return normalized
+
+    @field_validator("profile_seconds")
+    def validate_profile_seconds(cls, value):
+        if value <= 0:
+            raise ValueError("profile_seconds must be > 0")
+        return value
+
+    @field_validator("sqlite_journal_mode")
+    def validate_journal_mode(cls, value):
+        if value is None:
+            return value
+        normalized = value.upper()
+        if normalized not in SQLITE_JOURNAL_MODES:
+            allowed_values = ", ".join(sorted(SQLITE_JOURNAL_MODES))
+            raise ValueError(f"sqlite_journal_mode must be one of: {allowed_values}")
+        return normalized
+
+    @field_validator("sqlite_synchronous")
+    def validate_synchronous(cls, value):
+        if value is None:
+            return value
+        normalized = value.upper()
+        if normalized not in SQLITE_SYNCHRONOUS_MODES:
+            allowed_values = ", ".join(sorted(SQLITE_SYNCHRONOUS_MODES))
+            raise ValueError(f"sqlite_synchronous must be one of: {allowed_values}")
+        return normalized
 
 
 class Settings(BaseModel):
@@ -12,14 +122,20 @@ class Settings(BaseModel):
     Application configuration sourced from environment variables.
 
     Week 4 adds runtime config validation and log-level control.
+
+    Instances are frozen so a shared instance (see SettingsProvider) can
+    be handed to every worker without copies.
     """
+    model_config = ConfigDict(frozen=True)
+
     env: str
     database_url: str
     api_token: str
     log_level: str = "INFO"
+    performance: PerformanceSettings = PerformanceSettings()
 
     @classmethod
-    def from_env(cls):
+    def from_env(cls, load_env_file: bool = True):
         """
         Build Settings from environment variables.
 
@@ -33,10 +149,15 @@ class Settings(BaseModel):
 
         Optional variables:
         - LOG_LEVEL (defaults to INFO)
+        - Performance knobs (see PERFORMANCE_ENV_VARS), e.g.
+          INGEST_BATCH_SIZE, INGEST_MAX_RETRIES, SQLITE_JOURNAL_MODE
 
-        Reads required values and validates quickly.
+        Reads required values and validates quickly. Pass
+        `load_env_file=False` when something else owns `.env` (the
+        SettingsProvider does, so that its values can be reloaded).
         """
-        load_dotenv()
+        if load_env_file:
+            load_dotenv()
 
         values = {
             "env": os.getenv("APP_ENV"),
@@ -55,6 +176,12 @@ class Settings(BaseModel):
                 "Missing required environment variable(s): " + ", ".join(missing)
             )
 
+        values["performance"] = {
+            field: os.environ[name]
+            for name, field in PERFORMANCE_ENV_VARS.items()
+            if os.getenv(name)
+        }
+
         return cls(**values)
 
     @field_validator("env")
@@ -1,6 +1,8 @@
 """
 Domain models - pure data structures with validation
 """
+from typing import NamedTuple
+
 from pydantic import BaseModel, field_validator
 
 
@@ -52,3 +54,28 @@ class Alert(BaseModel):
             valid_types_list = ", ".join(valid_types)
             raise ValueError(f"alert_type must be one of: {valid_types_list}")
         return v
+
+
+class AlertRecord(NamedTuple):
+    """
+    Compact alert used between validation and persistence.
+
+    An already validated Alert as a plain tuple: a fraction of the memory
+    of a BaseModel instance, and in insert_alerts column order, so
+    records can be passed to the repositories as rows unchanged.
+    """
+    timestamp: str
+    site_id: str
+    alert_type: str
+    severity: str
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def from_alert(cls, alert: Alert) -> "AlertRecord":
+        return cls(alert.timestamp, alert.site_id, alert.alert_type, alert.severity,
+                   alert.latitude, alert.longitude)
+
+    def to_alert(self) -> Alert:
+        """Rebuild the Alert without re-running validation."""
+        return Alert.model_construct(**self._asdict())
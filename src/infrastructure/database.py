@@ -4,9 +4,27 @@ Infrastructure layer - database connection management
 import sqlite3
 
 
-def get_connection(db_path: str = "oil_well_monitoring.db"):
-    """Creates and returns a database connection."""
-    conn = sqlite3.connect(db_path)
+def get_connection(db_path: str = "oil_well_monitoring.db", busy_timeout_ms: int = 5000,
+                   journal_mode: str | None = None, synchronous: str | None = None,
+                   cache_size_kib: int | None = None, check_same_thread: bool = True):
+    """
+    Creates and returns a database connection.
+
+    Optional PRAGMAs are applied when given; None keeps SQLite's default.
+    Values are expected to be validated already (see PerformanceSettings).
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=busy_timeout_ms / 1000,
+        check_same_thread=check_same_thread,
+    )
+    if journal_mode is not None:
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    if synchronous is not None:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+    if cache_size_kib is not None:
+        # Negative cache_size is in KiB rather than pages.
+        conn.execute(f"PRAGMA cache_size=-{int(cache_size_kib)}")
     return conn
 
 
@@ -25,5 +43,32 @@ def initialize_database(conn):
             longitude REAL NOT NULL
         )
     """)
+
+    # Read paths: time windows, latest per site, radius (latitude band)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts (timestamp)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alerts_site_timestamp ON alerts (site_id, timestamp)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_latitude ON alerts (latitude)")
+
+    # Dead letters: alerts whose persistence failed, kept for replay
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dead_letters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            failed_at TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            error TEXT NOT NULL,
+            attempts INTEGER NOT NULL
+        )
+    """)
+
+    # Ingest journal position applied to alerts (single row)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS journal_checkpoint (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            segment INTEGER NOT NULL,
+            position INTEGER NOT NULL
+        )
+    """)
     
     conn.commit()
@@ -0,0 +1,339 @@
+"""
+Infrastructure layer - append-only ingest journal in front of the alerts table.
+
+Accepting an alert appends one record and returns once the record is on
+disk; JournalApplier moves records into `alerts` in bulk in the background.
+
+- Records: 8-byte header (payload length, CRC32) followed by a JSON row
+- Group fsync: appenders waiting for durability share one fsync; whoever
+  syncs covers every record written before it, so N concurrent accepts
+  cost far fewer than N fsyncs
+- Segments: the journal rolls to a new file past `max_segment_bytes`;
+  segments the applier has fully applied are deleted
+- Checkpoint: the applied position is stored in the database in the same
+  transaction as the applied rows, so a crash can neither apply a record
+  twice nor skip one
+- Recovery: a torn or corrupt tail (crash mid-append) is truncated when
+  the journal is opened; the applier replays everything past the
+  checkpoint
+"""
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+
+from src.infrastructure.repositories import get_journal_checkpoint, insert_alerts_at_checkpoint
+from src.observability.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger("oil_well_monitoring.journal")
+
+SEGMENT_SUFFIX = ".journal"
+
+_HEADER = struct.Struct("<II")
+
+
+def encode_record(row) -> bytes:
+    """Frame one row as header + compact JSON payload."""
+    payload = json.dumps(row, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_records(path: str, offset: int = 0, end: int | None = None):
+    """
+    Yield (next_offset, row) for each intact record from `offset`.
+
+    Stops at `end`, at end of file, or at the first torn or corrupt
+    record.
+    """
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        data = fh.read() if end is None else fh.read(max(0, end - offset))
+
+    position = 0
+    while position + _HEADER.size <= len(data):
+        length, checksum = _HEADER.unpack_from(data, position)
+        start = position + _HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        position = start + length
+        yield offset + position, json.loads(payload)
+
+
+def _valid_end(path: str) -> int:
+    end = 0
+    for end, _ in read_records(path):
+        pass
+    return end
+
+
+def _fsync_directory(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Not supported on every platform (e.g. Windows); best effort.
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class IngestJournal:
+    """
+    Segmented append-only journal with group fsync.
+
+        journal = IngestJournal("journal/")
+        journal.append(row)             # returns once the row is durable
+        journal.append(row, wait=False) # buffered; durable at next sync()
+
+    Positions are (segment, byte offset) tuples and compare in order.
+    """
+
+    def __init__(self, directory: str, max_segment_bytes: int = 64 * 1024 * 1024,
+                 registry: MetricsRegistry | None = None):
+        if max_segment_bytes < 1:
+            raise ValueError("max_segment_bytes must be >= 1")
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        segments = self.segments()
+        self._segment = segments[-1] if segments else 1
+        path = self.segment_path(self._segment)
+        self.truncated_bytes = 0
+        if segments:
+            size = os.path.getsize(path)
+            self._offset = _valid_end(path)
+            if self._offset < size:
+                self.truncated_bytes = size - self._offset
+                with open(path, "r+b") as fh:
+                    fh.truncate(self._offset)
+                    os.fsync(fh.fileno())
+        else:
+            self._offset = 0
+        self._file = open(path, "ab")
+        if not segments:
+            _fsync_directory(directory)
+        self._synced = (self._segment, self._offset)
+
+        # _sync_lock serializes fsyncs (and rolls); _lock guards the write state.
+        # Lock order: _sync_lock before _lock.
+        self._sync_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # One sync leader at a time; followers wait here for its fsync
+        # instead of queueing on _sync_lock for one fsync each.
+        self._syncing = False
+        self._sync_done = threading.Condition(self._lock)
+
+        registry = registry if registry is not None else REGISTRY
+        self._appends = registry.counter("journal.appends")
+        self._fsyncs = registry.counter("journal.fsyncs")
+
+    def segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:010d}{SEGMENT_SUFFIX}")
+
+    def segments(self) -> list[int]:
+        """Existing segment numbers, oldest first."""
+        return sorted(
+            int(name[:-len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit()
+        )
+
+    def _write_locked(self, data: bytes) -> tuple[int, int]:
+        self._file.write(data)
+        self._offset += len(data)
+        self._appends.inc()
+        return self._segment, self._offset
+
+    def _roll_locked(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._fsyncs.inc()
+        self._file.close()
+        self._synced = (self._segment, self._offset)
+        self._segment += 1
+        self._offset = 0
+        self._file = open(self.segment_path(self._segment), "ab")
+        _fsync_directory(self.directory)
+
+    def append(self, row, wait: bool = True) -> tuple[int, int]:
+        """Append one row. Return its end position.
+
+        With `wait`, return only once the row has been fsynced.
+        """
+        data = encode_record(row)
+        with self._lock:
+            fits = self._offset == 0 or self._offset + len(data) <= self.max_segment_bytes
+            if fits:
+                position = self._write_locked(data)
+        if not fits:
+            with self._sync_lock, self._lock:
+                if self._offset and self._offset + len(data) > self.max_segment_bytes:
+                    self._roll_locked()
+                position = self._write_locked(data)
+        if wait:
+            self.wait_durable(position)
+        return position
+
+    def sync(self, position: tuple[int, int] | None = None) -> tuple[int, int]:
+        """Fsync everything appended so far. Return the durable position.
+
+        With `position`, return as soon as `position` is durable. Callers
+        arriving while another sync is in flight wait for it and only
+        fsync again if it did not cover them.
+        """
+        with self._lock:
+            while True:
+                needed = position or (self._segment, self._offset)
+                if self._synced >= needed:
+                    return self._synced
+                if not self._syncing:
+                    break
+                self._sync_done.wait()
+            self._syncing = True
+        try:
+            with self._sync_lock:
+                with self._lock:
+                    target = (self._segment, self._offset)
+                    self._file.flush()
+                    fileno = self._file.fileno()
+                os.fsync(fileno)
+                self._fsyncs.inc()
+                with self._lock:
+                    self._synced = max(self._synced, target)
+        finally:
+            with self._lock:
+                self._syncing = False
+                self._sync_done.notify_all()
+        return self.durable_position()
+
+    def wait_durable(self, position: tuple[int, int]) -> None:
+        """Block until `position` is durable, joining an in-flight group sync."""
+        if self.durable_position() < position:
+            self.sync(position)
+
+    def durable_position(self) -> tuple[int, int]:
+        with self._lock:
+            return self._synced
+
+    def remove_segments_before(self, segment: int) -> int:
+        """Delete segments older than `segment`. Return how many were removed."""
+        removed = 0
+        for old in self.segments():
+            if old >= min(segment, self._segment):
+                break
+            os.remove(self.segment_path(old))
+            removed += 1
+        return removed
+
+    def close(self) -> None:
+        self.sync()
+        with self._lock:
+            self._file.close()
+
+
+class JournalApplier:
+    """
+    Apply durable journal records to the alerts table in batches.
+
+    `conn` is only used by the applier; create it with
+    check_same_thread=False when using start(). apply_pending() is also
+    the recovery step: call it once at startup to replay whatever was
+    journaled but not applied before a crash.
+    """
+
+    def __init__(self, journal: IngestJournal, conn, batch_size: int = 500,
+                 interval_seconds: float = 0.05, registry: MetricsRegistry | None = None):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.journal = journal
+        self.conn = conn
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._apply_lock = threading.Lock()
+        registry = registry if registry is not None else REGISTRY
+        self._applied = registry.counter("journal.applied")
+        self._failures = registry.counter("journal.apply_failures")
+
+    def _checkpoint(self) -> tuple[int, int]:
+        checkpoint = get_journal_checkpoint(self.conn)
+        if checkpoint is not None:
+            return checkpoint
+        segments = self.journal.segments()
+        return (segments[0] if segments else 1), 0
+
+    def _commit(self, rows: list, position: tuple[int, int]) -> None:
+        insert_alerts_at_checkpoint(self.conn, rows, *position)
+        self._applied.inc(len(rows))
+
+    def apply_pending(self) -> int:
+        """Apply every durable record past the checkpoint. Return rows applied."""
+        with self._apply_lock:
+            segment, offset = self._checkpoint()
+            end_segment, end_offset = self.journal.durable_position()
+            applied = 0
+            for current in self.journal.segments():
+                if current < segment or current > end_segment:
+                    continue
+                start = offset if current == segment else 0
+                limit = end_offset if current == end_segment else None
+                rows = []
+                position = (current, start)
+                for next_offset, row in read_records(self.journal.segment_path(current), start, limit):
+                    rows.append(row)
+                    position = (current, next_offset)
+                    if len(rows) >= self.batch_size:
+                        self._commit(rows, position)
+                        applied += len(rows)
+                        rows = []
+                if rows:
+                    self._commit(rows, position)
+                    applied += len(rows)
+                if current < end_segment:
+                    segment_path = self.journal.segment_path(current)
+                    if position[1] < os.path.getsize(segment_path):
+                        # Sealed segments are never torn, so this is damage.
+                        # Keep the checkpoint and the file for inspection.
+                        raise ValueError(
+                            f"corrupt record in sealed journal segment {segment_path} "
+                            f"at offset {position[1]}"
+                        )
+                    # Sealed segment fully applied: move the checkpoint past it.
+                    self._commit([], (current + 1, 0))
+                    segment, offset = current + 1, 0
+
+            self.journal.remove_segments_before(self._checkpoint()[0])
+            return applied
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.apply_pending()
+            except Exception:
+                # Left in the journal; retried on the next round.
+                self._failures.inc()
+                logger.exception("journal_apply_failed")
+
+    def start(self) -> None:
+        """Replay pending records, then keep applying on a daemon thread."""
+        if self._thread is not None:
+            return
+        self.apply_pending()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="journal-applier", daemon=True)
+        self._thread.start()
+
+    def stop(self, final_apply: bool = True) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if final_apply:
+            self.journal.sync()
+            self.apply_pending()
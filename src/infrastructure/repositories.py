@@ -1,6 +1,30 @@
 """
 Infrastructure layer - data access operations
 """
+import json
+import math
+
+EARTH_RADIUS_KM = 6371.0
+
+ALERT_COLUMNS = "timestamp, site_id, alert_type, severity, latitude, longitude"
+
+# Query text is module level so benchmarks can EXPLAIN exactly what runs.
+# Latest per site: one (site_id, timestamp) index probe per site instead of
+# a GROUP BY over every row (~400x faster at 1M rows, 1000 sites).
+LATEST_PER_SITE_SQL = """SELECT a.timestamp, a.site_id, a.alert_type, a.severity, a.latitude, a.longitude
+   FROM (SELECT DISTINCT site_id FROM alerts) AS s
+   JOIN alerts AS a ON a.rowid = (
+       SELECT rowid FROM alerts WHERE site_id = s.site_id ORDER BY timestamp DESC LIMIT 1
+   )
+   ORDER BY a.site_id"""
+TIME_WINDOW_SQL = f"""SELECT {ALERT_COLUMNS} FROM alerts
+   WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp"""
+SEVERITY_COUNTS_SQL = "SELECT severity, COUNT(*) FROM alerts GROUP BY severity"
+SEVERITY_COUNTS_WINDOW_SQL = """SELECT severity, COUNT(*) FROM alerts
+   WHERE timestamp >= ? AND timestamp < ? GROUP BY severity"""
+BOUNDING_BOX_SQL = f"""SELECT {ALERT_COLUMNS} FROM alerts
+   WHERE latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?"""
+EXPORT_SQL = f"SELECT {ALERT_COLUMNS} FROM alerts"
 
 
 def insert_alert(conn, timestamp: str, site_id: str, alert_type: str, 
@@ -26,8 +50,201 @@ def insert_alert(conn, timestamp: str, site_id: str, alert_type: str,
     conn.commit()
 
 
+def insert_alerts(conn, rows):
+    """
+    Persists many alerts in a single transaction.
+
+    Args:
+        conn: SQLite connection
+        rows: Iterable of (timestamp, site_id, alert_type, severity,
+              latitude, longitude) tuples
+
+    Rolls back the whole batch if any row fails.
+    """
+    try:
+        conn.executemany(
+            """INSERT INTO alerts (timestamp, site_id, alert_type, severity, latitude, longitude)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def insert_alerts_at_checkpoint(conn, rows, segment: int, position: int):
+    """
+    Persists alerts and the journal position they came from atomically.
+
+    Args:
+        conn: SQLite connection
+        rows: Alert row tuples, as for insert_alerts (may be empty)
+        segment: Journal segment of the last applied record
+        position: Byte offset just past the last applied record
+    """
+    try:
+        conn.executemany(
+            """INSERT INTO alerts (timestamp, site_id, alert_type, severity, latitude, longitude)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        conn.execute(
+            """INSERT OR REPLACE INTO journal_checkpoint (id, segment, position)
+               VALUES (1, ?, ?)""",
+            (segment, position),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def get_journal_checkpoint(conn):
+    """Returns the applied journal (segment, position), or None."""
+    row = conn.execute("SELECT segment, position FROM journal_checkpoint WHERE id = 1").fetchone()
+    return tuple(row) if row else None
+
+
+def get_latest_alert_per_site(conn):
+    """Returns the most recent alert row of every site, ordered by site_id."""
+    return conn.execute(LATEST_PER_SITE_SQL).fetchall()
+
+
+def get_alerts_between(conn, start: str, end: str):
+    """Returns alerts with start <= timestamp < end, oldest first."""
+    return conn.execute(TIME_WINDOW_SQL, (start, end)).fetchall()
+
+
+def count_alerts_by_severity(conn, start: str | None = None, end: str | None = None) -> dict:
+    """Counts alerts per severity, optionally within [start, end)."""
+    if start is None and end is None:
+        rows = conn.execute(SEVERITY_COUNTS_SQL)
+    else:
+        rows = conn.execute(SEVERITY_COUNTS_WINDOW_SQL, (start or "", end or "\uffff"))
+    return dict(rows.fetchall())
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def radius_bounding_boxes(latitude: float, longitude: float, radius_km: float):
+    """
+    Returns (min_lat, max_lat, min_lon, max_lon) boxes enclosing the circle.
+
+    Longitudes stay within [-180, 180]: a circle crossing the antimeridian
+    gets two boxes, one per side. A circle reaching a pole covers every
+    longitude.
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    min_lat, max_lat = latitude - dlat, latitude + dlat
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return [(max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)]
+
+    # Widest longitude offset on the circle (not at its centre latitude).
+    dlon = math.degrees(math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(latitude)))))
+    min_lon, max_lon = longitude - dlon, longitude + dlon
+    if min_lon < -180.0:
+        return [(min_lat, max_lat, min_lon + 360.0, 180.0), (min_lat, max_lat, -180.0, max_lon)]
+    if max_lon > 180.0:
+        return [(min_lat, max_lat, min_lon, 180.0), (min_lat, max_lat, -180.0, max_lon - 360.0)]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def get_alerts_within_radius(conn, latitude: float, longitude: float, radius_km: float):
+    """
+    Returns alerts within `radius_km` of a point.
+
+    Bounding box queries narrow candidates in SQL (using the latitude
+    index); the exact great-circle distance is checked in Python.
+    """
+    return [
+        row
+        for box in radius_bounding_boxes(latitude, longitude, radius_km)
+        for row in conn.execute(BOUNDING_BOX_SQL, box)
+        if _haversine_km(latitude, longitude, row[4], row[5]) <= radius_km
+    ]
+
+
+def iter_all_alerts(conn, batch_size: int = 10_000):
+    """Yields every alert row, fetching `batch_size` rows at a time."""
+    cursor = conn.execute(EXPORT_SQL)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
 def get_all_alerts(conn):
     """Retrieves all alerts from the database."""
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM alerts")
     return cursor.fetchall()
+
+
+def insert_dead_letters(conn, failed_at: str, payloads, error: str, attempts: int):
+    """
+    Stores alert payloads whose persistence failed.
+
+    Args:
+        conn: SQLite connection
+        failed_at: When persistence gave up
+        payloads: Iterable of alert event dicts (process_alert_event kwargs)
+        error: Description of the last error
+        attempts: Persistence attempts made
+    """
+    try:
+        conn.executemany(
+            """INSERT INTO dead_letters (failed_at, payload, error, attempts)
+               VALUES (?, ?, ?, ?)""",
+            [(failed_at, json.dumps(payload, sort_keys=True), error, attempts)
+             for payload in payloads],
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def get_dead_letters(conn, after_id: int = 0, limit: int = 500):
+    """
+    Retrieves dead letters in id order.
+
+    Returns a list of (id, failed_at, payload dict, error, attempts).
+    """
+    cursor = conn.execute(
+        """SELECT id, failed_at, payload, error, attempts FROM dead_letters
+           WHERE id > ? ORDER BY id LIMIT ?""",
+        (after_id, limit),
+    )
+    return [
+        (row_id, failed_at, json.loads(payload), error, attempts)
+        for row_id, failed_at, payload, error, attempts in cursor.fetchall()
+    ]
+
+
+def delete_dead_letters(conn, ids):
+    """Removes replayed dead letters."""
+    conn.executemany("DELETE FROM dead_letters WHERE id = ?", [(row_id,) for row_id in ids])
+    conn.commit()
+
+
+def update_dead_letters(conn, ids, error: str):
+    """Records a failed replay: new error, one more attempt."""
+    conn.executemany(
+        "UPDATE dead_letters SET error = ?, attempts = attempts + 1 WHERE id = ?",
+        [(error, row_id) for row_id in ids],
+    )
+    conn.commit()
+
+
+def count_dead_letters(conn) -> int:
+    """Counts stored dead letters."""
+    return conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
@@ -0,0 +1,130 @@
+"""
+Retry policy for persistence calls.
+
+- Exponential backoff with full jitter: attempt n sleeps a random time in
+  [0, min(max_delay, base_delay * multiplier**n)], so workers that hit the
+  same lock spread out instead of retrying in lockstep
+- Optional deadline: no retry is started that would sleep past it
+- Error classification: busy/locked errors are retried, permanent errors
+  (constraint violations, bad SQL, validation) are raised immediately
+- Metrics in the registry, tagged by operation:
+  retry.attempts, retry.give_ups (tag reason=permanent|exhausted|deadline)
+  and retry.backoff_ms (histogram of sleeps)
+"""
+import random
+import time
+
+from src.observability.metrics import REGISTRY, MetricsRegistry
+
+PERMANENT = "permanent"
+EXHAUSTED = "exhausted"
+DEADLINE = "deadline"
+
+_RETRYABLE_SQLITE_MESSAGES = ("locked", "busy")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Classify a persistence error.
+
+    sqlite3.OperationalError is retryable only for busy/locked; other
+    sqlite3 errors and ValueError/TypeError (which covers pydantic's
+    ValidationError) are permanent. Anything else is treated as transient.
+    """
+    # Imported here so importing this module does not load sqlite3.
+    import sqlite3
+
+    if isinstance(exc, sqlite3.OperationalError):
+        message = str(exc).lower()
+        return any(text in message for text in _RETRYABLE_SQLITE_MESSAGES)
+    if isinstance(exc, (sqlite3.Error, ValueError, TypeError)):
+        return False
+    return True
+
+
+class RetryPolicy:
+    """
+    Retry a callable with backoff, jitter and a deadline.
+
+        policy = RetryPolicy(max_retries=3, deadline_seconds=2.0)
+        policy.call(lambda attempt: insert_alert(conn, ...))
+
+    `sleep`, `clock` and `rng` are injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay_seconds: float = 0.01,
+        max_delay_seconds: float = 1.0,
+        multiplier: float = 2.0,
+        deadline_seconds: float | None = None,
+        classify=is_retryable,
+        operation: str = "persist",
+        registry: MetricsRegistry | None = None,
+        sleep=time.sleep,
+        clock=time.monotonic,
+        rng=random.random,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if base_delay_seconds < 0 or max_delay_seconds < base_delay_seconds:
+            raise ValueError("need 0 <= base_delay_seconds <= max_delay_seconds")
+        if multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+        self.max_retries = max_retries
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.multiplier = multiplier
+        self.deadline_seconds = deadline_seconds
+        self.classify = classify
+        self.operation = operation
+        self.registry = registry if registry is not None else REGISTRY
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng
+
+    def delay(self, retry: int) -> float:
+        """Backoff in seconds before retry number `retry` (0-based)."""
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * self.multiplier ** retry)
+        return self._rng() * ceiling
+
+    def _give_up(self, reason: str) -> None:
+        self.registry.counter(
+            "retry.give_ups", {"operation": self.operation, "reason": reason}
+        ).inc()
+
+    def call(self, fn, on_retry=None):
+        """
+        Call `fn(attempt)` until it succeeds, with attempt = 0, 1, ...
+
+        Before each retry `on_retry(attempt, exc, delay_seconds)` is called
+        with the upcoming attempt number. The last error is re-raised when
+        it is permanent, retries are exhausted or the deadline would pass.
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            try:
+                return fn(attempt)
+            except Exception as exc:
+                if not self.classify(exc):
+                    self._give_up(PERMANENT)
+                    raise
+                if attempt >= self.max_retries:
+                    self._give_up(EXHAUSTED)
+                    raise
+                delay = self.delay(attempt)
+                if (self.deadline_seconds is not None
+                        and self._clock() - started + delay > self.deadline_seconds):
+                    self._give_up(DEADLINE)
+                    raise
+
+                attempt += 1
+                tags = {"operation": self.operation}
+                self.registry.counter("retry.attempts", tags).inc()
+                self.registry.histogram("retry.backoff_ms", tags).observe(delay * 1000)
+                if on_retry is not None:
+                    on_retry(attempt, exc, delay)
+                if delay > 0:
+                    self._sleep(delay)
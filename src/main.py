@@ -1,15 +1,31 @@
 """
 Main application demonstrating clean architecture with validation.
+
+Heavy dependencies (pydantic, dotenv, sqlite3, the logging handlers) are
+imported inside the functions that use them, so importing this module
+stays cheap for short-lived workers. Imports repeated on the hot path are
+a sys.modules lookup after the first call.
 """
 import logging
+import sys
+from typing import TYPE_CHECKING
 
-from pydantic import ValidationError
-
-from src.config.settings import Settings
-from src.domain.models import Alert
 from src.domain.processor import classify_alert
-from src.infrastructure.database import get_connection, initialize_database
-from src.infrastructure.repositories import insert_alert
+from src.infrastructure.repositories import (
+    delete_dead_letters,
+    get_dead_letters,
+    insert_alert,
+    insert_alerts,
+    insert_dead_letters,
+    update_dead_letters,
+)
+from src.infrastructure.retry import RetryPolicy
+from src.observability.metrics import REGISTRY
+from src.observability.tracing import timed
+
+if TYPE_CHECKING:
+    from src.config.settings import Settings
+    from src.domain.models import Alert, AlertRecord
 
 
 def process_alert_reading(conn, timestamp: str, site_id: str, alert_type: str,
@@ -34,72 +50,555 @@ def load_settings():
     """
     Load application settings from environment.
 
-    Load and validate settings.
+    Returns the process-wide cached Settings from the SettingsProvider,
+    reloaded when `.env` changes.
     """
-    return Settings.from_env()
+    from src.config.provider import get_settings
 
+    return get_settings()
 
-def build_logger(log_level: str, stream=None) -> logging.Logger:
-    logger = logging.getLogger("oil_well_monitoring")
-    logger.setLevel(log_level.upper())
-    logger.propagate = False
 
-    logger.handlers.clear()
+def open_connection(settings: "Settings"):
+    """
+    Open the alerts database with the PRAGMAs from settings.performance.
+    """
+    from src.infrastructure.database import get_connection
+
+    perf = settings.performance
+    return get_connection(
+        settings.database_url,
+        busy_timeout_ms=perf.sqlite_busy_timeout_ms,
+        journal_mode=perf.sqlite_journal_mode,
+        synchronous=perf.sqlite_synchronous,
+        cache_size_kib=perf.sqlite_cache_size_kib,
+    )
+
+
+def retry_policy_from_settings(settings: "Settings") -> RetryPolicy:
+    """
+    Build the persistence RetryPolicy from settings.performance.
+    """
+    perf = settings.performance
+    deadline_ms = perf.retry_deadline_ms
+    return RetryPolicy(
+        max_retries=perf.max_retries,
+        base_delay_seconds=perf.retry_base_delay_ms / 1000,
+        max_delay_seconds=perf.retry_max_delay_ms / 1000,
+        deadline_seconds=deadline_ms / 1000 if deadline_ms is not None else None,
+    )
+
+
+def build_logger_from_settings(settings: "Settings", stream=None,
+                               log_format: str = "text") -> logging.Logger:
+    """
+    Build the application logger from settings.
+
+    LOG_QUEUE_SIZE=0 (the default) keeps logging synchronous.
+    """
+    queue_size = settings.performance.log_queue_size or None
+    return build_logger(settings.log_level, stream=stream, queue_size=queue_size,
+                        log_format=log_format)
+
+
+def start_profiling(settings: "Settings") -> bool:
+    """
+    Arm the stack sampler according to settings.performance.profile_mode.
+
+    "signal" installs a SIGUSR1 handler that samples for profile_seconds;
+    "startup" also starts one session immediately. Returns True when the
+    signal handler is installed.
+    """
+    perf = settings.performance
+    if perf.profile_mode == "off":
+        return False
+
+    from src.observability.profiling import install_signal_handler, profile_for
+
+    interval_seconds = perf.profile_interval_ms / 1000
+    installed = install_signal_handler(perf.profile_seconds, perf.profile_dir, interval_seconds)
+    if perf.profile_mode == "startup":
+        profile_for(perf.profile_seconds, perf.profile_dir, interval_seconds)
+    return installed
+
+
+def follow_log_level(logger: logging.Logger, provider):
+    """
+    Keep the logger's level in sync with a SettingsProvider.
+
+    Returns a function that stops following.
+    """
+    def on_change(old, new):
+        if new.log_level != old.log_level:
+            logger.setLevel(new.log_level)
+
+    return provider.subscribe(on_change)
+
+
+class IngestSizes:
+    """
+    Batch and pool size for ingest_events, kept current by follow_ingest_sizes.
+
+    Both values are swapped in as one tuple, so a reader never pairs a new
+    batch size with an old pool size.
+    """
+    __slots__ = ("_sizes",)
+
+    def __init__(self, batch_size: int, pool_size: int):
+        self._sizes = (batch_size, pool_size)
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "IngestSizes":
+        return cls(settings.performance.batch_size, settings.performance.pool_size)
+
+    def get(self) -> tuple[int, int]:
+        """Return (batch_size, pool_size)."""
+        return self._sizes
+
+    def set(self, batch_size: int, pool_size: int) -> None:
+        self._sizes = (batch_size, pool_size)
+
+
+def follow_ingest_sizes(sizes: IngestSizes, provider):
+    """
+    Keep an IngestSizes in sync with a SettingsProvider.
+
+    Returns a function that stops following.
+    """
+    def on_change(old, new):
+        perf = new.performance
+        if (perf.batch_size, perf.pool_size) != sizes.get():
+            sizes.set(perf.batch_size, perf.pool_size)
+
+    return provider.subscribe(on_change)
+
+
+def build_logger(log_level: str, stream=None, queue_size: int | None = None,
+                 queue_policy: str = "drop", log_format: str = "text") -> logging.Logger:
+    """
+    Build the application logger.
+
+    `log_format` is "text" (timestamp,level,message lines) or "json" (one
+    JSON object per record, including `extra=` fields such as site_id and
+    the correlation ID).
+
+    By default records are written synchronously to `stream`. With
+    `queue_size`, records go through a bounded in-memory queue and are
+    written by a background listener thread; `queue_policy` picks what
+    happens when the queue is full ("drop" and count, or "block").
+    """
+    from src.observability.context import CorrelationFormatter, CorrelationIdFilter
+    from src.observability.logs import BoundedQueueHandler, JsonFormatter
+
+    if log_format not in ("text", "json"):
+        raise ValueError("log_format must be 'text' or 'json'")
+    # Validate the level before a queue listener thread is started.
+    level = logging.getLevelName(log_level.upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown level: {log_level!r}")
     handler = logging.StreamHandler(stream)
-    handler.setFormatter(
-        logging.Formatter(
-            "%(asctime)s,%(levelname)s,%(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S",
+    handler.addFilter(CorrelationIdFilter())
+    if log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(
+            CorrelationFormatter(
+                "%(asctime)s,%(levelname)s,%(message)s",
+                datefmt="%Y-%m-%dT%H:%M:%S",
+            )
         )
-    )
-    logger.addHandler(handler)
 
+    if queue_size is not None:
+        queue_handler = BoundedQueueHandler(queue_size, queue_policy)
+        # Correlation IDs live in contextvars, so capture them on the caller's thread.
+        queue_handler.addFilter(CorrelationIdFilter())
+        queue_handler.start(handler)
+        handler = queue_handler
+
+    # Swap handlers only once the new one is built: bad arguments above
+    # leave the existing logger untouched.
+    logger = logging.getLogger("oil_well_monitoring")
+    logger.setLevel(level)
+    logger.propagate = False
+    for old_handler in list(logger.handlers):
+        old_handler.close()
+    logger.handlers.clear()
+    logger.addHandler(handler)
     return logger
 
 
+def _event_payload(alert: "Alert | AlertRecord") -> dict:
+    return {
+        "timestamp": alert.timestamp,
+        "site_id": alert.site_id,
+        "alert_type": alert.alert_type,
+        "latitude": alert.latitude,
+        "longitude": alert.longitude,
+    }
+
+
+def _dead_letter(dead_letter_conn, logger: logging.Logger, payloads: list[dict],
+                 exc: Exception, attempts: int) -> bool:
+    """Store failed payloads. A failing store is logged, never raised."""
+    from datetime import datetime, timezone
+
+    failed_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        insert_dead_letters(dead_letter_conn, failed_at, payloads, repr(exc), attempts)
+    except Exception:
+        logger.exception("dead_letter_failed count=%s", len(payloads))
+        return False
+    REGISTRY.counter("ingest.dead_lettered").inc(len(payloads))
+    logger.warning("alert_dead_lettered count=%s attempts=%s", len(payloads), attempts)
+    return True
+
+
 def process_alert_event(conn, logger: logging.Logger, timestamp: str, site_id: str,
                         alert_type: str, latitude: float, longitude: float,
-                        max_retries: int = 2) -> Alert:
-    logger.debug("processing_alert site_id=%s alert_type=%s", site_id, alert_type)
+                        max_retries: int = 2, retry_policy: RetryPolicy | None = None,
+                        dead_letter_conn=None) -> "Alert":
+    """
+    Validate, classify and persist one alert event.
 
-    try:
-        alert = Alert(
-            timestamp=timestamp,
-            site_id=site_id,
-            alert_type=alert_type,
-            severity="",
-            latitude=latitude,
-            longitude=longitude,
-        )
-    except ValidationError:
-        logger.exception("validation_failed")
-        raise
+    Persistence is retried by `retry_policy` (default: backoff with jitter
+    and `max_retries` retries); permanent errors are not retried. When
+    persistence fails and `dead_letter_conn` is given, the event is saved
+    to its dead_letters table before the error is re-raised.
+    """
+    from pydantic import ValidationError
+
+    from src.domain.models import Alert
 
-    alert.severity = classify_alert(alert.alert_type)
+    with timed("ingest.process_alert"):
+        log_fields = {"site_id": site_id, "alert_type": alert_type}
+        logger.debug("processing_alert site_id=%s alert_type=%s", site_id, alert_type,
+                     extra=log_fields)
 
-    for attempt in range(max_retries + 1):
         try:
-            insert_alert(
-                conn,
-                alert.timestamp,
-                alert.site_id,
-                alert.alert_type,
-                alert.severity,
-                alert.latitude,
-                alert.longitude,
+            with timed("ingest.validate"):
+                alert = Alert(
+                    timestamp=timestamp,
+                    site_id=site_id,
+                    alert_type=alert_type,
+                    severity="",
+                    latitude=latitude,
+                    longitude=longitude,
+                )
+        except ValidationError:
+            logger.exception("validation_failed", extra=log_fields)
+            raise
+
+        with timed("ingest.classify"):
+            alert.severity = classify_alert(alert.alert_type)
+        log_fields["severity"] = alert.severity
+
+        policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        attempts = [0]
+
+        def persist(attempt):
+            attempts[0] = attempt + 1
+            with timed("ingest.persist" if attempt == 0 else "ingest.retry"):
+                insert_alert(
+                    conn,
+                    alert.timestamp,
+                    alert.site_id,
+                    alert.alert_type,
+                    alert.severity,
+                    alert.latitude,
+                    alert.longitude,
+                )
+
+        def on_retry(attempt, exc, delay):
+            logger.warning(
+                "retrying_persist attempt=%s max_retries=%s",
+                attempt,
+                policy.max_retries,
+                extra={**log_fields, "attempt": attempt},
             )
-            logger.info("alert_recorded")
-            return alert
-        except Exception:
-            if attempt < max_retries:
-                logger.warning(
-                    "retrying_persist attempt=%s max_retries=%s",
-                    attempt + 1,
-                    max_retries,
+
+        try:
+            policy.call(persist, on_retry)
+        except Exception as exc:
+            logger.exception("alert_processing_failed", extra=log_fields)
+            if dead_letter_conn is not None:
+                _dead_letter(dead_letter_conn, logger, [_event_payload(alert)], exc, attempts[0])
+            raise
+
+        with timed("ingest.log"):
+            logger.info("alert_recorded", extra=log_fields)
+        return alert
+
+
+def accept_alert_event(journal, logger: logging.Logger, timestamp: str, site_id: str,
+                       alert_type: str, latitude: float, longitude: float,
+                       wait: bool = True) -> "Alert":
+    """
+    Validate, classify and journal one alert event.
+
+    Returns once the alert is durable in `journal` (an IngestJournal);
+    a JournalApplier writes it to the alerts table later. With
+    `wait=False` the caller syncs the journal itself.
+    """
+    from pydantic import ValidationError
+
+    from src.domain.models import Alert, AlertRecord
+
+    with timed("ingest.accept_alert"):
+        log_fields = {"site_id": site_id, "alert_type": alert_type}
+        try:
+            with timed("ingest.validate"):
+                alert = Alert(
+                    timestamp=timestamp,
+                    site_id=site_id,
+                    alert_type=alert_type,
+                    severity="",
+                    latitude=latitude,
+                    longitude=longitude,
                 )
+        except ValidationError:
+            logger.exception("validation_failed", extra=log_fields)
+            raise
+
+        with timed("ingest.classify"):
+            alert.severity = classify_alert(alert.alert_type)
+        log_fields["severity"] = alert.severity
+
+        with timed("ingest.journal"):
+            journal.append(AlertRecord.from_alert(alert), wait=wait)
+        logger.info("alert_accepted", extra=log_fields)
+        return alert
+
+
+def process_alert_batch(conn, logger: logging.Logger, events, batch_size: int = 500,
+                        max_retries: int = 2, retry_policy: RetryPolicy | None = None,
+                        dead_letter_conn=None, on_reject=None, as_records: bool = False
+                        ) -> tuple[list["Alert"] | list["AlertRecord"], list[dict]]:
+    """
+    Validate, classify and persist many alert events.
+
+    Valid alerts are written with one bulk insert per `batch_size` chunk,
+    each chunk retried as a unit by `retry_policy` (default: backoff with
+    jitter and `max_retries` retries). Invalid or malformed events are
+    logged and returned as rejected; a `severity` key in an event is
+    ignored. `on_reject(index, event)` is called for each rejected event
+    with its position in `events`. A chunk that still fails is re-raised,
+    or, with `dead_letter_conn`, saved as dead letters while the remaining
+    chunks carry on.
+
+    Validated alerts are held as AlertRecord tuples, not Alert models,
+    so an in-flight batch costs a fraction of the memory.
+
+    Returns (persisted alerts, rejected events). Persisted alerts are
+    Alert models; with `as_records=True` they are the AlertRecord tuples
+    themselves, which skips rebuilding a model per alert.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    from pydantic import ValidationError
+
+    from src.domain.models import Alert, AlertRecord
+
+    policy = retry_policy or RetryPolicy(max_retries=max_retries)
+
+    def on_retry(attempt, exc, delay):
+        logger.warning(
+            "retrying_persist attempt=%s max_retries=%s",
+            attempt,
+            policy.max_retries,
+            extra={"attempt": attempt},
+        )
+
+    with timed("ingest.process_batch"):
+        records = []
+        rejected = []
+        with timed("ingest.validate"):
+            for index, event in enumerate(events):
+                try:
+                    # Severity is always ours to assign; an incoming key is overridden.
+                    record = AlertRecord.from_alert(Alert(**{**event, "severity": ""}))
+                except (ValidationError, TypeError):
+                    fields = event if isinstance(event, dict) else {}
+                    logger.exception("validation_failed",
+                                     extra={"site_id": fields.get("site_id"),
+                                            "alert_type": fields.get("alert_type")})
+                    rejected.append(event)
+                    if on_reject is not None:
+                        on_reject(index, event)
+                    continue
+                records.append(record)
+
+        with timed("ingest.classify"):
+            records = [
+                AlertRecord(r.timestamp, r.site_id, r.alert_type, classify_alert(r.alert_type),
+                            r.latitude, r.longitude)
+                for r in records
+            ]
+
+        persisted = []
+        for start in range(0, len(records), batch_size):
+            # Records are already in column order: the chunk is the rows.
+            chunk = records[start:start + batch_size]
+            attempts = [0]
+
+            def persist(attempt, rows=chunk):
+                attempts[0] = attempt + 1
+                with timed("ingest.persist" if attempt == 0 else "ingest.retry"):
+                    insert_alerts(conn, rows)
+
+            try:
+                policy.call(persist, on_retry)
+            except Exception as exc:
+                logger.exception("batch_processing_failed")
+                if dead_letter_conn is None:
+                    raise
+                payloads = [_event_payload(record) for record in chunk]
+                if not _dead_letter(dead_letter_conn, logger, payloads, exc, attempts[0]):
+                    raise
                 continue
+            persisted.extend(chunk)
+
+        logger.info("batch_recorded count=%s rejected=%s", len(persisted), len(rejected))
+        if not as_records:
+            persisted = [record.to_alert() for record in persisted]
+        return persisted, rejected
+
+
+def ingest_events(settings: "Settings", logger: logging.Logger, events,
+                  conn=None, sizes: IngestSizes | None = None, as_records: bool = False
+                  ) -> tuple[list["Alert"] | list["AlertRecord"], list[dict]]:
+    """
+    Run process_alert_batch with batch size, retries and pool size from settings.
+
+    With `conn`, everything runs on that connection. Otherwise each chunk
+    of `batch_size` events runs on one of `pool_size` worker threads with
+    its own tuned connection; SQLite serializes the writes, the busy
+    timeout absorbs the contention.
+
+    `sizes` (see follow_ingest_sizes) overrides batch and pool size, so a
+    long-running worker picks up reloaded values on its next call.
+    `as_records` is passed on to process_alert_batch.
+    """
+    perf = settings.performance
+    batch_size, pool_size = sizes.get() if sizes is not None else (perf.batch_size, perf.pool_size)
+    policy = retry_policy_from_settings(settings)
+    if conn is not None:
+        return process_alert_batch(conn, logger, events, batch_size=batch_size,
+                                   retry_policy=policy, as_records=as_records)
+
+    from src.infrastructure.database import initialize_database
+    from src.observability.context import ContextThreadPoolExecutor
+
+    events = list(events)
+    setup = open_connection(settings)
+    try:
+        initialize_database(setup)
+    finally:
+        setup.close()
+
+    def run_chunk(chunk):
+        chunk_conn = open_connection(settings)
+        try:
+            return process_alert_batch(chunk_conn, logger, chunk, batch_size=batch_size,
+                                       retry_policy=policy, as_records=as_records)
+        finally:
+            chunk_conn.close()
+
+    chunks = [events[i:i + batch_size] for i in range(0, len(events), batch_size)]
+    if pool_size == 1 or len(chunks) <= 1:
+        results = [run_chunk(chunk) for chunk in chunks]
+    else:
+        with ContextThreadPoolExecutor(max_workers=pool_size) as pool:
+            results = list(pool.map(run_chunk, chunks))
+
+    alerts = [alert for persisted, _ in results for alert in persisted]
+    rejected = [event for _, failed in results for event in failed]
+    return alerts, rejected
+
+
+def replay_dead_letters(conn, logger: logging.Logger, batch_size: int = 500,
+                        retry_policy: RetryPolicy | None = None, dead_letter_conn=None,
+                        limit: int | None = None) -> dict:
+    """
+    Re-ingest dead letters through process_alert_batch, oldest first.
+
+    Replayed rows are deleted; rows that fail validation stay with an
+    updated error and attempt count. A chunk that still cannot be
+    persisted raises and leaves its rows in place. Delivery is
+    at-least-once: a crash between insert and delete replays the chunk
+    again next time.
+
+    Returns {"replayed": n, "rejected": m}.
+    """
+    dead_letter_conn = dead_letter_conn if dead_letter_conn is not None else conn
+    summary = {"replayed": 0, "rejected": 0}
+    after_id = 0
+    while limit is None or summary["replayed"] + summary["rejected"] < limit:
+        size = batch_size
+        if limit is not None:
+            size = min(size, limit - summary["replayed"] - summary["rejected"])
+        rows = get_dead_letters(dead_letter_conn, after_id=after_id, limit=size)
+        if not rows:
+            break
+        after_id = rows[-1][0]
+
+        # Rejections are reported by position, which maps back to the row id.
+        rejected_at = set()
+        process_alert_batch(conn, logger, [row[2] for row in rows], batch_size=batch_size,
+                            retry_policy=retry_policy, as_records=True,
+                            on_reject=lambda index, event: rejected_at.add(index))
+        rejected_ids = [row[0] for i, row in enumerate(rows) if i in rejected_at]
+        replayed_ids = [row[0] for i, row in enumerate(rows) if i not in rejected_at]
+
+        delete_dead_letters(dead_letter_conn, replayed_ids)
+        if rejected_ids:
+            update_dead_letters(dead_letter_conn, rejected_ids, "validation_failed")
+        summary["replayed"] += len(replayed_ids)
+        summary["rejected"] += len(rejected_ids)
+        REGISTRY.counter("ingest.dead_letters_replayed").inc(len(replayed_ids))
+
+    logger.info("dead_letters_replayed replayed=%s rejected=%s",
+                summary["replayed"], summary["rejected"])
+    return summary
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+        python -m src.main replay-dead-letters [--batch-size N] [--limit N]
+    """
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog="python -m src.main")
+    commands = parser.add_subparsers(dest="command", required=True)
+    replay = commands.add_parser("replay-dead-letters",
+                                 help="re-ingest dead-lettered alerts in batches")
+    replay.add_argument("--batch-size", type=int, default=None,
+                        help="alerts per bulk insert (default: INGEST_BATCH_SIZE)")
+    replay.add_argument("--limit", type=int, default=None, help="replay at most N rows")
+    args = parser.parse_args(argv)
+
+    from src.infrastructure.database import initialize_database
+
+    settings = load_settings()
+    logger = build_logger_from_settings(settings)
+    start_profiling(settings)
+    conn = open_connection(settings)
+    try:
+        initialize_database(conn)
+        summary = replay_dead_letters(
+            conn,
+            logger,
+            batch_size=args.batch_size or settings.performance.batch_size,
+            retry_policy=retry_policy_from_settings(settings),
+            limit=args.limit,
+        )
+    finally:
+        conn.close()
+    print(json.dumps(summary))
+    return 0
 
-            logger.exception("alert_processing_failed")
-            raise
 
-    raise RuntimeError("unreachable")
+if __name__ == "__main__":
+    sys.exit(main())
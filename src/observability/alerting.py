@@ -0,0 +1,172 @@
+"""Stateful threshold rules for sensor series.
+
+check_threshold/check_thresholds classify single readings. ThresholdRule
+adds what alerting needs on top, per series:
+
+- hysteresis: once raised, a level holds until the value drops
+  `hysteresis` below its threshold (no flapping around the boundary)
+- duration: escalation requires `min_consecutive` breaching readings
+- rate of change: a jump faster than `max_rate_per_second` raises at
+  least `rate_severity`
+
+State is one short list per series. AlertRules maps alert types
+(PRESSURE, TEMPERATURE, ...) to rules and turns escalations into
+process_alert_event keyword arguments.
+"""
+from datetime import datetime, timezone
+
+from src.observability.monitor import (
+    SEVERITY_CRITICAL,
+    SEVERITY_NAMES,
+    SEVERITY_OK,
+    SEVERITY_WARNING,
+)
+
+# Per-series state layout: [level, streak, pending, last_value, last_ts]
+_LEVEL, _STREAK, _PENDING, _LAST_VALUE, _LAST_TS = range(5)
+
+
+class ThresholdRule:
+    """Warning/critical bands with hysteresis, duration and rate conditions."""
+
+    def __init__(
+        self,
+        warning: float,
+        critical: float,
+        hysteresis: float = 0.0,
+        min_consecutive: int = 1,
+        max_rate_per_second: float | None = None,
+        rate_severity: str = "warning",
+    ):
+        if warning > critical:
+            raise ValueError("warning must not exceed critical")
+        if hysteresis < 0:
+            raise ValueError("hysteresis must be non-negative")
+        if min_consecutive < 1:
+            raise ValueError("min_consecutive must be at least 1")
+        if rate_severity not in ("warning", "critical"):
+            raise ValueError("rate_severity must be 'warning' or 'critical'")
+        self.warning = warning
+        self.critical = critical
+        self.hysteresis = hysteresis
+        self.min_consecutive = min_consecutive
+        self.max_rate_per_second = max_rate_per_second
+        self.rate_level = SEVERITY_NAMES.index(rate_severity)
+        self._series: dict = {}
+
+    def _raw_level(self, state: list, value: float, timestamp: float) -> int:
+        level = state[_LEVEL]
+        critical = self.critical - (self.hysteresis if level >= SEVERITY_CRITICAL else 0)
+        warning = self.warning - (self.hysteresis if level >= SEVERITY_WARNING else 0)
+        if value >= critical:
+            raw = SEVERITY_CRITICAL
+        elif value >= warning:
+            raw = SEVERITY_WARNING
+        else:
+            raw = SEVERITY_OK
+
+        last_ts = state[_LAST_TS]
+        if self.max_rate_per_second is not None and last_ts is not None and timestamp > last_ts:
+            rate = abs(value - state[_LAST_VALUE]) / (timestamp - last_ts)
+            if rate > self.max_rate_per_second:
+                raw = max(raw, self.rate_level)
+        return raw
+
+    def evaluate(self, series, value: float, timestamp: float) -> str | None:
+        """Feed one reading (epoch seconds); return the new severity on change.
+
+        Escalations wait for `min_consecutive` breaching readings and land
+        on the lowest level seen during the streak; de-escalation is
+        immediate once the value clears the hysteresis band.
+        """
+        state = self._series.get(series)
+        if state is None:
+            state = self._series[series] = [SEVERITY_OK, 0, SEVERITY_OK, value, None]
+
+        level = state[_LEVEL]
+        raw = self._raw_level(state, value, timestamp)
+        state[_LAST_VALUE] = value
+        state[_LAST_TS] = timestamp
+
+        if raw > level:
+            state[_PENDING] = raw if state[_STREAK] == 0 else min(state[_PENDING], raw)
+            state[_STREAK] += 1
+            if state[_STREAK] < self.min_consecutive:
+                return None
+            new_level = state[_PENDING]
+        else:
+            new_level = raw
+
+        state[_STREAK] = 0
+        if new_level == level:
+            return None
+        state[_LEVEL] = new_level
+        return SEVERITY_NAMES[new_level]
+
+    def severity(self, series) -> str:
+        state = self._series.get(series)
+        return SEVERITY_NAMES[state[_LEVEL] if state else SEVERITY_OK]
+
+    def forget(self, series) -> None:
+        self._series.pop(series, None)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+
+def _iso_timestamp(epoch_seconds: float) -> str:
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class AlertRules:
+    """Threshold rules per alert type, emitting alert events on escalation.
+
+        rules = AlertRules({"PRESSURE": ThresholdRule(70, 90, hysteresis=2)})
+        for event in rules.evaluate_readings(readings):
+            process_alert_event(conn, logger, **event)
+    """
+
+    def __init__(self, rules: dict[str, ThresholdRule]):
+        self.rules = rules
+
+    def evaluate(
+        self,
+        site_id: str,
+        alert_type: str,
+        value: float,
+        timestamp: float,
+        latitude: float,
+        longitude: float,
+    ) -> dict | None:
+        """Return process_alert_event kwargs when the series escalates."""
+        rule = self.rules.get(alert_type)
+        if rule is None:
+            return None
+        previous = SEVERITY_NAMES.index(rule.severity(site_id))
+        changed = rule.evaluate(site_id, value, timestamp)
+        if changed is None or SEVERITY_NAMES.index(changed) <= previous:
+            return None
+        return {
+            "timestamp": _iso_timestamp(timestamp),
+            "site_id": site_id,
+            "alert_type": alert_type,
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+
+    def evaluate_readings(self, readings) -> list[dict]:
+        """Evaluate reading dicts with site_id, alert_type, value, timestamp,
+        latitude and longitude keys; return the resulting alert events."""
+        events = []
+        for reading in readings:
+            event = self.evaluate(
+                reading["site_id"],
+                reading["alert_type"],
+                reading["value"],
+                reading["timestamp"],
+                reading["latitude"],
+                reading["longitude"],
+            )
+            if event is not None:
+                events.append(event)
+        return events
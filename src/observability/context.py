@@ -0,0 +1,107 @@
+"""Correlation ID context.
+
+The correlation ID lives in a context variable, so it follows the logical
+request rather than the thread:
+
+- correlation_scope() creates an ID at the entry point, or adopts one
+  from an incoming X-Correlation-Id header
+- asyncio tasks (and asyncio.to_thread) copy the context automatically
+- ContextThreadPoolExecutor carries it into thread-pool work
+- CorrelationIdFilter/CorrelationFormatter add it to log lines
+
+IDs are a random per-process prefix plus a counter: unique across
+processes without calling uuid4 (and the OS RNG) per event.
+"""
+import contextlib
+import itertools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+
+CORRELATION_HEADER = "X-Correlation-Id"
+
+_correlation_id: ContextVar = ContextVar("correlation_id", default=None)
+_prefix = ""
+_counter = itertools.count()
+
+
+def _reseed() -> None:
+    global _prefix, _counter
+    _prefix = os.urandom(8).hex()
+    _counter = itertools.count()
+
+
+_reseed()
+if hasattr(os, "register_at_fork"):
+    # A forked worker must not replay its parent's ID sequence.
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def new_correlation_id() -> str:
+    """Return a new process-unique correlation ID."""
+    return f"{_prefix}-{next(_counter):016x}"
+
+
+def get_correlation_id() -> str | None:
+    """Return the active correlation ID, if any."""
+    return _correlation_id.get()
+
+
+def correlation_id_from_headers(headers: dict) -> str | None:
+    """Read X-Correlation-Id from request headers (case-insensitive).
+
+    Blank values are treated as absent.
+    """
+    wanted = CORRELATION_HEADER.lower()
+    for key, value in headers.items():
+        if key.lower() == wanted and value and value.strip():
+            return value.strip()
+    return None
+
+
+@contextlib.contextmanager
+def correlation_scope(correlation_id: str | None = None):
+    """Run a block under a correlation ID.
+
+    Adopt `correlation_id` when given (e.g. from an incoming header),
+    otherwise create a new one. Yields the active ID.
+    """
+    if correlation_id is None:
+        correlation_id = new_correlation_id()
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        _correlation_id.reset(token)
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that runs each task in the submitter's context."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(copy_context().run, fn, *args, **kwargs)
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Attach the active correlation ID to each record as `correlation_id`.
+
+    A record that already carries one (set on the producing thread before
+    a queue hand-off, or passed via `extra`) keeps it.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = _correlation_id.get()
+        return True
+
+
+class CorrelationFormatter(logging.Formatter):
+    """Append ` correlation_id=<id>` to the line when one is active."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id is None:
+            return line
+        return f"{line} correlation_id={correlation_id}"
@@ -0,0 +1,280 @@
+"""Batched, asynchronous export of registry snapshots.
+
+- Serializers: StatsD (DogStatsD tags), Prometheus text exposition, NDJSON
+- Sinks: UDP, HTTP POST, local file, and an in-memory sink for tests
+- MetricsExporter snapshots on a background thread, buffers serialized
+  lines in a bounded queue and ships them in batches; when the sink falls
+  behind, lines are dropped by policy and counted instead of growing memory
+"""
+import json
+import logging
+import re
+import socket
+import threading
+import urllib.request
+from collections import deque
+
+from src.observability.metrics import MetricsRegistry
+
+logger = logging.getLogger("oil_well_monitoring.exporter")
+
+DROP_OLDEST = "oldest"
+DROP_NEWEST = "newest"
+
+_PROM_NAME = re.compile(r"[^a-zA-Z0-9_:]")
+_HISTOGRAM_SUFFIXES = (".bucket", ".count", ".sum")
+
+
+def to_statsd_lines(samples: list[dict]) -> list[str]:
+    """Serialize samples as StatsD gauge lines: `name:value|g|#k:v`.
+
+    Registry values are cumulative, so they are sent as gauges.
+    """
+    lines = []
+    for sample in samples:
+        line = f"{sample['name']}:{sample['value']}|g"
+        if sample["tags"]:
+            line += "|#" + ",".join(f"{k}:{v}" for k, v in sorted(sample["tags"].items()))
+        lines.append(line)
+    return lines
+
+
+def _prom_name(name: str) -> str:
+    return _PROM_NAME.sub("_", name)
+
+
+def _prom_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_prometheus_lines(samples: list[dict], kinds: dict[str, str] | None = None) -> list[str]:
+    """Serialize samples in Prometheus text exposition format.
+
+    `kinds` maps registry metric names to counter/gauge/histogram (see
+    MetricsRegistry.kinds) and drives the `# TYPE` lines; histogram
+    samples named `<name>.bucket/.count/.sum` map onto `<name>_bucket` etc.
+    """
+    kinds = kinds or {}
+    keyed = []
+    for sample in samples:
+        name = sample["name"]
+        family = name
+        if name.endswith(_HISTOGRAM_SUFFIXES):
+            base = name.rsplit(".", 1)[0]
+            if kinds.get(base) == "histogram":
+                family = base
+        keyed.append((_prom_name(family), family, sample))
+    # Prometheus wants each family's samples contiguous under one # TYPE
+    # line; the sort is stable, so order within a family is preserved.
+    keyed.sort(key=lambda item: item[0])
+
+    lines = []
+    previous = None
+    for prom_family, family, sample in keyed:
+        if prom_family != previous:
+            previous = prom_family
+            lines.append(f"# TYPE {prom_family} {kinds.get(family, 'untyped')}")
+
+        labels = ""
+        if sample["tags"]:
+            labels = "{" + ",".join(
+                f'{_prom_name(k)}="{_prom_label_value(v)}"'
+                for k, v in sorted(sample["tags"].items())
+            ) + "}"
+        lines.append(f"{_prom_name(sample['name'])}{labels} {sample['value']} {sample['timestamp'] * 1000}")
+    return lines
+
+
+def to_ndjson_lines(samples: list[dict]) -> list[str]:
+    """Serialize samples as one compact JSON object per line."""
+    return [json.dumps(sample, separators=(",", ":"), sort_keys=True) for sample in samples]
+
+
+class MemorySink:
+    """Keeps every batch in memory. Stand-in for a real sink in tests."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[str]] = []
+        self.fail = fail
+
+    def send(self, lines: list[str]) -> None:
+        if self.fail:
+            raise OSError("sink unavailable")
+        self.batches.append(list(lines))
+
+    @property
+    def lines(self) -> list[str]:
+        return [line for batch in self.batches for line in batch]
+
+
+class FileSink:
+    """Appends batches to a local file, one line per record."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, lines: list[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+
+
+class UdpSink:
+    """Sends newline-joined lines as UDP datagrams (StatsD style)."""
+
+    def __init__(self, host: str, port: int, max_datagram_bytes: int = 1432):
+        self.address = (host, port)
+        self.max_datagram_bytes = max_datagram_bytes
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def send(self, lines: list[str]) -> None:
+        packet = b""
+        for line in lines:
+            encoded = line.encode("utf-8")
+            if packet and len(packet) + 1 + len(encoded) > self.max_datagram_bytes:
+                self._sock.sendto(packet, self.address)
+                packet = b""
+            packet = packet + b"\n" + encoded if packet else encoded
+        if packet:
+            self._sock.sendto(packet, self.address)
+
+    def close(self) -> None:
+        self._sock.close()
+
+
+class HttpSink:
+    """POSTs each batch as a newline-joined body."""
+
+    def __init__(self, url: str, content_type: str = "application/x-ndjson", timeout: float = 5.0):
+        self.url = url
+        self.content_type = content_type
+        self.timeout = timeout
+
+    def send(self, lines: list[str]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=("\n".join(lines) + "\n").encode("utf-8"),
+            headers={"Content-Type": self.content_type},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class MetricsExporter:
+    """Periodically snapshot a registry and ship it to a sink in batches.
+
+    collect() and flush() can also be called directly (tests, shutdown).
+    """
+
+    FORMATS = ("statsd", "prometheus", "ndjson")
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        sink,
+        fmt: str = "ndjson",
+        interval_seconds: float = 10.0,
+        max_buffered_lines: int = 10_000,
+        batch_size: int = 500,
+        drop_policy: str = DROP_OLDEST,
+    ):
+        if fmt not in self.FORMATS:
+            raise ValueError("fmt must be one of: " + ", ".join(self.FORMATS))
+        if drop_policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError("drop_policy must be 'oldest' or 'newest'")
+        self.registry = registry
+        self.sink = sink
+        self.fmt = fmt
+        self.interval_seconds = interval_seconds
+        self.max_buffered_lines = max_buffered_lines
+        self.batch_size = batch_size
+        self.drop_policy = drop_policy
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+        self.sent = 0
+        self.send_failures = 0
+        self.export_failures = 0
+
+    def serialize(self, samples: list[dict]) -> list[str]:
+        if self.fmt == "statsd":
+            return to_statsd_lines(samples)
+        if self.fmt == "prometheus":
+            return to_prometheus_lines(samples, self.registry.kinds())
+        return to_ndjson_lines(samples)
+
+    def _enqueue(self, lines: list[str]) -> None:
+        with self._lock:
+            for line in lines:
+                if len(self._buffer) >= self.max_buffered_lines:
+                    self.dropped += 1
+                    if self.drop_policy == DROP_NEWEST:
+                        continue
+                    self._buffer.popleft()
+                self._buffer.append(line)
+
+    def collect(self, now: int | None = None) -> int:
+        """Snapshot the registry into the buffer. Return lines serialized."""
+        lines = self.serialize(self.registry.snapshot(now=now))
+        self._enqueue(lines)
+        return len(lines)
+
+    def flush(self) -> int:
+        """Ship buffered lines in batches. Return lines sent.
+
+        On a sink error the failed batch is put back (subject to the
+        buffer bound) and flushing stops until the next round.
+        """
+        sent = 0
+        while True:
+            with self._lock:
+                if not self._buffer:
+                    break
+                count = min(self.batch_size, len(self._buffer))
+                batch = [self._buffer.popleft() for _ in range(count)]
+            try:
+                self.sink.send(batch)
+            except Exception:
+                self.send_failures += 1
+                with self._lock:
+                    room = self.max_buffered_lines - len(self._buffer)
+                    keep = batch[:room] if room > 0 else []
+                    self.dropped += len(batch) - len(keep)
+                    self._buffer.extendleft(reversed(keep))
+                break
+            sent += len(batch)
+        self.sent += sent
+        return sent
+
+    def buffered(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.collect()
+                self.flush()
+            except Exception:
+                # Keep exporting: a failed round is retried on the next tick.
+                self.export_failures += 1
+                logger.exception("metrics_export_failed")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self, final_flush: bool = True) -> None:
+        """Stop the background thread, optionally shipping one last snapshot."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if final_flush:
+            self.collect()
+            self.flush()
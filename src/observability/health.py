@@ -0,0 +1,174 @@
+"""Concurrent health checks with deadlines and cached results.
+
+build_health_response takes precomputed booleans. HealthCheckRunner
+produces them:
+
+- Registered checks run concurrently on a worker pool, each under its own
+  deadline measured from the start of the run
+- Each result is cached for a TTL, so frequent probes reuse it instead of
+  hitting the dependency again
+- A check still running from an earlier timed-out run is not started
+  again; it reports as failed until it finishes
+- Checks are waited on outside the runner's lock, so a probe that arrives
+  while another probe's check is in flight gets the last cached result
+  instead of blocking on it
+- The response adds per-check latency to the build_health_response shape
+"""
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.observability.monitor import build_health_response
+
+
+class CheckResult:
+    __slots__ = ("healthy", "latency_ms", "checked_at", "error")
+
+    def __init__(self, healthy: bool, latency_ms: float, checked_at: float, error: str | None = None):
+        self.healthy = healthy
+        self.latency_ms = latency_ms
+        self.checked_at = checked_at
+        self.error = error
+
+
+class _Check:
+    __slots__ = ("fn", "timeout_seconds", "ttl_seconds", "result", "future", "started")
+
+    def __init__(self, fn, timeout_seconds: float, ttl_seconds: float):
+        self.fn = fn
+        self.timeout_seconds = timeout_seconds
+        self.ttl_seconds = ttl_seconds
+        self.result: CheckResult | None = None
+        self.future = None
+        self.started = 0.0
+
+
+def _timed_call(fn) -> tuple[bool, float]:
+    start = time.perf_counter_ns()
+    healthy = bool(fn())
+    return healthy, (time.perf_counter_ns() - start) / 1_000_000
+
+
+class HealthCheckRunner:
+    """Run registered checks concurrently and cache their results.
+
+        runner = HealthCheckRunner(ttl_seconds=5)
+        runner.register("db", sqlite_check("alerts.db"))
+        runner.register("disk", disk_space_check(".", 512 * 1024 * 1024))
+        runner.run()
+        # {"status": "healthy", "checks": {"db": True, "disk": True},
+        #  "latency_ms": {"db": 0.4, "disk": 0.02}}
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0, timeout_seconds: float = 1.0, max_workers: int = 8):
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+        self._checks: dict[str, _Check] = {}
+        # Created on first use and again after close(), so a stopped
+        # MonitoringServer can be started again.
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        check,
+        timeout_seconds: float | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Register a zero-argument callable returning True when healthy."""
+        self._checks[name] = _Check(
+            check,
+            timeout_seconds if timeout_seconds is not None else self.timeout_seconds,
+            ttl_seconds if ttl_seconds is not None else self.ttl_seconds,
+        )
+
+    def results(self) -> dict[str, CheckResult]:
+        """Run due checks and return the current result per check."""
+        started = time.monotonic()
+        current: dict[str, CheckResult] = {}
+        due: dict[str, _Check] = {}
+        with self._lock:
+            for name, check in self._checks.items():
+                if check.result is not None and started - check.result.checked_at < check.ttl_seconds:
+                    current[name] = check.result
+                    continue
+                if check.future is not None and not check.future.done():
+                    # Owned by another probe, or hung from an earlier run.
+                    if check.result is not None and started < check.started + check.timeout_seconds:
+                        current[name] = check.result
+                    else:
+                        current[name] = CheckResult(False, 0.0, started, "previous run still in progress")
+                    continue
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="health-check"
+                    )
+                check.future = self._pool.submit(_timed_call, check.fn)
+                check.started = started
+                due[name] = check
+
+        for name, check in due.items():
+            remaining = max(0.0, started + check.timeout_seconds - time.monotonic())
+            try:
+                healthy, latency_ms = check.future.result(timeout=remaining)
+                current[name] = CheckResult(healthy, latency_ms, started)
+            except TimeoutError:
+                elapsed_ms = (time.monotonic() - started) * 1000
+                current[name] = CheckResult(False, elapsed_ms, started, "timed out")
+            except Exception as exc:
+                elapsed_ms = (time.monotonic() - started) * 1000
+                current[name] = CheckResult(False, elapsed_ms, started, repr(exc))
+
+        with self._lock:
+            for name, check in due.items():
+                check.result = current[name]
+        return {name: current[name] for name in self._checks if name in current}
+
+    def run(self) -> dict:
+        """Return build_health_response output plus per-check latency_ms."""
+        results = self.results()
+        response = build_health_response({name: r.healthy for name, r in results.items()})
+        response["latency_ms"] = {name: r.latency_ms for name, r in results.items()}
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def sqlite_check(db_path: str, timeout_seconds: float = 1.0):
+    """Check that an existing database opens and answers SELECT 1."""
+
+    def check() -> bool:
+        conn = sqlite3.connect(f"file:{db_path}?mode=rw", uri=True, timeout=timeout_seconds)
+        try:
+            return conn.execute("SELECT 1").fetchone() == (1,)
+        finally:
+            conn.close()
+
+    return check
+
+
+def disk_space_check(path: str, min_free_bytes: int):
+    """Check that the filesystem holding `path` has enough free space."""
+
+    def check() -> bool:
+        return shutil.disk_usage(os.path.abspath(path)).free >= min_free_bytes
+
+    return check
+
+
+def queue_depth_check(get_depth, max_depth: int):
+    """Check that a queue's depth (from a callable) is below `max_depth`."""
+
+    def check() -> bool:
+        return get_depth() < max_depth
+
+    return check
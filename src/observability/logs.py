@@ -0,0 +1,126 @@
+"""Logging handlers and formatters for the ingest path.
+
+BoundedQueueHandler moves log I/O off the calling thread: records go into
+a bounded queue and a QueueListener thread writes them. When the queue
+is full, records are either dropped (and counted) or the caller blocks,
+depending on the policy.
+
+JsonFormatter emits one JSON object per record, with structured fields
+taken from `extra=`.
+"""
+import json
+import logging
+import logging.handlers
+import queue
+import time
+
+from src.observability.metrics import REGISTRY
+
+DROP = "drop"
+BLOCK = "block"
+
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full at shutdown; wait for room instead of raising.
+        self.queue.put(self._sentinel)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler over a bounded queue with a drop-or-block policy.
+
+    `dropped` counts records lost to a full queue; the same count is
+    exported as the `logging.dropped_records` registry counter.
+    """
+
+    def __init__(self, maxsize: int, policy: str = DROP):
+        # queue.Queue treats maxsize <= 0 as unbounded.
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in (DROP, BLOCK):
+            raise ValueError("policy must be 'drop' or 'block'")
+        super().__init__(queue.Queue(maxsize))
+        self.policy = policy
+        self.dropped = 0
+        self.listener: logging.handlers.QueueListener | None = None
+        self._dropped_counter = REGISTRY.counter("logging.dropped_records")
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue is in-process, so skip QueueHandler's full format and
+        # copy: merge args now (they may be mutated later) and leave the
+        # traceback and line formatting to the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._dropped_counter.inc()
+
+    def start(self, *targets: logging.Handler) -> None:
+        """Start a listener thread that forwards records to `targets`."""
+        self.listener = _Listener(self.queue, *targets, respect_handler_level=True)
+        self.listener.start()
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close the targets."""
+        if self.listener is not None:
+            self.listener.stop()
+            for target in self.listener.handlers:
+                target.close()
+            self.listener = None
+        super().close()
+
+
+DEFAULT_JSON_FIELDS = ("correlation_id", "site_id", "alert_type", "severity", "attempt")
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as compact single-line JSON.
+
+    Output keys: ts, level, message, then each of `fields` present on the
+    record (via `extra=` or a filter), then exc for exceptions. The field
+    list is fixed at construction and the timestamp string is reused for
+    records within the same second.
+    """
+
+    def __init__(self, fields=DEFAULT_JSON_FIELDS, datefmt: str = "%Y-%m-%dT%H:%M:%S"):
+        super().__init__(datefmt=datefmt)
+        self.fields = tuple(fields)
+        self._encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        # (second, formatted) swapped as one object so threads never pair
+        # a new second with a stale string.
+        self._cached = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, cached_ts = self._cached
+        if second != cached_second:
+            cached_ts = time.strftime(self.datefmt, self.converter(second))
+            self._cached = (second, cached_ts)
+        return cached_ts
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": self._timestamp(record.created),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        attrs = record.__dict__
+        for field in self.fields:
+            value = attrs.get(field)
+            if value is not None:
+                data[field] = value
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            data["exc"] = record.exc_text
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return self._encode(data)
@@ -0,0 +1,185 @@
+"""In-process metrics aggregation.
+
+record_metric builds one dict per sample. MetricsRegistry aggregates
+samples in place instead and only produces record_metric dicts when a
+snapshot is exported.
+
+- Counters, gauges and fixed-bucket histograms
+- Keyed by (name, frozen tags)
+- Handles are resolved once; the hot path is a single attribute update
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from src.observability.monitor import _metric_dict
+
+DEFAULT_BUCKETS_MS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+
+def _freeze_tags(tags: dict | None) -> frozenset:
+    return frozenset((tags or {}).items())
+
+
+class Counter:
+    """Monotonic counter.
+
+    Updates are unlocked: under heavy thread contention an increment can
+    occasionally be lost, which is acceptable for operational metrics.
+    """
+
+    __slots__ = ("name", "tags", "unit", "value")
+    kind = "counter"
+
+    def __init__(self, name: str, tags: dict, unit: str = "count"):
+        self.name = name
+        self.tags = tags
+        self.unit = unit
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def samples(self, now: int | None) -> list[dict]:
+        return [_metric_dict(self.name, self.value, self.unit, dict(self.tags), now)]
+
+
+class Gauge:
+    """Last-value gauge."""
+
+    __slots__ = ("name", "tags", "unit", "value")
+    kind = "gauge"
+
+    def __init__(self, name: str, tags: dict, unit: str = "count"):
+        self.name = name
+        self.tags = tags
+        self.unit = unit
+        self.value = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def samples(self, now: int | None) -> list[dict]:
+        return [_metric_dict(self.name, self.value, self.unit, dict(self.tags), now)]
+
+
+class Histogram:
+    """Fixed-bucket histogram.
+
+    Bucket `i` counts observations `<= bounds[i]`; the last bucket counts
+    everything above the largest bound.
+    """
+
+    __slots__ = ("name", "tags", "unit", "bounds", "counts", "sum", "count")
+    kind = "histogram"
+
+    def __init__(self, name: str, tags: dict, unit: str = "ms", buckets=DEFAULT_BUCKETS_MS):
+        bounds = tuple(sorted(buckets))
+        if not bounds:
+            raise ValueError("histogram needs at least one bucket bound")
+        self.name = name
+        self.tags = tags
+        self.unit = unit
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, now: int | None) -> list[dict]:
+        """Export as count, sum and cumulative `le`-tagged bucket samples."""
+        tags = dict(self.tags)
+        samples = [
+            _metric_dict(f"{self.name}.count", self.count, "count", dict(tags), now),
+            _metric_dict(f"{self.name}.sum", self.sum, self.unit, dict(tags), now),
+        ]
+        cumulative = 0
+        labels = [repr(bound) for bound in self.bounds] + ["+Inf"]
+        for label, bucket_count in zip(labels, self.counts):
+            cumulative += bucket_count
+            samples.append(
+                _metric_dict(
+                    f"{self.name}.bucket", cumulative, "count", {**tags, "le": label}, now
+                )
+            )
+        return samples
+
+
+class MetricsRegistry:
+    """Get-or-create registry of metric handles.
+
+    Resolve handles once, outside the hot path:
+
+        alerts_recorded = registry.counter("alerts.recorded", {"site": "A"})
+        ...
+        alerts_recorded.inc()
+
+    Only handle creation takes the lock.
+    """
+
+    def __init__(self):
+        self._metrics: dict[tuple, Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, tags: dict | None, **kwargs):
+        key = (name, _freeze_tags(tags))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls(name, dict(tags or {}), **kwargs)
+                    self._metrics[key] = metric
+        if not isinstance(metric, cls):
+            raise ValueError(f"metric {name!r} already registered as {type(metric).__name__}")
+        return metric
+
+    def counter(self, name: str, tags: dict | None = None, unit: str = "count") -> Counter:
+        return self._get_or_create(Counter, name, tags, unit=unit)
+
+    def gauge(self, name: str, tags: dict | None = None, unit: str = "count") -> Gauge:
+        return self._get_or_create(Gauge, name, tags, unit=unit)
+
+    def histogram(
+        self,
+        name: str,
+        tags: dict | None = None,
+        unit: str = "ms",
+        buckets=DEFAULT_BUCKETS_MS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, tags, unit=unit, buckets=buckets)
+
+    def metrics(self) -> list:
+        """Return the registered handles."""
+        with self._lock:
+            return list(self._metrics.values())
+
+    def kinds(self) -> dict[str, str]:
+        """Return {metric name: "counter" | "gauge" | "histogram"}."""
+        return {metric.name: metric.kind for metric in self.metrics()}
+
+    def snapshot(self, now: int | None = None) -> list[dict]:
+        """Export every metric as record_metric-shaped dicts."""
+        if now is None:
+            now = int(time.time())
+        samples = []
+        for metric in self.metrics():
+            samples.extend(metric.samples(now))
+        return samples
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+REGISTRY = MetricsRegistry()
@@ -8,7 +8,13 @@ Week 7 focus:
 - Threshold-based severity classification
 """
 import time
-import uuid
+
+from src.observability.context import get_correlation_id
+
+SEVERITY_OK = 0
+SEVERITY_WARNING = 1
+SEVERITY_CRITICAL = 2
+SEVERITY_NAMES = ("ok", "warning", "critical")
 
 
 def record_metric(
@@ -24,6 +30,22 @@ def record_metric(
     - Return a dict with keys: name, value, unit, tags, timestamp
     - tags should default to {} (not None) in the returned dict
     - timestamp is an epoch int; use now if provided, else time.time()
+    - inside a correlation scope, tags gain a correlation_id entry
+    """
+    return _metric_dict(name, value, unit, _with_correlation_id(tags), now)
+
+
+def _with_correlation_id(tags: dict | None) -> dict | None:
+    correlation_id = get_correlation_id()
+    if correlation_id is None:
+        return tags
+    return {"correlation_id": correlation_id, **(tags or {})}
+
+
+def _metric_dict(name: str, value: float, unit: str, tags: dict | None, now: int | None) -> dict:
+    """Build the record_metric shape without per-request tags.
+
+    Used for aggregated metrics, where a correlation ID tag would be wrong.
     """
     return {
         "name": name,
@@ -67,3 +89,23 @@ def check_threshold(value: float, warning: float, critical: float) -> str:
     if value >= warning:
         return "warning"
     return "ok"
+
+
+def check_thresholds(values, warning: float, critical: float):
+    """Classify many values at once; same bands as check_threshold.
+
+    Return severity codes (0 ok, 1 warning, 2 critical; see SEVERITY_NAMES):
+    - a NumPy int8 array for NumPy input (vectorized, NumPy imported lazily)
+    - a list of ints for any other iterable
+    """
+    if type(values).__module__ == "numpy":
+        import numpy as np
+
+        values = np.asarray(values)
+        codes = np.where(values >= critical, SEVERITY_CRITICAL, values >= warning)
+        return codes.astype(np.int8)
+
+    return [
+        SEVERITY_CRITICAL if value >= critical else SEVERITY_WARNING if value >= warning else SEVERITY_OK
+        for value in values
+    ]
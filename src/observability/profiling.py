@@ -0,0 +1,197 @@
+"""Opt-in profiling for live workers.
+
+- Stage totals: every timed() span feeds always-on (calls, total time)
+  totals per stage; publish_stage_totals copies them into the registry
+  as gauges so /metrics and the exporter pick them up
+- StackSampler: a background thread samples the stacks of all other
+  threads every few milliseconds and aggregates them as collapsed stacks
+  (`frame;frame;frame count`, the flamegraph.pl / speedscope input).
+  Cost is proportional to the sampling rate, not to the work profiled
+- profile_for: sample for N seconds in the background and write the
+  collapsed stacks plus a stage totals snapshot; one session at a time
+- install_signal_handler: start profile_for on a signal (SIGUSR1 by
+  default), e.g. `kill -USR1 <pid>` on a worker that has slowed down
+- cprofile_section: deterministic cProfile of the current thread,
+  written as a pstats file (cProfile only sees the thread it runs on)
+"""
+import cProfile
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from src.observability.metrics import REGISTRY, MetricsRegistry
+from src.observability.tracing import stage_totals
+
+logger = logging.getLogger("oil_well_monitoring.profiling")
+
+_session_lock = threading.Lock()
+
+
+def stage_summary() -> dict[str, dict]:
+    """Return {stage: {"calls", "total_ms", "mean_us"}} from the stage totals."""
+    summary = {}
+    for name, (calls, total_ns) in sorted(stage_totals().items()):
+        summary[name] = {
+            "calls": calls,
+            "total_ms": total_ns / 1_000_000,
+            "mean_us": total_ns / calls / 1000 if calls else 0.0,
+        }
+    return summary
+
+
+def publish_stage_totals(registry: MetricsRegistry | None = None) -> None:
+    """Set `stage.calls` and `stage.total_ms` gauges (tag `stage`) in the registry."""
+    registry = registry if registry is not None else REGISTRY
+    for name, (calls, total_ns) in stage_totals().items():
+        tags = {"stage": name}
+        registry.gauge("stage.calls", tags).set(calls)
+        registry.gauge("stage.total_ms", tags, unit="ms").set(total_ns / 1_000_000)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """Sample the stacks of every other thread at a fixed interval.
+
+        sampler = StackSampler(interval_seconds=0.005)
+        sampler.start()
+        ...
+        sampler.stop()
+        sampler.write_collapsed("profile.collapsed")
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, max_depth: int = 64):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sample(self) -> None:
+        """Take one sample of every thread except the sampler itself."""
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.sample()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def collapsed_lines(self) -> list[str]:
+        """Return `root;...;leaf count` lines, most frequent first."""
+        return [f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()]
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(self.collapsed_lines()) + "\n")
+
+
+def profile_for(seconds: float, output_dir: str = ".", interval_seconds: float = 0.005,
+                on_done=None) -> threading.Thread | None:
+    """Sample all threads for `seconds` in the background.
+
+    Writes `profile-<timestamp>.collapsed` and `profile-<timestamp>.stages.json`
+    to `output_dir`, then calls `on_done(collapsed_path)` if given.
+    Returns the session thread, or None when a session is already running.
+    A session that cannot write its output logs the error and ends.
+    """
+    if not _session_lock.acquire(blocking=False):
+        return None
+
+    def run() -> None:
+        try:
+            sampler = StackSampler(interval_seconds)
+            sampler.start()
+            time.sleep(seconds)
+            sampler.stop()
+
+            base = os.path.join(output_dir, time.strftime("profile-%Y%m%dT%H%M%S"))
+            os.makedirs(output_dir, exist_ok=True)
+            sampler.write_collapsed(base + ".collapsed")
+            with open(base + ".stages.json", "w", encoding="utf-8") as fh:
+                json.dump(stage_summary(), fh, indent=2, sort_keys=True)
+                fh.write("\n")
+        except Exception:
+            logger.exception("profile_session_failed output_dir=%s", output_dir)
+            return
+        finally:
+            _session_lock.release()
+        if on_done is not None:
+            on_done(base + ".collapsed")
+
+    thread = threading.Thread(target=run, name="profile-session", daemon=True)
+    thread.start()
+    return thread
+
+
+def install_signal_handler(seconds: float = 30.0, output_dir: str = ".",
+                           interval_seconds: float = 0.005, signum: int | None = None) -> bool:
+    """Start profile_for whenever the process receives `signum`.
+
+    Defaults to SIGUSR1. Returns False where signals are unavailable
+    (Windows) or when not called from the main thread.
+    """
+    import signal
+
+    if signum is None:
+        signum = getattr(signal, "SIGUSR1", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def handler(signum, frame) -> None:
+        profile_for(seconds, output_dir, interval_seconds)
+
+    signal.signal(signum, handler)
+    return True
+
+
+class cprofile_section:
+    """Deterministically profile the current thread and dump pstats.
+
+        with cprofile_section("ingest.pstats"):
+            run_batch()
+
+    Read the output with `python -m pstats ingest.pstats`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self) -> cProfile.Profile:
+        self.profiler.enable()
+        return self.profiler
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.profiler.disable()
+        self.profiler.dump_stats(self.path)
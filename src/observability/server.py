@@ -0,0 +1,120 @@
+"""Background HTTP endpoint for orchestrator probes and scrapers.
+
+- GET /health: registered checks aggregated with build_health_response;
+  200 when healthy, 503 when degraded
+- GET /metrics: registry snapshot in Prometheus text exposition format
+
+The server runs on its own daemon thread (stdlib ThreadingHTTPServer), so
+it never shares a thread with ingest. Checks go through a
+HealthCheckRunner: cached for a TTL and bounded by per-check timeouts, so
+a hung dependency marks its check failed instead of blocking the probe.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.observability.exporter import to_prometheus_lines
+from src.observability.health import HealthCheckRunner
+from src.observability.metrics import REGISTRY, MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        monitoring = self.server.monitoring
+        if path == "/health":
+            response = monitoring.health()
+            status = 200 if response["status"] == "healthy" else 503
+            self._send(status, "application/json", json.dumps(response))
+        elif path == "/metrics":
+            self._send(200, PROMETHEUS_CONTENT_TYPE, monitoring.metrics_text())
+        else:
+            self._send(404, "text/plain", "not found\n")
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args) -> None:
+        # Probes arrive every few seconds; keep them out of the app log.
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    monitoring: "MonitoringServer"
+
+
+class MonitoringServer:
+    """Serve /health and /metrics from a background thread.
+
+        server = MonitoringServer(port=9100)
+        server.add_check("db", lambda: conn.execute("SELECT 1") is not None)
+        server.start()
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        health_ttl_seconds: float = 5.0,
+        check_timeout_seconds: float = 1.0,
+        health_runner: HealthCheckRunner | None = None,
+    ):
+        self.registry = registry if registry is not None else REGISTRY
+        self.host = host
+        self.port = port
+        if health_runner is None:
+            health_runner = HealthCheckRunner(
+                ttl_seconds=health_ttl_seconds, timeout_seconds=check_timeout_seconds
+            )
+        self.health_runner = health_runner
+        self._httpd: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    def add_check(self, name: str, check, timeout_seconds: float | None = None) -> None:
+        """Register a zero-argument callable returning True when healthy."""
+        self.health_runner.register(name, check, timeout_seconds=timeout_seconds)
+
+    def health(self) -> dict:
+        """Return the health response, re-running only checks past their TTL."""
+        return self.health_runner.run()
+
+    def metrics_text(self) -> str:
+        samples = self.registry.snapshot()
+        return "\n".join(to_prometheus_lines(samples, self.registry.kinds())) + "\n"
+
+    @property
+    def address(self) -> tuple[str, int]:
+        if self._httpd is None:
+            return self.host, self.port
+        return self._httpd.server_address[:2]
+
+    def start(self) -> tuple[str, int]:
+        """Start serving on a daemon thread. Return the bound (host, port)."""
+        if self._httpd is None:
+            self._httpd = _Server((self.host, self.port), _Handler)
+            self._httpd.monitoring = self
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="monitoring-http", daemon=True
+            )
+            self._thread.start()
+        return self.address
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+        self.health_runner.close()
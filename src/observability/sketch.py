@@ -0,0 +1,128 @@
+"""Streaming quantile sketch (DDSketch).
+
+Estimates percentiles such as p50/p95/p99 without keeping every sample.
+
+- Relative-error guarantee: estimates are within `relative_accuracy` of
+  the true value at that rank
+- Bounded memory: at most `max_bins` bins; when full, the lowest bins are
+  collapsed so high percentiles stay accurate
+- Mergeable: per-worker sketches with the same accuracy can be combined,
+  and to_dict/from_dict move state across processes as plain JSON
+"""
+import math
+
+
+class DDSketch:
+    """Quantile sketch over non-negative values (latencies, sizes)."""
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("max_bins must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record `value` (`count` times)."""
+        if value < 0:
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value == 0:
+            self.zero_count += count
+        else:
+            index = self._index(value)
+            self._bins[index] = self._bins.get(index, 0) + count
+            if len(self._bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins together until within max_bins."""
+        keys = sorted(self._bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        folded = sum(self._bins.pop(key) for key in keys[:excess])
+        self._bins[target] += folded
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the value at quantile `q` (0 <= q <= 1).
+
+        Return None for an empty sketch.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if seen > rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def percentiles(self, qs=(0.5, 0.95, 0.99)) -> dict[str, float | None]:
+        """Return {"p50": ..., "p95": ..., "p99": ...} style estimates."""
+        return {f"p{q * 100:g}": self.quantile(q) for q in qs}
+
+    def merge(self, other: "DDSketch") -> None:
+        """Fold another sketch into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative_accuracy")
+        for index, bin_count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + bin_count
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "bins": {str(index): bin_count for index, bin_count in self._bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DDSketch":
+        sketch = cls(data["relative_accuracy"], data["max_bins"])
+        sketch._bins = {int(index): bin_count for index, bin_count in data["bins"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if data["min"] is not None:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def __len__(self) -> int:
+        return len(self._bins)
@@ -0,0 +1,139 @@
+"""Rolling-window aggregation per (site, metric) series.
+
+Each series keeps a fixed ring of time buckets (count, sum, min, max).
+Updates touch one bucket; queries scan at most window/bucket buckets, a
+constant independent of sample count. Memory is capped by `max_series`:
+the least recently updated series is evicted first, and series idle for
+`idle_seconds` are dropped as new samples arrive.
+"""
+import math
+from collections import OrderedDict
+
+from src.observability.monitor import check_threshold
+
+
+class _Series:
+    __slots__ = ("index", "count", "sum", "min", "max", "last_ts")
+
+    def __init__(self, slots: int):
+        self.index = [-1] * slots
+        self.count = [0] * slots
+        self.sum = [0.0] * slots
+        self.min = [0.0] * slots
+        self.max = [0.0] * slots
+        self.last_ts = 0.0
+
+
+class RollingAggregator:
+    """Sliding-window mean/min/max/count/rate per (site_id, metric)."""
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        bucket_seconds: float = 1.0,
+        max_series: int = 10_000,
+        idle_seconds: float = 300.0,
+    ):
+        if bucket_seconds <= 0 or window_seconds < bucket_seconds:
+            raise ValueError("need 0 < bucket_seconds <= window_seconds")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.slots = math.ceil(window_seconds / bucket_seconds)
+        self.max_series = max_series
+        self.idle_seconds = idle_seconds
+        self._series: OrderedDict = OrderedDict()
+        self.evicted = 0
+
+    def _evict(self, now: float) -> None:
+        series = self._series
+        cutoff = now - self.idle_seconds
+        while series:
+            oldest = next(iter(series.values()))
+            if oldest.last_ts >= cutoff and len(series) <= self.max_series:
+                break
+            series.popitem(last=False)
+            self.evicted += 1
+
+    def record(self, site_id: str, metric: str, value: float, timestamp: float) -> bool:
+        """Add one sample. Return False if it is older than the window."""
+        key = (site_id, metric)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.slots)
+        else:
+            self._series.move_to_end(key)
+
+        bucket = int(timestamp // self.bucket_seconds)
+        newest = int(max(series.last_ts, timestamp) // self.bucket_seconds)
+        if bucket <= newest - self.slots:
+            return False
+
+        slot = bucket % self.slots
+        if series.index[slot] != bucket:
+            series.index[slot] = bucket
+            series.count[slot] = 1
+            series.sum[slot] = value
+            series.min[slot] = value
+            series.max[slot] = value
+        else:
+            series.count[slot] += 1
+            series.sum[slot] += value
+            if value < series.min[slot]:
+                series.min[slot] = value
+            if value > series.max[slot]:
+                series.max[slot] = value
+        if timestamp > series.last_ts:
+            series.last_ts = timestamp
+
+        self._evict(series.last_ts)
+        return True
+
+    def stats(self, site_id: str, metric: str, now: float) -> dict | None:
+        """Return count, mean, min, max and rate (samples/sec) over the window
+        ending at `now`, or None when the series has no samples in it."""
+        series = self._series.get((site_id, metric))
+        if series is None:
+            return None
+
+        newest = int(now // self.bucket_seconds)
+        oldest = newest - self.slots + 1
+        count = 0
+        total = 0.0
+        low = math.inf
+        high = -math.inf
+        for slot in range(self.slots):
+            bucket = series.index[slot]
+            if bucket < oldest or bucket > newest:
+                continue
+            count += series.count[slot]
+            total += series.sum[slot]
+            low = min(low, series.min[slot])
+            high = max(high, series.max[slot])
+
+        if count == 0:
+            return None
+        return {
+            "count": count,
+            "mean": total / count,
+            "min": low,
+            "max": high,
+            "rate": count / self.window_seconds,
+        }
+
+    def severity(
+        self,
+        site_id: str,
+        metric: str,
+        now: float,
+        warning: float,
+        critical: float,
+        stat: str = "mean",
+    ) -> str | None:
+        """Classify a window statistic with check_threshold."""
+        stats = self.stats(site_id, metric, now)
+        if stats is None:
+            return None
+        return check_threshold(stats[stat], warning, critical)
+
+    def __len__(self) -> int:
+        return len(self._series)
@@ -0,0 +1,204 @@
+"""Timing spans with correlation IDs.
+
+- timed(name) works as a context manager and as a decorator
+- Spans nest through a context variable; a root span adopts the active
+  correlation ID (see context.py), or opens a new correlation scope for
+  its duration, and child spans inherit it
+- Finished spans record their duration (ms) into a registry histogram
+  named after the span
+- Sampling is decided once per root span; with a sample rate of 0 the
+  cost is a flag check plus the stage totals below
+- Every span, sampled or not, adds its call count and elapsed
+  nanoseconds to always-on per-name totals (see stage_totals). Each
+  thread updates its own table without locking; stage_totals merges them
+"""
+import functools
+import random
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+
+from src.observability.context import _correlation_id, new_correlation_id
+from src.observability.metrics import REGISTRY, MetricsRegistry
+from src.observability.monitor import elapsed_ms
+
+_current_span: ContextVar = ContextVar("current_span", default=None)
+_UNSAMPLED = object()
+_sample_rate = 0.0
+_perf_ns = time.perf_counter_ns
+
+# Per thread: span name -> [calls, total_ns], keyed by id(table). When a
+# thread goes away its table is folded into _retired_totals, so pool
+# churn neither loses counts nor grows the list.
+_thread_totals = threading.local()
+_live_totals: dict[int, dict[str, list]] = {}
+_retired_totals: dict[str, list] = {}
+_totals_lock = threading.Lock()
+
+
+def _merge_into(target: dict[str, list], table: dict[str, list]) -> None:
+    for name, (calls, total_ns) in list(table.items()):
+        totals = target.setdefault(name, [0, 0])
+        totals[0] += calls
+        totals[1] += total_ns
+
+
+def _retire_totals(key: int) -> None:
+    with _totals_lock:
+        table = _live_totals.pop(key, None)
+        if table is not None:
+            _merge_into(_retired_totals, table)
+
+
+def _local_totals() -> dict[str, list]:
+    try:
+        return _thread_totals.table
+    except AttributeError:
+        table = {}
+        with _totals_lock:
+            _live_totals[id(table)] = table
+        weakref.finalize(threading.current_thread(), _retire_totals, id(table))
+        _thread_totals.table = table
+        return table
+
+
+def set_sample_rate(rate: float) -> None:
+    """Set the fraction of root spans that are recorded (0 disables tracing)."""
+    global _sample_rate
+    if not 0 <= rate <= 1:
+        raise ValueError("sample rate must be between 0 and 1")
+    _sample_rate = rate
+
+
+def get_sample_rate() -> float:
+    return _sample_rate
+
+
+class Span:
+    """One timed unit of work.
+
+    start_ns/end_ns come from the monotonic perf counter and are only
+    meaningful as a difference; started_at_ns is the wall-clock start.
+    """
+
+    __slots__ = ("name", "correlation_id", "parent", "tags", "started_at_ns", "start_ns", "end_ns")
+
+    def __init__(self, name: str, correlation_id: str, parent: "Span | None", tags: dict):
+        self.name = name
+        self.correlation_id = correlation_id
+        self.parent = parent
+        self.tags = tags
+        self.started_at_ns = time.time_ns()
+        self.start_ns = _perf_ns()
+        self.end_ns: int | None = None
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return elapsed_ms(self.start_ns, self.end_ns)
+
+
+def stage_totals() -> dict[str, tuple[int, int]]:
+    """Return {span name: (calls, total_ns)} accumulated since the last reset."""
+    merged: dict[str, list] = {}
+    with _totals_lock:
+        _merge_into(merged, _retired_totals)
+        for table in _live_totals.values():
+            _merge_into(merged, table)
+    return {name: (calls, total_ns) for name, (calls, total_ns) in merged.items()}
+
+
+def reset_stage_totals() -> None:
+    with _totals_lock:
+        _retired_totals.clear()
+        for table in _live_totals.values():
+            table.clear()
+
+
+def current_span() -> Span | None:
+    """Return the active sampled span, if any."""
+    span = _current_span.get()
+    return None if span is _UNSAMPLED else span
+
+
+class timed:
+    """Time a block or function as a span.
+
+        with timed("ingest.persist"):
+            insert_alert(...)
+
+        @timed("ingest.classify")
+        def classify(...): ...
+    """
+
+    __slots__ = ("name", "tags", "registry", "span", "_token", "_cid_token", "_start_ns")
+
+    def __init__(
+        self,
+        name: str,
+        tags: dict | None = None,
+        registry: MetricsRegistry | None = None,
+    ):
+        self.name = name
+        self.tags = tags
+        self.registry = registry
+        self.span: Span | None = None
+        self._token = None
+        self._cid_token = None
+        self._start_ns = 0
+
+    def __enter__(self) -> Span | None:
+        self._start_ns = _perf_ns()
+        if not _sample_rate:
+            return None
+        parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return None
+        if parent is None:
+            if _sample_rate < 1 and random.random() >= _sample_rate:
+                self._token = _current_span.set(_UNSAMPLED)
+                return None
+            correlation_id = _correlation_id.get()
+            if correlation_id is None:
+                correlation_id = new_correlation_id()
+                self._cid_token = _correlation_id.set(correlation_id)
+        else:
+            correlation_id = parent.correlation_id
+        self.span = Span(self.name, correlation_id, parent, self.tags or {})
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed_ns = _perf_ns() - self._start_ns
+        table = _local_totals()
+        totals = table.get(self.name)
+        if totals is None:
+            totals = table[self.name] = [0, 0]
+        totals[0] += 1
+        totals[1] += elapsed_ns
+
+        if self._token is None:
+            return
+        _current_span.reset(self._token)
+        self._token = None
+        if self._cid_token is not None:
+            _correlation_id.reset(self._cid_token)
+            self._cid_token = None
+        span = self.span
+        if span is None:
+            return
+        span.end_ns = _perf_ns()
+        registry = self.registry if self.registry is not None else REGISTRY
+        registry.histogram(self.name, self.tags).observe(span.duration_ms)
+
+    def __call__(self, fn):
+        name, tags, registry = self.name, self.tags, self.registry
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(name, tags, registry):
+                return fn(*args, **kwargs)
+
+        return wrapper
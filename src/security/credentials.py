@@ -0,0 +1,156 @@
+"""Hashed credential storage for Basic auth.
+
+- Passwords stored as salted scrypt hashes, never plaintext
+- A short-TTL cache of successful verifications, keyed by an HMAC of the
+  Authorization header so repeat requests skip the slow hash
+"""
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from datetime import timezone
+
+from src.security.auth import parse_basic_auth_header
+
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+_SALT_BYTES = 16
+
+
+def hash_password(
+    password: str,
+    salt: bytes | None = None,
+    n: int = SCRYPT_N,
+    r: int = SCRYPT_R,
+    p: int = SCRYPT_P,
+) -> str:
+    """Hash a password with scrypt.
+
+    Returns "scrypt$n$r$p$<salt hex>$<hash hex>" so the parameters travel
+    with the hash and can be raised later without breaking old entries.
+    """
+    if salt is None:
+        salt = os.urandom(_SALT_BYTES)
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p)
+    return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """Check a password against a hash produced by hash_password.
+
+    Return False for malformed hashes (fail closed).
+    """
+    try:
+        scheme, n, r, p, salt_hex, digest_hex = encoded.split("$")
+        if scheme != "scrypt":
+            return False
+        expected = bytes.fromhex(digest_hex)
+        actual = hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=bytes.fromhex(salt_hex),
+            n=int(n),
+            r=int(r),
+            p=int(p),
+        )
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, actual)
+
+
+class UserStore:
+    """In-memory username -> password hash mapping."""
+
+    def __init__(self):
+        self._hashes: dict[str, str] = {}
+        # Burned on unknown usernames so lookups take the same time as misses.
+        self._dummy_hash = hash_password("")
+
+    def set_password(self, username: str, password: str) -> None:
+        self._hashes[username] = hash_password(password)
+
+    def remove(self, username: str) -> None:
+        self._hashes.pop(username, None)
+
+    def password_hash(self, username: str) -> str | None:
+        return self._hashes.get(username)
+
+    def verify(self, username: str, password: str) -> bool:
+        """Return True when the password matches the stored hash."""
+        encoded = self._hashes.get(username)
+        if encoded is None:
+            verify_password(password, self._dummy_hash)
+            return False
+        return verify_password(password, encoded)
+
+
+class BasicAuthenticator:
+    """Verify Basic auth headers against a UserStore with a success cache.
+
+    Cache keys are HMAC-SHA256 digests of the raw header under a per-process
+    random key, so neither plaintext passwords nor reusable header values
+    are held in memory. Entries expire after `ttl_seconds` and are dropped
+    if the user's stored hash changes.
+    """
+
+    def __init__(
+        self,
+        store: UserStore,
+        ttl_seconds: int = 60,
+        max_entries: int = 10_000,
+        cache_key: bytes | None = None,
+    ):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._cache_key = cache_key if cache_key is not None else os.urandom(32)
+        self._cache: OrderedDict = OrderedDict()
+        # The cache is shared by request threads; reads and writes go under this.
+        self._lock = threading.Lock()
+
+    def _digest(self, auth_header: str) -> bytes:
+        return hmac.new(
+            self._cache_key, auth_header.encode("utf-8"), hashlib.sha256
+        ).digest()
+
+    def verify(self, auth_header: str, now: datetime | None = None) -> bool:
+        """Return True when the header carries valid credentials."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        ts = now.timestamp()
+        digest = self._digest(auth_header)
+
+        with self._lock:
+            cached = self._cache.get(digest)
+        if cached is not None:
+            username, encoded, expires_at = cached
+            if (ts < expires_at and encoded is not None
+                    and self.store.password_hash(username) is encoded):
+                return True
+            with self._lock:
+                self._cache.pop(digest, None)
+
+        try:
+            username, password = parse_basic_auth_header(auth_header)
+        except ValueError:
+            return False
+        # Read the hash once and verify against exactly that value, so a
+        # concurrent password change or removal can't be cached as valid.
+        encoded = self.store.password_hash(username)
+        if encoded is None:
+            self.store.verify(username, password)  # same cost as a miss
+            return False
+        if not verify_password(password, encoded):
+            return False
+
+        with self._lock:
+            self._cache[digest] = (username, encoded, ts + self.ttl_seconds)
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,153 @@
+"""Compiled OAuth scope policies.
+
+Scopes are interned to bit positions once, so authorization checks on the
+request path are integer bit operations instead of set construction.
+
+- ScopeRegistry: scope string -> bit, plus a bounded cache of granted masks
+- ScopePolicy: precompiled all-of / any-of requirements
+- RoutePolicies: one compiled policy per route
+"""
+import threading
+from collections import OrderedDict
+
+
+class ScopeRegistry:
+    """Intern scope strings to bit positions and cache granted masks.
+
+    Only scopes that appear in a compiled policy are interned. Granted
+    scopes the registry has never seen cannot satisfy any policy, so they
+    are ignored instead of growing the table from token contents.
+    """
+
+    def __init__(self, max_cached_grants: int = 4096):
+        self._bits: dict[str, int] = {}
+        self._grants: OrderedDict = OrderedDict()
+        self._max_cached_grants = max_cached_grants
+        # Guards bit assignment and _grants. _generation changes with every
+        # new bit, so a mask computed before an intern is never cached after it.
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def intern(self, scope: str) -> int:
+        """Return the bit mask for one scope, assigning a new bit if needed."""
+        bit = self._bits.get(scope)
+        if bit is not None:
+            return bit
+        with self._lock:
+            bit = self._bits.get(scope)
+            if bit is None:
+                bit = 1 << len(self._bits)
+                self._bits[scope] = bit
+                # Cached grant masks were computed without this bit.
+                self._grants.clear()
+                self._generation += 1
+        return bit
+
+    def mask_for(self, scopes) -> int:
+        """Return the combined mask for an iterable of scopes, interning them."""
+        mask = 0
+        for scope in scopes:
+            mask |= self.intern(scope)
+        return mask
+
+    def granted_mask(self, claims: dict) -> int:
+        """Return the granted-scope mask for verified token claims.
+
+        Accepts the same claim styles as token_has_required_scopes:
+        - scope: "space separated scopes"
+        - scopes: ["scope:a", "scope:b"]
+        """
+        if "scope" in claims:
+            key = claims["scope"]
+        elif "scopes" in claims:
+            key = tuple(claims["scopes"])
+        else:
+            return 0
+
+        with self._lock:
+            mask = self._grants.get(key)
+            if mask is not None:
+                self._grants.move_to_end(key)
+                return mask
+            generation = self._generation
+
+        scopes = key.split() if isinstance(key, str) else key
+        bits = self._bits
+        mask = 0
+        for scope in scopes:
+            mask |= bits.get(scope, 0)
+
+        with self._lock:
+            if generation == self._generation:
+                self._grants[key] = mask
+                if len(self._grants) > self._max_cached_grants:
+                    self._grants.popitem(last=False)
+        return mask
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+
+class ScopePolicy:
+    """A precompiled scope requirement.
+
+    Allowed when every scope in `all_of` is granted and, for each group
+    in `any_of`, at least one scope of that group is granted.
+    """
+
+    __slots__ = ("registry", "all_mask", "any_masks")
+
+    def __init__(
+        self,
+        registry: ScopeRegistry,
+        all_of: set[str] | None = None,
+        any_of: list[set[str]] | None = None,
+    ):
+        self.registry = registry
+        self.all_mask = registry.mask_for(all_of or ())
+        self.any_masks = tuple(registry.mask_for(group) for group in any_of or ())
+        if any(mask == 0 for mask in self.any_masks):
+            raise ValueError("any_of groups must not be empty")
+
+    def allows_mask(self, granted: int) -> bool:
+        """Evaluate the policy against a granted-scope mask."""
+        all_mask = self.all_mask
+        if granted & all_mask != all_mask:
+            return False
+        for mask in self.any_masks:
+            if not granted & mask:
+                return False
+        return True
+
+    def allows(self, claims: dict) -> bool:
+        """Evaluate the policy against verified token claims."""
+        return self.allows_mask(self.registry.granted_mask(claims))
+
+
+class RoutePolicies:
+    """Scope policies compiled once per route.
+
+    Unknown routes are denied (fail closed).
+    """
+
+    def __init__(self, registry: ScopeRegistry | None = None):
+        self.registry = registry if registry is not None else ScopeRegistry()
+        self._policies: dict[str, ScopePolicy] = {}
+
+    def register(
+        self,
+        route: str,
+        all_of: set[str] | None = None,
+        any_of: list[set[str]] | None = None,
+    ) -> ScopePolicy:
+        """Compile and store the policy for a route."""
+        policy = ScopePolicy(self.registry, all_of=all_of, any_of=any_of)
+        self._policies[route] = policy
+        return policy
+
+    def authorize(self, route: str, claims: dict) -> bool:
+        """Return True when the claims satisfy the route's policy."""
+        policy = self._policies.get(route)
+        if policy is None:
+            return False
+        return policy.allows(claims)
@@ -0,0 +1,124 @@
+"""Tests for the alert read queries and the query benchmark helpers."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_queries import (
+    build_cases,
+    compare_plans,
+    explain,
+    open_database,
+)
+from benchmarks.workload import generate_rows
+from src.infrastructure import repositories
+from src.infrastructure.database import get_connection, initialize_database
+
+ROWS = [
+    ("2026-01-01T00:00:00Z", "SITE-A", "LEAK", "CRITICAL", 31.0, -102.0),
+    ("2026-01-01T01:00:00Z", "SITE-B", "PRESSURE", "MODERATE", 31.05, -102.0),
+    ("2026-01-01T02:00:00Z", "SITE-A", "PRESSURE", "MODERATE", 31.0, -102.0),
+    ("2026-01-02T00:00:00Z", "SITE-C", "BLOCKAGE", "CRITICAL", 33.0, -104.0),
+]
+
+
+@pytest.fixture
+def conn():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    repositories.insert_alerts(conn, ROWS)
+    yield conn
+    conn.close()
+
+
+def test_latest_alert_per_site(conn):
+    assert repositories.get_latest_alert_per_site(conn) == [ROWS[2], ROWS[1], ROWS[3]]
+
+
+def test_alerts_between_is_half_open(conn):
+    assert repositories.get_alerts_between(
+        conn, "2026-01-01T01:00:00Z", "2026-01-01T02:00:00Z"
+    ) == [ROWS[1]]
+
+
+def test_count_alerts_by_severity(conn):
+    assert repositories.count_alerts_by_severity(conn) == {"CRITICAL": 2, "MODERATE": 2}
+    assert repositories.count_alerts_by_severity(conn, start="2026-01-01T01:00:00Z") == {
+        "CRITICAL": 1,
+        "MODERATE": 2,
+    }
+
+
+def test_alerts_within_radius(conn):
+    # SITE-B is ~5.6 km north of SITE-A.
+    near = repositories.get_alerts_within_radius(conn, 31.0, -102.0, 1.0)
+    wider = repositories.get_alerts_within_radius(conn, 31.0, -102.0, 10.0)
+    assert near == [ROWS[0], ROWS[2]]
+    assert sorted(wider) == sorted(ROWS[:3])
+
+
+def test_alerts_within_radius_across_the_antimeridian():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    east = ("2026-01-01T00:00:00Z", "SITE-E", "LEAK", "CRITICAL", 0.0, 179.99)
+    west = ("2026-01-01T00:00:00Z", "SITE-W", "LEAK", "CRITICAL", 0.0, -179.99)
+    repositories.insert_alerts(conn, [east, west])
+
+    assert len(repositories.radius_bounding_boxes(0.0, 179.99, 50.0)) == 2
+    assert repositories.get_alerts_within_radius(conn, 0.0, 179.99, 50.0) == [east, west]
+    assert repositories.get_alerts_within_radius(conn, 0.0, -179.99, 50.0) == [east, west]
+    conn.close()
+
+
+def test_alerts_within_radius_near_a_pole():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    # Both ~11 km from the pole, on opposite sides of it: ~22 km apart.
+    near = ("2026-01-01T00:00:00Z", "SITE-N", "LEAK", "CRITICAL", 89.9, 0.0)
+    across = ("2026-01-01T00:00:00Z", "SITE-X", "LEAK", "CRITICAL", 89.9, 180.0)
+    repositories.insert_alerts(conn, [near, across])
+
+    [(_, max_lat, min_lon, max_lon)] = repositories.radius_bounding_boxes(89.9, 0.0, 30.0)
+    assert (max_lat, min_lon, max_lon) == (90.0, -180.0, 180.0)
+    assert repositories.get_alerts_within_radius(conn, 89.9, 0.0, 30.0) == [near, across]
+    conn.close()
+
+
+def test_iter_all_alerts_streams_every_row(conn):
+    assert list(repositories.iter_all_alerts(conn, batch_size=3)) == ROWS
+
+
+def test_generated_rows_are_deterministic_and_ordered():
+    rows = list(generate_rows(500, seed=4, sites=20))
+    assert rows == list(generate_rows(500, seed=4, sites=20))
+    assert [row[0] for row in rows] == sorted(row[0] for row in rows)
+    assert len({row[1] for row in rows}) == 20
+
+
+def test_benchmark_database_is_cached_and_plans_use_indexes(tmp_path):
+    path = str(tmp_path / "bench.db")
+    conn = open_database(path, rows=5000, sites=50)
+    conn.close()
+    mtime = os.path.getmtime(path)
+    conn = open_database(path, rows=5000, sites=50)
+    try:
+        assert os.path.getmtime(path) == mtime
+        cases = build_cases(conn, rows=5000, sites=50)
+        for name, (_, _, fn) in cases.items():
+            fn()
+        sql, params, _ = cases["time_window/1h"]
+        assert "idx_alerts_timestamp" in " ".join(explain(conn, sql, params))
+        sql, params, _ = cases["latest_per_site"]
+        assert "idx_alerts_site_timestamp" in " ".join(explain(conn, sql, params))
+    finally:
+        conn.close()
+
+
+def test_compare_plans_reports_changes():
+    baseline = {"q": ["SEARCH alerts USING INDEX idx"], "gone": ["SCAN alerts"]}
+    assert compare_plans({"q": ["SEARCH alerts USING INDEX idx"]}, baseline) == []
+    assert compare_plans({"q": ["SCAN alerts"]}, baseline) == [
+        "q: plan ['SEARCH alerts USING INDEX idx'] -> ['SCAN alerts']"
+    ]
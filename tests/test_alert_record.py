@@ -0,0 +1,62 @@
+"""Tests for the compact AlertRecord and the memory benchmark."""
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from benchmarks.bench_memory import compare_bytes, run
+from src.domain.models import Alert, AlertRecord
+from src.infrastructure.database import get_connection, initialize_database
+from src.infrastructure.repositories import get_all_alerts, insert_alerts
+
+ALERT = Alert(timestamp="2026-01-01T00:00:00Z", site_id="SITE-1", alert_type="LEAK",
+              severity="CRITICAL", latitude=29.7, longitude=-95.3)
+
+
+def test_record_round_trips_through_alert():
+    record = AlertRecord.from_alert(ALERT)
+
+    assert record == ("2026-01-01T00:00:00Z", "SITE-1", "LEAK", "CRITICAL", 29.7, -95.3)
+    assert record.to_alert() == ALERT
+
+
+def test_records_are_insertable_rows():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    insert_alerts(conn, [AlertRecord.from_alert(ALERT)])
+
+    assert get_all_alerts(conn) == [AlertRecord.from_alert(ALERT)]
+
+
+def test_process_alert_batch_returns_alerts_or_records():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    logger = app.build_logger("INFO", stream=io.StringIO())
+    event = {"timestamp": "2026-01-01T00:00:00Z", "site_id": "SITE-1", "alert_type": "LEAK",
+             "latitude": 29.7, "longitude": -95.3}
+
+    persisted, _ = app.process_alert_batch(conn, logger, [event])
+    assert persisted == [ALERT]
+    assert persisted[0].model_dump()["severity"] == "CRITICAL"
+
+    records, _ = app.process_alert_batch(conn, logger, [event], as_records=True)
+    assert records == [AlertRecord.from_alert(ALERT)]
+    assert isinstance(records[0], AlertRecord)
+
+
+def test_memory_benchmark_reports_records_smaller_than_models():
+    results = run(2000, seed=1)
+
+    assert set(results) == {"dict", "Alert", "AlertRecord", "tuple", "batch", "batch/records"}
+    assert results["AlertRecord"]["bytes_per_alert"] < results["Alert"]["bytes_per_alert"] / 4
+    assert results["batch/records"]["peak_bytes_per_alert"] < results["Alert"]["bytes_per_alert"]
+
+
+def test_compare_bytes_flags_growth():
+    baseline = {"AlertRecord": {"bytes_per_alert": 100.0}}
+    assert compare_bytes({"AlertRecord": {"bytes_per_alert": 105.0}}, baseline) == []
+    assert compare_bytes({"AlertRecord": {"bytes_per_alert": 150.0}}, baseline) == [
+        "AlertRecord: 150 B/alert > baseline 100 B/alert"
+    ]
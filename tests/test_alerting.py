@@ -0,0 +1,112 @@
+"""Tests for vectorized thresholds and stateful alert rules."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability import monitor
+from src.observability.alerting import AlertRules, ThresholdRule
+
+
+def test_check_thresholds_matches_check_threshold():
+    values = [10.0, 69.9, 70.0, 75.0, 89.9, 90.0, 95.0]
+
+    codes = monitor.check_thresholds(values, 70.0, 90.0)
+
+    assert [monitor.SEVERITY_NAMES[code] for code in codes] == [
+        monitor.check_threshold(value, 70.0, 90.0) for value in values
+    ]
+
+
+def test_check_thresholds_numpy_input():
+    np = pytest.importorskip("numpy")
+    values = np.array([10.0, 70.0, 90.0, 95.0])
+
+    codes = monitor.check_thresholds(values, 70.0, 90.0)
+
+    assert codes.dtype == np.int8
+    assert codes.tolist() == [0, 1, 2, 2]
+
+
+def test_hysteresis_prevents_flapping():
+    rule = ThresholdRule(warning=70, critical=90, hysteresis=5)
+
+    assert rule.evaluate("s1", 71, 0) == "warning"
+    assert rule.evaluate("s1", 68, 1) is None
+    assert rule.evaluate("s1", 71, 2) is None
+    assert rule.evaluate("s1", 64, 3) == "ok"
+
+
+def test_duration_requires_consecutive_breaches():
+    rule = ThresholdRule(warning=70, critical=90, min_consecutive=3)
+
+    assert rule.evaluate("s1", 95, 0) is None
+    assert rule.evaluate("s1", 75, 1) is None
+    assert rule.evaluate("s1", 10, 2) is None
+    assert rule.evaluate("s1", 95, 3) is None
+    assert rule.evaluate("s1", 96, 4) is None
+    assert rule.evaluate("s1", 75, 5) == "warning"
+    assert rule.severity("s1") == "warning"
+
+
+def test_rate_of_change_raises_severity():
+    rule = ThresholdRule(warning=70, critical=90, max_rate_per_second=5, rate_severity="critical")
+
+    assert rule.evaluate("s1", 10, 0) is None
+    assert rule.evaluate("s1", 14, 1) is None
+    assert rule.evaluate("s1", 40, 2) == "critical"
+    assert rule.evaluate("s1", 41, 3) == "ok"
+
+
+def test_series_are_independent():
+    rule = ThresholdRule(warning=70, critical=90)
+
+    rule.evaluate("a", 95, 0)
+    rule.evaluate("b", 10, 0)
+
+    assert (rule.severity("a"), rule.severity("b"), rule.severity("c")) == ("critical", "ok", "ok")
+    assert len(rule) == 2
+
+
+def test_invalid_rule_rejected():
+    with pytest.raises(ValueError):
+        ThresholdRule(warning=90, critical=70)
+
+
+def test_alert_rules_emit_process_alert_event_kwargs():
+    rules = AlertRules({
+        "PRESSURE": ThresholdRule(warning=70, critical=90),
+        "TEMPERATURE": ThresholdRule(warning=150, critical=200),
+    })
+    base = {"site_id": "SITE_001", "latitude": 29.76, "longitude": -95.37}
+    readings = [
+        {**base, "alert_type": "PRESSURE", "value": 50, "timestamp": 1_706_263_200},
+        {**base, "alert_type": "PRESSURE", "value": 80, "timestamp": 1_706_263_201},
+        {**base, "alert_type": "PRESSURE", "value": 81, "timestamp": 1_706_263_202},
+        {**base, "alert_type": "TEMPERATURE", "value": 210, "timestamp": 1_706_263_203},
+        {**base, "alert_type": "ACOUSTIC", "value": 999, "timestamp": 1_706_263_204},
+    ]
+
+    events = rules.evaluate_readings(readings)
+
+    assert events == [
+        {**base, "alert_type": "PRESSURE", "timestamp": "2024-01-26T10:00:01Z"},
+        {**base, "alert_type": "TEMPERATURE", "timestamp": "2024-01-26T10:00:03Z"},
+    ]
+
+
+def test_alert_rules_do_not_emit_on_de_escalation():
+    rules = AlertRules({"PRESSURE": ThresholdRule(warning=70, critical=90)})
+    base = {"site_id": "SITE_001", "alert_type": "PRESSURE", "latitude": 29.76, "longitude": -95.37}
+    readings = [
+        {**base, "value": 95, "timestamp": 1_706_263_200},
+        {**base, "value": 80, "timestamp": 1_706_263_201},
+    ]
+
+    events = rules.evaluate_readings(readings)
+
+    assert [event["timestamp"] for event in events] == ["2024-01-26T10:00:00Z"]
+    assert rules.rules["PRESSURE"].severity("SITE_001") == "warning"
+
@@ -0,0 +1,100 @@
+"""Tests for batch JWT verification."""
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.security import auth
+
+NOW = datetime(2026, 2, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _token(subject: str, expires_in_seconds: int = 120) -> str:
+    return auth.create_hs256_jwt(
+        subject=subject,
+        secret="top-secret",
+        expires_in_seconds=expires_in_seconds,
+        now=NOW,
+    )
+
+
+def test_verify_many_returns_results_in_input_order():
+    tokens = [_token("user-1"), _token("user-2"), _token("user-3")]
+
+    results = auth.verify_many(tokens, secret="top-secret", now=NOW)
+
+    assert [claims["sub"] for claims in results] == ["user-1", "user-2", "user-3"]
+
+
+def test_verify_many_reports_errors_per_token():
+    valid = _token("user-1")
+    expired = _token("user-2", expires_in_seconds=-1)
+
+    results = auth.verify_many(
+        [valid, "not-a-jwt", expired, valid[:-2] + "xx"],
+        secret="top-secret",
+        now=NOW,
+    )
+
+    assert results[0]["sub"] == "user-1"
+    assert isinstance(results[1], ValueError)
+    assert "expired" in str(results[2]).lower()
+    assert isinstance(results[3], ValueError)
+
+
+def test_verify_many_deduplicates_identical_tokens(monkeypatch):
+    calls = []
+    original = auth.verify_hs256_jwt
+
+    def counting_verify(token, secret, now=None):
+        calls.append(token)
+        return original(token, secret, now=now)
+
+    monkeypatch.setattr(auth, "verify_hs256_jwt", counting_verify)
+    token = _token("user-1")
+
+    results = auth.verify_many([token, token, token], secret="top-secret", now=NOW)
+
+    assert len(calls) == 1
+    assert results[0] == results[1] == results[2]
+    results[1]["sub"] = "mutated"
+    assert results[0]["sub"] == results[2]["sub"] == "user-1"
+
+
+def test_verify_many_serial_and_pooled_agree():
+    tokens = [_token(f"user-{i}") for i in range(20)] + ["bad"]
+
+    serial = auth.verify_many(tokens, secret="top-secret", now=NOW, max_workers=1)
+    pooled = auth.verify_many(tokens, secret="top-secret", now=NOW, max_workers=4)
+
+    assert serial[:-1] == pooled[:-1]
+    assert str(serial[-1]) == str(pooled[-1])
+
+
+def test_verify_many_runs_small_tokens_inline(monkeypatch):
+    def no_pool(max_workers):
+        raise AssertionError("small tokens must not use the pool")
+
+    monkeypatch.setattr(auth, "_shared_pool", no_pool)
+    tokens = [_token(f"user-{i}") for i in range(8)]
+
+    assert [c["sub"] for c in auth.verify_many(tokens, secret="top-secret", now=NOW)] == [
+        f"user-{i}" for i in range(8)
+    ]
+
+
+def test_verify_many_reuses_one_pool_for_large_tokens(monkeypatch):
+    monkeypatch.setattr(auth, "PARALLEL_MIN_TOKEN_CHARS", 1)
+    tokens = [_token(f"user-{i}") for i in range(4)]
+
+    auth.verify_many(tokens, secret="top-secret", now=NOW, max_workers=2)
+    pool = auth._shared_pool(2)
+    results = auth.verify_many(tokens, secret="top-secret", now=NOW, max_workers=2)
+
+    assert auth._shared_pool(2) is pool
+    assert [c["sub"] for c in results] == [f"user-{i}" for i in range(4)]
+
+
+def test_verify_many_empty_batch():
+    assert auth.verify_many([], secret="top-secret", now=NOW) == []
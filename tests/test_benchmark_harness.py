@@ -0,0 +1,45 @@
+"""Tests for the benchmark baseline/comparison helpers."""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks import harness
+
+
+def _row(ops_per_sec: float, p50_us: float) -> dict:
+    return {"iterations": 100, "ops_per_sec": ops_per_sec, "p50_us": p50_us, "p99_us": p50_us * 2}
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+
+    assert harness.percentile(samples, 0.50) == 50
+    assert harness.percentile(samples, 0.99) == 99
+    assert harness.percentile([], 0.99) == 0.0
+
+
+def test_measure_reports_throughput_and_latency():
+    result = harness.measure(lambda: None, iterations=100, warmup=0)
+
+    assert result["iterations"] == 100
+    assert result["ops_per_sec"] > 0
+    assert result["p50_us"] <= result["p99_us"]
+
+
+def test_compare_flags_only_regressions_beyond_threshold(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    harness.save_baseline(
+        {"fast": _row(1000, 1.0), "slow": _row(1000, 1.0), "gone": _row(1, 1.0)},
+        str(baseline_path),
+    )
+    baseline = harness.load_baseline(str(baseline_path))
+
+    regressions = harness.compare(
+        {"fast": _row(900, 1.1), "slow": _row(700, 1.5), "new": _row(1, 1.0)},
+        baseline,
+        threshold=0.20,
+    )
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
@@ -0,0 +1,106 @@
+"""Tests for correlation ID propagation."""
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.observability import context, monitor, tracing
+from src.observability.metrics import MetricsRegistry
+
+
+def test_new_correlation_ids_are_unique():
+    ids = {context.new_correlation_id() for _ in range(1000)}
+
+    assert len(ids) == 1000
+
+
+def test_scope_creates_or_adopts_and_restores():
+    assert context.get_correlation_id() is None
+
+    with context.correlation_scope() as created:
+        assert context.get_correlation_id() == created
+        with context.correlation_scope("incoming-123") as adopted:
+            assert adopted == "incoming-123"
+            assert context.get_correlation_id() == "incoming-123"
+        assert context.get_correlation_id() == created
+
+    assert context.get_correlation_id() is None
+
+
+def test_correlation_id_from_headers():
+    assert context.correlation_id_from_headers({"x-correlation-id": " abc "}) == "abc"
+    assert context.correlation_id_from_headers({"X-Correlation-Id": " "}) is None
+    assert context.correlation_id_from_headers({}) is None
+
+
+def test_context_executor_carries_id_into_threads():
+    with context.correlation_scope("req-1"):
+        with context.ContextThreadPoolExecutor(max_workers=2) as pool:
+            carried = pool.submit(context.get_correlation_id).result()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            plain = pool.submit(context.get_correlation_id).result()
+
+    assert carried == "req-1"
+    assert plain is None
+
+
+def test_asyncio_tasks_inherit_id():
+    async def handler(correlation_id):
+        with context.correlation_scope(correlation_id):
+            await asyncio.sleep(0)
+            in_thread = await asyncio.to_thread(context.get_correlation_id)
+            in_task = await asyncio.create_task(_read_id())
+            return in_thread, in_task
+
+    async def _read_id():
+        await asyncio.sleep(0)
+        return context.get_correlation_id()
+
+    async def main():
+        return await asyncio.gather(handler("a"), handler("b"))
+
+    assert asyncio.run(main()) == [("a", "a"), ("b", "b")]
+
+
+def test_logger_output_includes_active_id():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream)
+
+    logger.info("outside")
+    with context.correlation_scope("req-42"):
+        logger.info("inside")
+
+    outside, inside = stream.getvalue().splitlines()
+    assert outside.endswith(",outside")
+    assert inside.endswith(",inside correlation_id=req-42")
+
+
+def test_record_metric_tags_include_active_id_but_registry_does_not():
+    registry = MetricsRegistry()
+    registry.counter("alerts.recorded").inc()
+
+    with context.correlation_scope("req-7"):
+        sample = monitor.record_metric("api.latency", 1.0, tags={"region": "us"}, now=1)
+        snapshot = registry.snapshot(now=1)
+
+    assert sample["tags"] == {"correlation_id": "req-7", "region": "us"}
+    assert snapshot[0]["tags"] == {}
+
+
+def test_root_span_adopts_scope_id():
+    tracing.set_sample_rate(1.0)
+    try:
+        with context.correlation_scope("req-9"):
+            with tracing.timed("work", registry=MetricsRegistry()) as span:
+                pass
+        with tracing.timed("work", registry=MetricsRegistry()) as own:
+            assert context.get_correlation_id() == own.correlation_id
+    finally:
+        tracing.set_sample_rate(0.0)
+
+    assert span.correlation_id == "req-9"
+    assert context.get_correlation_id() is None
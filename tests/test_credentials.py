@@ -0,0 +1,136 @@
+"""Tests for hashed Basic auth credentials and the verification cache."""
+import base64
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.security import credentials
+
+NOW = datetime(2026, 2, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _basic_header(username: str, password: str) -> str:
+    raw = f"{username}:{password}".encode("utf-8")
+    return "Basic " + base64.b64encode(raw).decode("ascii")
+
+
+def test_hash_password_round_trip_and_never_stores_plaintext():
+    encoded = credentials.hash_password("secret-pass")
+
+    assert "secret-pass" not in encoded
+    assert credentials.verify_password("secret-pass", encoded) is True
+    assert credentials.verify_password("wrong-pass", encoded) is False
+
+
+def test_verify_password_rejects_malformed_hash():
+    assert credentials.verify_password("secret-pass", "plaintext") is False
+    assert credentials.verify_password("secret-pass", "md5$1$1$1$00$00") is False
+
+
+def test_authenticator_accepts_valid_and_rejects_invalid():
+    store = credentials.UserStore()
+    store.set_password("ops-user", "secret-pass")
+    authenticator = credentials.BasicAuthenticator(store)
+
+    assert authenticator.verify(_basic_header("ops-user", "secret-pass"), now=NOW) is True
+    assert authenticator.verify(_basic_header("ops-user", "wrong-pass"), now=NOW) is False
+    assert authenticator.verify(_basic_header("nobody", "secret-pass"), now=NOW) is False
+    assert authenticator.verify("Basic !!!", now=NOW) is False
+
+
+def test_authenticator_caches_success_until_ttl(monkeypatch):
+    store = credentials.UserStore()
+    store.set_password("ops-user", "secret-pass")
+    authenticator = credentials.BasicAuthenticator(store, ttl_seconds=30)
+    header = _basic_header("ops-user", "secret-pass")
+    calls = {"count": 0}
+    original = credentials.verify_password
+
+    def counting_verify(password, encoded):
+        calls["count"] += 1
+        return original(password, encoded)
+
+    monkeypatch.setattr(credentials, "verify_password", counting_verify)
+
+    assert authenticator.verify(header, now=NOW) is True
+    assert authenticator.verify(header, now=NOW + timedelta(seconds=29)) is True
+    assert calls["count"] == 1
+
+    assert authenticator.verify(header, now=NOW + timedelta(seconds=30)) is True
+    assert calls["count"] == 2
+
+
+def test_authenticator_cache_invalidated_by_password_change():
+    store = credentials.UserStore()
+    store.set_password("ops-user", "secret-pass")
+    authenticator = credentials.BasicAuthenticator(store)
+    header = _basic_header("ops-user", "secret-pass")
+
+    assert authenticator.verify(header, now=NOW) is True
+    store.set_password("ops-user", "rotated-pass")
+
+    assert authenticator.verify(header, now=NOW) is False
+
+
+def test_authenticator_concurrent_expiry_does_not_raise(monkeypatch):
+    store = credentials.UserStore()
+    store.set_password("ops-user", "secret-pass")
+    monkeypatch.setattr(credentials, "verify_password", lambda password, encoded: True)
+    authenticator = credentials.BasicAuthenticator(store, ttl_seconds=1)
+    header = _basic_header("ops-user", "secret-pass")
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def expire_repeatedly():
+        barrier.wait()
+        try:
+            for i in range(500):
+                # Alternate clocks so every thread keeps finding expired entries.
+                authenticator.verify(header, now=NOW + timedelta(seconds=2 * (i % 2)))
+        except Exception as exc:  # pragma: no cover - the failure being tested
+            errors.append(exc)
+
+    threads = [threading.Thread(target=expire_repeatedly) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_authenticator_rejects_removed_user_and_never_caches_none():
+    store = credentials.UserStore()
+    store.set_password("alice", "secret-pass")
+    authenticator = credentials.BasicAuthenticator(store)
+    header = _basic_header("alice", "secret-pass")
+
+    assert authenticator.verify(header, now=NOW) is True
+    store.remove("alice")
+
+    assert authenticator.verify(header, now=NOW) is False
+    assert authenticator.verify(header, now=NOW) is False
+
+
+def test_authenticator_caches_the_hash_it_verified(monkeypatch):
+    store = credentials.UserStore()
+    store.set_password("alice", "old-pass")
+    authenticator = credentials.BasicAuthenticator(store)
+    header = _basic_header("alice", "old-pass")
+    original = credentials.verify_password
+
+    def rotate_during_verify(password, encoded):
+        result = original(password, encoded)
+        store.set_password("alice", "new-pass")  # rotated right after the check
+        return result
+
+    monkeypatch.setattr(credentials, "verify_password", rotate_during_verify)
+    assert authenticator.verify(header, now=NOW) is True
+    monkeypatch.setattr(credentials, "verify_password", original)
+
+    # The cached entry belongs to the old hash, so it no longer matches.
+    assert authenticator.verify(header, now=NOW) is False
+
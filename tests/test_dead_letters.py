@@ -0,0 +1,169 @@
+"""Tests for the dead-letter store and replay."""
+import io
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.infrastructure.database import get_connection, initialize_database
+from src.infrastructure.repositories import (
+    count_dead_letters,
+    get_all_alerts,
+    get_dead_letters,
+    insert_dead_letters,
+)
+from src.infrastructure.retry import RetryPolicy
+
+
+def _event(site_id="SITE-1", latitude=29.7):
+    return {
+        "timestamp": "2026-01-01T00:00:00Z",
+        "site_id": site_id,
+        "alert_type": "LEAK",
+        "latitude": latitude,
+        "longitude": -95.3,
+    }
+
+
+@pytest.fixture
+def conn():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    yield conn
+    conn.close()
+
+
+def _logger(stream=None):
+    return app.build_logger("DEBUG", stream=stream or io.StringIO())
+
+
+def _no_wait(max_retries=1):
+    return RetryPolicy(max_retries=max_retries, base_delay_seconds=0.0, max_delay_seconds=0.0)
+
+
+def test_exhausted_event_is_dead_lettered_and_reraised(monkeypatch, conn):
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(app, "insert_alert", locked)
+    stream = io.StringIO()
+    with pytest.raises(sqlite3.OperationalError):
+        app.process_alert_event(conn, _logger(stream), **_event(), retry_policy=_no_wait(2),
+                                dead_letter_conn=conn)
+
+    [(_, failed_at, payload, error, attempts)] = get_dead_letters(conn)
+    assert payload == _event()
+    assert "database is locked" in error
+    assert attempts == 3
+    assert failed_at.endswith("Z")
+    assert "alert_dead_lettered" in stream.getvalue()
+
+
+def test_permanent_failure_is_dead_lettered_after_one_attempt(monkeypatch, conn):
+    def constraint(*args):
+        raise sqlite3.IntegrityError("CHECK constraint failed")
+
+    monkeypatch.setattr(app, "insert_alert", constraint)
+    with pytest.raises(sqlite3.IntegrityError):
+        app.process_alert_event(conn, _logger(), **_event(), dead_letter_conn=conn)
+
+    assert get_dead_letters(conn)[0][4] == 1
+
+
+def test_without_store_nothing_is_dead_lettered(monkeypatch, conn):
+    monkeypatch.setattr(app, "insert_alert", lambda *args: (_ for _ in ()).throw(RuntimeError()))
+    with pytest.raises(RuntimeError):
+        app.process_alert_event(conn, _logger(), **_event(), retry_policy=_no_wait(0))
+    assert count_dead_letters(conn) == 0
+
+
+def test_batch_dead_letters_failed_chunk_and_continues(monkeypatch, conn):
+    real_insert = app.insert_alerts
+    calls = []
+
+    def fail_first_chunk(c, rows):
+        calls.append(len(rows))
+        if len(calls) <= 2:
+            raise sqlite3.OperationalError("database is locked")
+        real_insert(c, rows)
+
+    monkeypatch.setattr(app, "insert_alerts", fail_first_chunk)
+    events = [_event(f"SITE-{i}") for i in range(4)]
+    persisted, rejected = app.process_alert_batch(
+        conn, _logger(), events, batch_size=2, retry_policy=_no_wait(1), dead_letter_conn=conn
+    )
+
+    assert [a.site_id for a in persisted] == ["SITE-2", "SITE-3"]
+    assert rejected == []
+    assert [row[2]["site_id"] for row in get_dead_letters(conn)] == ["SITE-0", "SITE-1"]
+
+
+def test_replay_reingests_in_batches_and_keeps_invalid(monkeypatch, conn):
+    payloads = [_event(f"SITE-{i}") for i in range(5)] + [_event("BAD", latitude=99.0)]
+    insert_dead_letters(conn, "2026-01-01T00:00:00Z", payloads, "OperationalError()", 3)
+    real_insert = app.insert_alerts
+    chunks = []
+
+    def counting_insert(c, rows):
+        chunks.append(len(rows))
+        real_insert(c, rows)
+
+    monkeypatch.setattr(app, "insert_alerts", counting_insert)
+    summary = app.replay_dead_letters(conn, _logger(), batch_size=2)
+
+    assert summary == {"replayed": 5, "rejected": 1}
+    assert chunks == [2, 2, 1]
+    assert len(get_all_alerts(conn)) == 5
+    [(_, _, payload, error, attempts)] = get_dead_letters(conn)
+    assert payload["site_id"] == "BAD"
+    assert (error, attempts) == ("validation_failed", 4)
+
+
+def test_replay_matches_rejections_by_row_not_identity(monkeypatch, conn):
+    payloads = [_event("SITE-1"), _event("BAD", latitude=99.0), _event("SITE-2")]
+    insert_dead_letters(conn, "2026-01-01T00:00:00Z", payloads, "e", 1)
+    real_batch = app.process_alert_batch
+
+    def copying_batch(c, logger, events, **kwargs):
+        return real_batch(c, logger, [dict(event) for event in events], **kwargs)
+
+    monkeypatch.setattr(app, "process_alert_batch", copying_batch)
+
+    assert app.replay_dead_letters(conn, _logger()) == {"replayed": 2, "rejected": 1}
+    [(_, _, payload, _, _)] = get_dead_letters(conn)
+    assert payload["site_id"] == "BAD"
+
+
+def test_replay_respects_limit_and_keeps_rows_on_failure(monkeypatch, conn):
+    insert_dead_letters(conn, "2026-01-01T00:00:00Z", [_event(f"S{i}") for i in range(3)], "e", 1)
+    assert app.replay_dead_letters(conn, _logger(), limit=2) == {"replayed": 2, "rejected": 0}
+    assert count_dead_letters(conn) == 1
+
+    def locked(c, rows):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(app, "insert_alerts", locked)
+    with pytest.raises(sqlite3.OperationalError):
+        app.replay_dead_letters(conn, _logger(), retry_policy=_no_wait(0))
+    assert count_dead_letters(conn) == 1
+
+
+def test_cli_replays_from_settings(monkeypatch, tmp_path, capsys):
+    db_path = str(tmp_path / "alerts.db")
+    setup = get_connection(db_path)
+    initialize_database(setup)
+    insert_dead_letters(setup, "2026-01-01T00:00:00Z", [_event()], "e", 1)
+    setup.close()
+
+    monkeypatch.setenv("PYTHON_DOTENV_DISABLED", "1")
+    monkeypatch.setenv("APP_ENV", "dev")
+    monkeypatch.setenv("DATABASE_URL", db_path)
+    monkeypatch.setenv("API_TOKEN", "t")
+    assert app.main(["replay-dead-letters", "--batch-size", "10"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"replayed": 1, "rejected": 0}
+    app.build_logger("INFO", stream=io.StringIO())
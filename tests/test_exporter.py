@@ -0,0 +1,148 @@
+"""Tests for metrics serialization and the batched exporter."""
+import json
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability import exporter
+from src.observability.metrics import MetricsRegistry
+
+NOW = 1_700_000_000
+
+
+def _registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("alerts.recorded", {"site": "A"}).inc(3)
+    registry.histogram("ingest.latency", buckets=(1.0,)).observe(0.5)
+    return registry
+
+
+def test_statsd_lines():
+    lines = exporter.to_statsd_lines(_registry().snapshot(now=NOW))
+
+    assert "alerts.recorded:3|g|#site:A" in lines
+    assert "ingest.latency.count:1|g" in lines
+
+
+def test_prometheus_lines_group_histogram_family():
+    registry = _registry()
+
+    lines = exporter.to_prometheus_lines(registry.snapshot(now=NOW), registry.kinds())
+
+    assert "# TYPE alerts_recorded counter" in lines
+    assert 'alerts_recorded{site="A"} 3 1700000000000' in lines
+    assert "# TYPE ingest_latency histogram" in lines
+    assert 'ingest_latency_bucket{le="+Inf"} 1 1700000000000' in lines
+    assert sum(line.startswith("# TYPE ingest_latency") for line in lines) == 1
+
+
+def test_prometheus_lines_keep_each_family_contiguous():
+    samples = [
+        {"name": "b", "tags": {"site": "A"}, "value": 1, "timestamp": NOW},
+        {"name": "a", "tags": {}, "value": 2, "timestamp": NOW},
+        {"name": "b", "tags": {"site": "B"}, "value": 3, "timestamp": NOW},
+    ]
+
+    lines = exporter.to_prometheus_lines(samples, {"a": "gauge", "b": "counter"})
+
+    assert lines == [
+        "# TYPE a gauge",
+        "a 2 1700000000000",
+        "# TYPE b counter",
+        'b{site="A"} 1 1700000000000',
+        'b{site="B"} 3 1700000000000',
+    ]
+
+
+def test_ndjson_lines_round_trip():
+    samples = _registry().snapshot(now=NOW)
+
+    assert [json.loads(line) for line in exporter.to_ndjson_lines(samples)] == samples
+
+
+def test_exporter_ships_in_batches():
+    sink = exporter.MemorySink()
+    metrics_exporter = exporter.MetricsExporter(_registry(), sink, batch_size=2)
+
+    collected = metrics_exporter.collect(now=NOW)
+    sent = metrics_exporter.flush()
+
+    assert sent == collected == 5
+    assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+    assert metrics_exporter.buffered() == 0
+
+
+@pytest.mark.parametrize("policy,kept_first", [("oldest", 2), ("newest", 0)])
+def test_bounded_buffer_drop_policy(policy, kept_first):
+    sink = exporter.MemorySink(fail=True)
+    registry = MetricsRegistry()
+    for i in range(5):
+        registry.counter(f"m{i}").inc(i)
+    metrics_exporter = exporter.MetricsExporter(
+        registry, sink, fmt="statsd", max_buffered_lines=3, drop_policy=policy
+    )
+
+    metrics_exporter.collect(now=NOW)
+    metrics_exporter.flush()
+
+    assert metrics_exporter.dropped == 2
+    assert metrics_exporter.send_failures == 1
+    assert metrics_exporter.buffered() == 3
+
+    sink.fail = False
+    metrics_exporter.flush()
+    assert sink.lines[0] == f"m{kept_first}:{kept_first}|g"
+
+
+def test_file_sink_and_background_stop(tmp_path):
+    path = tmp_path / "metrics.ndjson"
+    metrics_exporter = exporter.MetricsExporter(
+        _registry(), exporter.FileSink(str(path)), interval_seconds=60
+    )
+
+    metrics_exporter.start()
+    metrics_exporter.stop()
+
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_background_loop_survives_collect_errors():
+    registry = _registry()
+    metrics_exporter = exporter.MetricsExporter(registry, exporter.MemorySink(), interval_seconds=0.01)
+    real_snapshot = registry.snapshot
+    failures = [RuntimeError("snapshot failed")]
+
+    def flaky_snapshot(now=None):
+        if failures:
+            raise failures.pop()
+        return real_snapshot(now=now)
+
+    registry.snapshot = flaky_snapshot
+    metrics_exporter.start()
+    deadline = time.monotonic() + 5
+    while not metrics_exporter.sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    metrics_exporter.stop(final_flush=False)
+
+    assert metrics_exporter.export_failures == 1
+    assert metrics_exporter.sent > 0
+
+
+def test_udp_sink_packs_lines_into_datagrams():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(2)
+    sink = exporter.UdpSink("127.0.0.1", receiver.getsockname()[1], max_datagram_bytes=12)
+    try:
+        sink.send(["a:1|g", "b:2|g", "c:3|g"])
+        packets = [receiver.recv(100) for _ in range(2)]
+    finally:
+        sink.close()
+        receiver.close()
+
+    assert packets == [b"a:1|g\nb:2|g", b"c:3|g"]
@@ -0,0 +1,135 @@
+"""Tests for the concurrent health-check runner."""
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability import health
+
+
+@pytest.fixture
+def runner():
+    health_runner = health.HealthCheckRunner(ttl_seconds=60, timeout_seconds=1.0)
+    yield health_runner
+    health_runner.close()
+
+
+def test_run_matches_build_health_response_and_reports_latency(runner):
+    runner.register("db", lambda: True)
+    runner.register("queue", lambda: False)
+
+    response = runner.run()
+
+    assert response["status"] == "degraded"
+    assert response["checks"] == {"db": True, "queue": False}
+    assert all(latency >= 0 for latency in response["latency_ms"].values())
+
+
+def test_checks_run_concurrently(runner):
+    barrier = threading.Barrier(3, timeout=2)
+    for name in ("a", "b", "c"):
+        runner.register(name, lambda: barrier.wait() is not None)
+
+    assert runner.run()["status"] == "healthy"
+
+
+def test_results_cached_per_check_ttl(runner):
+    calls = {"fast": 0, "slow": 0}
+
+    def counted(name):
+        def check():
+            calls[name] += 1
+            return True
+        return check
+
+    runner.register("fast", counted("fast"), ttl_seconds=0)
+    runner.register("slow", counted("slow"))
+
+    runner.run()
+    runner.run()
+
+    assert calls == {"fast": 2, "slow": 1}
+
+
+def test_deadline_fails_hung_check_without_rerunning_it(runner):
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def hung():
+        calls["count"] += 1
+        return release.wait()
+
+    runner.register("hung", hung, timeout_seconds=0.05, ttl_seconds=0)
+    runner.register("ok", lambda: True)
+
+    started = time.monotonic()
+    first = runner.run()
+    second = runner.results()["hung"]
+    release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert first["checks"] == {"hung": False, "ok": True}
+    assert first["latency_ms"]["hung"] >= 50
+    assert second.healthy is False
+    assert second.error == "previous run still in progress"
+    assert calls["count"] == 1
+
+
+def test_probe_does_not_wait_on_another_probes_check(runner):
+    armed = threading.Event()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        if armed.is_set():
+            entered.set()
+            release.wait()
+        return True
+
+    runner.register("slow", slow, timeout_seconds=2.0, ttl_seconds=0)
+    runner.register("fast", lambda: True, ttl_seconds=0)
+    previous = runner.results()["slow"]
+
+    armed.set()
+    first_probe = threading.Thread(target=runner.results)
+    first_probe.start()
+    assert entered.wait(timeout=1)
+
+    started = time.monotonic()
+    second = runner.results()
+    elapsed = time.monotonic() - started
+    release.set()
+    first_probe.join(timeout=2)
+
+    assert elapsed < 0.5
+    assert second["slow"] is previous
+    assert second["fast"].healthy is True
+
+
+def test_raising_check_reports_error(runner):
+    def broken():
+        raise OSError("disk gone")
+
+    runner.register("disk", broken)
+
+    result = runner.results()["disk"]
+    assert result.healthy is False
+    assert "disk gone" in result.error
+
+
+def test_builtin_checks(tmp_path):
+    db_path = tmp_path / "alerts.db"
+    sqlite3.connect(db_path).close()
+
+    assert health.sqlite_check(str(db_path))() is True
+    with pytest.raises(sqlite3.OperationalError):
+        health.sqlite_check(str(tmp_path / "missing.db"))()
+    assert health.disk_space_check(str(tmp_path), 1)() is True
+    assert health.disk_space_check(str(tmp_path), 2**62)() is False
+    assert health.queue_depth_check(lambda: 3, max_depth=10)() is True
+    assert health.queue_depth_check(lambda: 10, max_depth=10)() is False
@@ -0,0 +1,55 @@
+"""Cold-start budget for the package entry points."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_import import (
+    HEAVY_MODULES,
+    IMPORT_BUDGET_MS,
+    measure_import,
+    parse_importtime,
+    run_import,
+)
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _json\n"
+        "import time:       300 |        420 | json\n"
+    )
+    assert parse_importtime(stderr) == {"_json": (120, 120), "json": (300, 420)}
+
+
+@pytest.mark.parametrize("module", sorted(HEAVY_MODULES))
+def test_entry_point_does_not_import_heavy_modules(module):
+    _, loaded = run_import(module)
+    assert [name for name in HEAVY_MODULES[module] if name in loaded] == []
+
+
+# Wall-clock timing is too noisy for shared CI runners, so it is opt-in:
+# RUN_IMPORT_BUDGET=1 pytest, or `python benchmarks/bench_import.py --check`.
+@pytest.mark.skipif(not os.getenv("RUN_IMPORT_BUDGET"), reason="set RUN_IMPORT_BUDGET=1 to time imports")
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_entry_point_import_time_within_budget(module):
+    result = measure_import(module, runs=3)
+    assert result["median_ms"] <= IMPORT_BUDGET_MS[module]
+
+
+def test_lazy_imports_still_resolve_on_use(monkeypatch):
+    import src.main as app
+
+    monkeypatch.setenv("PYTHON_DOTENV_DISABLED", "1")
+    monkeypatch.setenv("APP_ENV", "dev")
+    monkeypatch.setenv("DATABASE_URL", "alerts.db")
+    monkeypatch.setenv("API_TOKEN", "t")
+    from src.config.provider import reset_provider
+
+    reset_provider()
+    try:
+        assert app.load_settings().env == "dev"
+    finally:
+        reset_provider()
@@ -0,0 +1,68 @@
+"""Tests for the synthetic workload generator and ingest benchmark."""
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_ingest import PATHS, run_path
+from benchmarks.workload import generate_events
+from src.domain.models import Alert
+
+
+def _is_valid(event: dict) -> bool:
+    try:
+        Alert(severity="", **event)
+    except ValueError:
+        return False
+    return True
+
+
+def test_generator_is_deterministic_per_seed():
+    assert generate_events(200, seed=7) == generate_events(200, seed=7)
+    assert generate_events(200, seed=7) != generate_events(200, seed=8)
+
+
+def test_generator_honours_sites_mix_and_invalid_ratio():
+    events = generate_events(4000, seed=1, sites=10, type_mix={"LEAK": 3, "PRESSURE": 1},
+                             invalid_ratio=0.1)
+
+    assert len({event["site_id"] for event in events}) == 10
+    valid = [event for event in events if _is_valid(event)]
+    assert 0.07 < 1 - len(valid) / len(events) < 0.13
+    types = Counter(event["alert_type"] for event in valid)
+    assert set(types) == {"LEAK", "PRESSURE"}
+    assert 2 < types["LEAK"] / types["PRESSURE"] < 4
+
+
+def test_generator_bursts_repeat_one_site_in_one_second():
+    events = generate_events(60, seed=2, burst_every=10, burst_size=5)
+    per_second = Counter(event["timestamp"] for event in events)
+    burst_seconds = [ts for ts, count in per_second.items() if count == 6]
+
+    assert burst_seconds
+    burst = [event for event in events if event["timestamp"] == burst_seconds[0]]
+    assert len({event["site_id"] for event in burst}) == 1
+
+
+def test_generator_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        generate_events(10, invalid_ratio=1.5)
+    with pytest.raises(ValueError):
+        generate_events(10, type_mix={"EXPLOSION": 1})
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_run_path_reports_results(path, tmp_path):
+    events = generate_events(120, seed=3, invalid_ratio=0.1)
+    expected_valid = sum(_is_valid(event) for event in events)
+
+    result = run_path(path, events, str(tmp_path), batch_size=25, pool_size=2)
+
+    assert result["alerts"] == expected_valid
+    assert result["invalid"] == len(events) - expected_valid
+    assert result["ops_per_sec"] > 0
+    assert result["p50_us"] <= result["p99_us"]
+    assert result["db_bytes"] > 0
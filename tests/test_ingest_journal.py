@@ -0,0 +1,214 @@
+"""Tests for the append-only ingest journal and its applier."""
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.infrastructure.database import get_connection, initialize_database
+from src.infrastructure.journal import (
+    IngestJournal,
+    JournalApplier,
+    encode_record,
+    read_records,
+)
+from src.infrastructure.repositories import get_all_alerts, get_journal_checkpoint
+from src.observability.metrics import MetricsRegistry
+
+
+def _row(i: int) -> tuple:
+    return ("2026-01-01T00:00:00Z", f"SITE-{i}", "LEAK", "CRITICAL", 29.7, -95.3)
+
+
+@pytest.fixture
+def db(tmp_path):
+    conn = get_connection(str(tmp_path / "alerts.db"), check_same_thread=False)
+    initialize_database(conn)
+    yield conn
+    conn.close()
+
+
+def _journal(tmp_path, **kwargs):
+    kwargs.setdefault("registry", MetricsRegistry())
+    return IngestJournal(str(tmp_path / "journal"), **kwargs)
+
+
+def test_records_round_trip_and_stop_at_corruption(tmp_path):
+    path = tmp_path / "seg.journal"
+    good = encode_record(list(_row(1)))
+    bad = bytearray(encode_record(list(_row(2))))
+    bad[-1] ^= 0xFF
+    path.write_bytes(good + bytes(bad) + encode_record(list(_row(3))))
+
+    assert list(read_records(str(path))) == [(len(good), list(_row(1)))]
+
+
+def test_append_is_durable_and_applied(tmp_path, db):
+    registry = MetricsRegistry()
+    journal = _journal(tmp_path, registry=registry)
+    for i in range(3):
+        journal.append(_row(i))
+
+    assert journal.durable_position() == (1, os.path.getsize(journal.segment_path(1)))
+    applier = JournalApplier(journal, db, batch_size=2, registry=registry)
+    assert applier.apply_pending() == 3
+    assert [row[1] for row in get_all_alerts(db)] == ["SITE-0", "SITE-1", "SITE-2"]
+    assert get_journal_checkpoint(db) == journal.durable_position()
+    assert applier.apply_pending() == 0
+    assert registry.counter("journal.applied").value == 3
+    journal.close()
+
+
+def test_unsynced_records_are_not_applied_until_sync(tmp_path, db):
+    journal = _journal(tmp_path)
+    journal.append(_row(1), wait=False)
+    applier = JournalApplier(journal, db)
+
+    assert applier.apply_pending() == 0
+    journal.sync()
+    assert applier.apply_pending() == 1
+    journal.close()
+
+
+def test_concurrent_appends_share_fsyncs(tmp_path, monkeypatch):
+    registry = MetricsRegistry()
+    journal = _journal(tmp_path, registry=registry)
+    fsyncs = registry.counter("journal.fsyncs")
+    before = fsyncs.value
+    real_fsync = os.fsync
+
+    def slow_fsync(fd):
+        # A slow disk: appenders pile up behind the in-flight fsync.
+        time.sleep(0.005)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    threads_count, per_thread = 8, 25
+    barrier = threading.Barrier(threads_count)
+
+    def append_rows(n):
+        barrier.wait()
+        for i in range(per_thread):
+            journal.append(_row(n * 100 + i))
+
+    threads = [threading.Thread(target=append_rows, args=(n,)) for n in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    appends = threads_count * per_thread
+    assert len(list(read_records(journal.segment_path(1)))) == appends
+    assert fsyncs.value - before < appends / 2
+    journal.close()
+
+
+def test_segments_roll_and_applied_ones_are_removed(tmp_path, db):
+    journal = _journal(tmp_path, max_segment_bytes=200)
+    for i in range(10):
+        journal.append(_row(i))
+    assert len(journal.segments()) > 2
+
+    JournalApplier(journal, db, batch_size=3).apply_pending()
+
+    assert len(get_all_alerts(db)) == 10
+    assert journal.segments() == [journal.durable_position()[0]]
+    journal.close()
+
+
+def test_corrupt_sealed_segment_is_kept_and_not_skipped(tmp_path, db):
+    journal = _journal(tmp_path, max_segment_bytes=200)
+    for i in range(6):
+        journal.append(_row(i))
+    first = journal.segment_path(1)
+    assert len(journal.segments()) > 1
+    with open(first, "r+b") as fh:
+        fh.seek(-1, os.SEEK_END)
+        last = fh.read(1)
+        fh.seek(-1, os.SEEK_END)
+        fh.write(bytes([last[0] ^ 0xFF]))
+
+    applier = JournalApplier(journal, db)
+    with pytest.raises(ValueError, match="corrupt record"):
+        applier.apply_pending()
+
+    assert os.path.exists(first)
+    assert get_journal_checkpoint(db)[0] == 1
+    journal.close()
+
+
+def test_background_applier_logs_failures(tmp_path, db, monkeypatch):
+    from src.infrastructure import journal as journal_module
+
+    logged = threading.Event()
+    monkeypatch.setattr(journal_module.logger, "exception", lambda *a, **k: logged.set())
+    journal = _journal(tmp_path)
+    applier = JournalApplier(journal, db, interval_seconds=0.01)
+    monkeypatch.setattr(applier, "apply_pending", lambda: 1 / 0)
+    applier._stop.clear()
+    thread = threading.Thread(target=applier._run, daemon=True)
+    thread.start()
+    try:
+        assert logged.wait(timeout=2)
+    finally:
+        applier._stop.set()
+        thread.join()
+        journal.close()
+
+
+def test_recovery_truncates_torn_tail_and_replays(tmp_path, db):
+    journal = _journal(tmp_path)
+    for i in range(4):
+        journal.append(_row(i))
+    applier = JournalApplier(journal, db, batch_size=10)
+    applier.apply_pending()
+    journal.append(_row(4))
+    journal.append(_row(5))
+    journal.close()
+
+    # Crash mid-append: a partial record at the end of the segment.
+    path = journal.segment_path(1)
+    with open(path, "ab") as fh:
+        fh.write(encode_record(list(_row(6)))[:10])
+
+    reopened = _journal(tmp_path)
+    assert reopened.truncated_bytes == 10
+    assert JournalApplier(reopened, db).apply_pending() == 2
+    assert [row[1] for row in get_all_alerts(db)] == [f"SITE-{i}" for i in range(6)]
+
+    reopened.append(_row(7))
+    assert JournalApplier(reopened, db).apply_pending() == 1
+    reopened.close()
+
+
+def test_background_applier_catches_up(tmp_path, db):
+    journal = _journal(tmp_path)
+    applier = JournalApplier(journal, db, interval_seconds=0.01)
+    applier.start()
+    try:
+        logger = app.build_logger("INFO", stream=io.StringIO())
+        for i in range(5):
+            app.accept_alert_event(journal, logger, "2026-01-01T00:00:00Z", f"SITE-{i}",
+                                   "LEAK", 29.7, -95.3)
+    finally:
+        applier.stop()
+        journal.close()
+
+    rows = get_all_alerts(db)
+    assert len(rows) == 5
+    assert rows[0][3] == "CRITICAL"
+
+
+def test_accept_rejects_invalid_events_before_journaling(tmp_path):
+    journal = _journal(tmp_path)
+    logger = app.build_logger("INFO", stream=io.StringIO())
+    with pytest.raises(Exception):
+        app.accept_alert_event(journal, logger, "2026-01-01T00:00:00Z", "SITE-1", "LEAK",
+                               95.0, -95.3)
+    assert journal.durable_position() == (1, 0)
+    journal.close()
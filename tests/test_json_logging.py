@@ -0,0 +1,103 @@
+"""Tests for the structured JSON log formatter."""
+import io
+import json
+import logging
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.infrastructure.database import initialize_database
+from src.observability.context import correlation_scope
+from src.observability.logs import JsonFormatter
+
+
+def _records(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_logger_emits_one_object_per_record_with_extra_fields():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream, log_format="json")
+
+    with correlation_scope("req-1"):
+        logger.info("alert_recorded", extra={"site_id": "SITE_001", "ignored": "x"})
+    logger.debug("hidden")
+
+    [record] = _records(stream)
+    assert record["level"] == "INFO"
+    assert record["message"] == "alert_recorded"
+    assert record["site_id"] == "SITE_001"
+    assert record["correlation_id"] == "req-1"
+    assert "ignored" not in record
+    assert len(record["ts"]) == len("2024-01-26T10:00:00")
+
+
+def test_json_formatter_includes_exceptions():
+    formatter = JsonFormatter()
+    try:
+        raise RuntimeError("database write failed")
+    except RuntimeError:
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.ERROR, __file__, 1, "alert_processing_failed", None, sys.exc_info()
+        )
+
+    data = json.loads(formatter.format(record))
+    assert data["message"] == "alert_processing_failed"
+    assert "RuntimeError: database write failed" in data["exc"]
+
+
+def test_invalid_log_format_rejected():
+    with pytest.raises(ValueError):
+        app.build_logger("INFO", stream=io.StringIO(), log_format="xml")
+
+
+def test_invalid_arguments_keep_the_existing_handlers():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream)
+    with pytest.raises(ValueError):
+        app.build_logger("INFO", stream=io.StringIO(), log_format="xml")
+    with pytest.raises(ValueError):
+        app.build_logger("INFO", stream=io.StringIO(), queue_size=10, queue_policy="spill")
+
+    logger.info("still_logging")
+    assert "still_logging" in stream.getvalue()
+
+
+def test_json_timestamp_cache_tracks_the_second():
+    formatter = JsonFormatter()
+    assert formatter._timestamp(0.0) == formatter._timestamp(0.9)
+    assert formatter._timestamp(1.0) != formatter._timestamp(0.0)
+    assert formatter._cached[0] == 0
+
+
+def test_process_alert_event_logs_structured_fields():
+    stream = io.StringIO()
+    logger = app.build_logger("DEBUG", stream=stream, log_format="json")
+    conn = sqlite3.connect(":memory:")
+    initialize_database(conn)
+
+    app.process_alert_event(
+        conn,
+        logger,
+        timestamp="2024-01-26T10:00:00Z",
+        site_id="SITE_001",
+        alert_type="LEAK",
+        latitude=29.7604,
+        longitude=-95.3698,
+    )
+
+    processing, recorded = _records(stream)
+    assert processing["message"].startswith("processing_alert")
+    assert recorded == {
+        "ts": recorded["ts"],
+        "level": "INFO",
+        "message": "alert_recorded",
+        "site_id": "SITE_001",
+        "alert_type": "LEAK",
+        "severity": "CRITICAL",
+    }
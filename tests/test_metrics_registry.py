@@ -0,0 +1,70 @@
+"""Tests for the in-process metrics registry."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability.metrics import MetricsRegistry
+
+NOW = 1_700_000_000
+
+
+def _by_name(samples: list[dict]) -> dict:
+    return {(s["name"], tuple(sorted(s["tags"].items()))): s for s in samples}
+
+
+def test_handles_are_resolved_once_per_name_and_tags():
+    registry = MetricsRegistry()
+
+    a = registry.counter("alerts.recorded", {"site": "A"})
+    b = registry.counter("alerts.recorded", {"site": "A"})
+    c = registry.counter("alerts.recorded", {"site": "B"})
+
+    assert a is b
+    assert a is not c
+
+
+def test_name_reused_with_different_kind_rejected():
+    registry = MetricsRegistry()
+    registry.counter("queue.depth")
+
+    with pytest.raises(ValueError):
+        registry.gauge("queue.depth")
+
+
+def test_snapshot_uses_record_metric_shape():
+    registry = MetricsRegistry()
+    registry.counter("alerts.recorded", {"site": "A"}).inc(3)
+    gauge = registry.gauge("queue.depth", unit="items")
+    gauge.set(10)
+    gauge.dec(4)
+
+    samples = _by_name(registry.snapshot(now=NOW))
+
+    counter = samples[("alerts.recorded", (("site", "A"),))]
+    assert counter == {
+        "name": "alerts.recorded",
+        "value": 3,
+        "unit": "count",
+        "tags": {"site": "A"},
+        "timestamp": NOW,
+    }
+    assert samples[("queue.depth", ())]["value"] == 6
+    assert samples[("queue.depth", ())]["unit"] == "items"
+
+
+def test_histogram_exports_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("ingest.latency", buckets=(1.0, 10.0))
+    for value in (0.5, 1.0, 5.0, 50.0):
+        histogram.observe(value)
+
+    samples = _by_name(registry.snapshot(now=NOW))
+
+    assert samples[("ingest.latency.count", ())]["value"] == 4
+    assert samples[("ingest.latency.sum", ())]["value"] == pytest.approx(56.5)
+    assert samples[("ingest.latency.bucket", (("le", "1.0"),))]["value"] == 2
+    assert samples[("ingest.latency.bucket", (("le", "10.0"),))]["value"] == 3
+    assert samples[("ingest.latency.bucket", (("le", "+Inf"),))]["value"] == 4
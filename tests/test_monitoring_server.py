@@ -0,0 +1,115 @@
+"""Tests for the /health and /metrics HTTP endpoint."""
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability.metrics import MetricsRegistry
+from src.observability.server import MonitoringServer
+
+
+@pytest.fixture
+def server():
+    registry = MetricsRegistry()
+    registry.counter("alerts.recorded", {"site": "A"}).inc(2)
+    monitoring = MonitoringServer(registry=registry, health_ttl_seconds=60)
+    yield monitoring
+    monitoring.stop()
+
+
+def _get(server: MonitoringServer, path: str):
+    host, port = server.address
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=5) as response:
+            return response.status, response.headers["Content-Type"], response.read().decode()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers["Content-Type"], exc.read().decode()
+
+
+def test_health_endpoint_reports_status(server):
+    server.add_check("db", lambda: True)
+    server.add_check("disk", lambda: False)
+    server.start()
+
+    status, content_type, body = _get(server, "/health")
+
+    assert status == 503
+    assert content_type == "application/json"
+    response = json.loads(body)
+    assert response["status"] == "degraded"
+    assert response["checks"] == {"db": True, "disk": False}
+    assert set(response["latency_ms"]) == {"db", "disk"}
+
+
+def test_health_results_are_cached(server):
+    calls = {"count": 0}
+
+    def check():
+        calls["count"] += 1
+        return True
+
+    server.add_check("db", check)
+    server.start()
+
+    assert _get(server, "/health")[0] == 200
+    assert _get(server, "/health")[0] == 200
+    assert calls["count"] == 1
+
+
+def test_slow_and_failing_checks_do_not_block_probe(server):
+    release = threading.Event()
+
+    def raises():
+        raise RuntimeError("boom")
+
+    server.add_check("slow", release.wait, timeout_seconds=0.1)
+    server.add_check("broken", raises)
+    server.start()
+
+    started = time.monotonic()
+    status, _, body = _get(server, "/health")
+    release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert status == 503
+    assert json.loads(body)["checks"] == {"slow": False, "broken": False}
+
+
+def test_metrics_endpoint_serves_text_exposition(server):
+    server.start()
+
+    status, content_type, body = _get(server, "/metrics")
+
+    assert status == 200
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE alerts_recorded counter" in body
+    assert 'alerts_recorded{site="A"} 2' in body
+
+
+def test_unknown_path_returns_404(server):
+    server.start()
+
+    assert _get(server, "/nope")[0] == 404
+
+
+def test_server_can_restart_after_stop():
+    server = MonitoringServer(registry=MetricsRegistry(), health_ttl_seconds=0)
+    server.add_check("ok", lambda: True)
+    try:
+        server.start()
+        assert _get(server, "/health")[0] == 200
+        server.stop()
+
+        server.start()
+        status, _, body = _get(server, "/health")
+        assert status == 200
+        assert json.loads(body)["checks"] == {"ok": True}
+    finally:
+        server.stop()
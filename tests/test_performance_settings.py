@@ -0,0 +1,197 @@
+"""Tests for the performance section of Settings and its wiring."""
+import io
+import logging
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.domain.processor import classify_alert
+from src.config.settings import PERFORMANCE_ENV_VARS, PerformanceSettings, Settings
+from src.infrastructure.database import get_connection, initialize_database
+from src.infrastructure.repositories import get_all_alerts, insert_alerts
+
+REQUIRED = {"APP_ENV": "dev", "DATABASE_URL": "alerts.db", "API_TOKEN": "t"}
+
+
+@pytest.fixture
+def perf_env(monkeypatch):
+    monkeypatch.setenv("PYTHON_DOTENV_DISABLED", "1")
+    for key, value in REQUIRED.items():
+        monkeypatch.setenv(key, value)
+    for key in PERFORMANCE_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+def _event(site_id="SITE-1", latitude=29.7):
+    return {
+        "timestamp": "2026-01-01T00:00:00Z",
+        "site_id": site_id,
+        "alert_type": "PRESSURE",
+        "latitude": latitude,
+        "longitude": -95.3,
+    }
+
+
+def _logger():
+    return app.build_logger("DEBUG", stream=io.StringIO())
+
+
+def test_defaults_keep_previous_behavior(perf_env):
+    perf = Settings.from_env().performance
+    assert perf == PerformanceSettings()
+    assert perf.max_retries == 2
+    assert perf.log_queue_size == 0
+    assert perf.sqlite_journal_mode is None
+
+
+def test_from_env_reads_and_normalizes_knobs(perf_env):
+    perf_env.setenv("INGEST_BATCH_SIZE", "50")
+    perf_env.setenv("INGEST_MAX_RETRIES", "0")
+    perf_env.setenv("SQLITE_JOURNAL_MODE", "wal")
+    perf_env.setenv("SQLITE_SYNCHRONOUS", "normal")
+    perf = Settings.from_env().performance
+    assert perf.batch_size == 50
+    assert perf.max_retries == 0
+    assert perf.sqlite_journal_mode == "WAL"
+    assert perf.sqlite_synchronous == "NORMAL"
+
+
+@pytest.mark.parametrize("name,value", [
+    ("INGEST_BATCH_SIZE", "0"),
+    ("INGEST_MAX_RETRIES", "-1"),
+    ("INGEST_POOL_SIZE", "many"),
+    ("SQLITE_JOURNAL_MODE", "FAST"),
+    ("SQLITE_SYNCHRONOUS", "SOMETIMES"),
+])
+def test_invalid_knobs_are_rejected(perf_env, name, value):
+    perf_env.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings.from_env()
+
+
+def test_performance_settings_are_frozen():
+    with pytest.raises(ValidationError):
+        PerformanceSettings().batch_size = 1
+
+
+def test_get_connection_applies_pragmas(tmp_path):
+    conn = get_connection(str(tmp_path / "a.db"), busy_timeout_ms=250, journal_mode="WAL",
+                          synchronous="NORMAL", cache_size_kib=4096)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4096
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 250
+    finally:
+        conn.close()
+
+
+def test_insert_alerts_rolls_back_whole_batch():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    row = ("2026-01-01T00:00:00Z", "SITE-1", "PRESSURE", "HIGH", 29.7, -95.3)
+    with pytest.raises(Exception):
+        insert_alerts(conn, [row, row[:5]])
+    assert get_all_alerts(conn) == []
+
+
+def test_process_alert_batch_chunks_and_skips_invalid(monkeypatch):
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    calls = []
+    real_insert = app.insert_alerts
+
+    def counting_insert(c, rows):
+        calls.append(len(rows))
+        real_insert(c, rows)
+
+    monkeypatch.setattr(app, "insert_alerts", counting_insert)
+    events = [_event(f"SITE-{i}") for i in range(5)] + [_event("BAD", latitude=95.0)]
+    alerts, rejected = app.process_alert_batch(conn, _logger(), events, batch_size=2)
+
+    assert calls == [2, 2, 1]
+    assert [a.site_id for a in alerts] == [f"SITE-{i}" for i in range(5)]
+    assert rejected == [events[-1]]
+    assert len(get_all_alerts(conn)) == 5
+
+
+def test_process_alert_batch_rejects_malformed_events_and_ignores_severity():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    with_severity = dict(_event("SITE-S"), severity="LOW")
+    malformed = ["not-a-mapping", {1: "non-string key"}]
+
+    alerts, rejected = app.process_alert_batch(conn, _logger(), [with_severity, *malformed])
+
+    assert [(a.site_id, a.severity) for a in alerts] == [("SITE-S", classify_alert("PRESSURE"))]
+    assert rejected == malformed
+
+
+def test_process_alert_batch_retries_chunk(monkeypatch):
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    real_insert = app.insert_alerts
+    failures = [RuntimeError("locked")]
+
+    def flaky_insert(c, rows):
+        if failures:
+            raise failures.pop()
+        real_insert(c, rows)
+
+    monkeypatch.setattr(app, "insert_alerts", flaky_insert)
+    alerts, _ = app.process_alert_batch(conn, _logger(), [_event()], max_retries=1)
+    assert len(alerts) == 1
+    assert len(get_all_alerts(conn)) == 1
+
+
+def test_ingest_events_uses_settings(perf_env, tmp_path):
+    db_path = tmp_path / "alerts.db"
+    perf_env.setenv("DATABASE_URL", str(db_path))
+    perf_env.setenv("INGEST_BATCH_SIZE", "3")
+    perf_env.setenv("INGEST_POOL_SIZE", "2")
+    perf_env.setenv("SQLITE_JOURNAL_MODE", "WAL")
+    settings = Settings.from_env()
+
+    events = [_event(f"SITE-{i}") for i in range(10)]
+    alerts, rejected = app.ingest_events(settings, _logger(), events)
+    assert len(alerts) == 10 and rejected == []
+
+    conn = app.open_connection(settings)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert len(get_all_alerts(conn)) == 10
+    finally:
+        conn.close()
+
+
+def test_build_logger_from_settings_uses_queue_size(perf_env):
+    perf_env.setenv("LOG_QUEUE_SIZE", "16")
+    logger = app.build_logger_from_settings(Settings.from_env(), stream=io.StringIO())
+    try:
+        assert type(logger.handlers[0]).__name__ == "BoundedQueueHandler"
+    finally:
+        app.build_logger("INFO", stream=io.StringIO())
+
+    perf_env.setenv("LOG_QUEUE_SIZE", "0")
+    logger = app.build_logger_from_settings(Settings.from_env(), stream=io.StringIO())
+    assert isinstance(logger.handlers[0], logging.StreamHandler)
+
+
+def test_retry_policy_from_settings(perf_env):
+    perf_env.setenv("INGEST_MAX_RETRIES", "4")
+    perf_env.setenv("INGEST_RETRY_BASE_DELAY_MS", "20")
+    perf_env.setenv("INGEST_RETRY_DEADLINE_MS", "1500")
+    policy = app.retry_policy_from_settings(Settings.from_env())
+    assert policy.max_retries == 4
+    assert policy.base_delay_seconds == 0.02
+    assert policy.deadline_seconds == 1.5
+
+    perf_env.setenv("INGEST_RETRY_MAX_DELAY_MS", "5")
+    with pytest.raises(ValidationError):
+        Settings.from_env()
@@ -0,0 +1,179 @@
+"""Tests for stage totals and the opt-in profilers."""
+import gc
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.config.settings import PerformanceSettings, Settings
+from src.infrastructure.database import get_connection, initialize_database
+from src.observability import profiling, tracing
+from src.observability.metrics import MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def clean_totals():
+    tracing.reset_stage_totals()
+    yield
+    tracing.reset_stage_totals()
+
+
+def _busy_loop_marker(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+def test_stage_totals_accumulate_without_sampling():
+    assert tracing.get_sample_rate() == 0
+    for _ in range(3):
+        with tracing.timed("stage.a"):
+            time.sleep(0.001)
+
+    calls, total_ns = tracing.stage_totals()["stage.a"]
+    assert calls == 3
+    assert total_ns >= 3_000_000
+
+
+def test_decorated_functions_feed_stage_totals():
+    @tracing.timed("stage.decorated")
+    def work():
+        return 42
+
+    assert work() == 42
+    assert tracing.stage_totals()["stage.decorated"][0] == 1
+
+
+def test_process_alert_event_records_every_stage():
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    logger = app.build_logger("INFO", stream=io.StringIO())
+    app.process_alert_event(conn, logger, "2026-01-01T00:00:00Z", "SITE-1", "LEAK", 29.7, -95.3)
+
+    summary = profiling.stage_summary()
+    for stage in ("ingest.process_alert", "ingest.validate", "ingest.classify",
+                  "ingest.persist", "ingest.log"):
+        assert summary[stage]["calls"] == 1
+    assert summary["ingest.process_alert"]["total_ms"] >= summary["ingest.persist"]["total_ms"]
+
+
+def test_stage_totals_count_every_call_across_threads():
+    barrier = threading.Barrier(8)
+
+    def work():
+        barrier.wait()
+        for _ in range(2000):
+            with tracing.timed("stage.threaded"):
+                pass
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    del threads, thread
+    gc.collect()  # finished threads fold their tables into the retired totals
+
+    assert tracing.stage_totals()["stage.threaded"][0] == 16_000
+
+
+def test_publish_stage_totals_sets_gauges():
+    registry = MetricsRegistry()
+    with tracing.timed("stage.b"):
+        pass
+    profiling.publish_stage_totals(registry)
+
+    assert registry.gauge("stage.calls", {"stage": "stage.b"}).value == 1
+    assert registry.gauge("stage.total_ms", {"stage": "stage.b"}, unit="ms").value >= 0
+
+
+def test_stack_sampler_sees_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop_marker, args=(stop,))
+    worker.start()
+    sampler = profiling.StackSampler(interval_seconds=0.001)
+    try:
+        for _ in range(20):
+            sampler.sample()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert sampler.samples == 20
+    assert any("_busy_loop_marker" in line for line in sampler.collapsed_lines())
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in sampler.collapsed_lines())
+
+
+def test_profile_for_writes_collapsed_stacks_and_stages(tmp_path):
+    done = []
+    thread = profiling.profile_for(0.05, str(tmp_path), interval_seconds=0.005, on_done=done.append)
+    assert profiling.profile_for(0.05, str(tmp_path)) is None  # one session at a time
+    thread.join()
+
+    assert done and done[0].endswith(".collapsed")
+    assert os.path.exists(done[0])
+    assert os.path.exists(done[0].replace(".collapsed", ".stages.json"))
+
+
+def test_profile_for_logs_output_errors(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    logged = []
+    monkeypatch.setattr(profiling.logger, "exception", lambda msg, *args: logged.append(msg))
+    done = []
+
+    thread = profiling.profile_for(0.01, str(blocker / "out"), interval_seconds=0.005,
+                                   on_done=done.append)
+    thread.join()
+
+    assert logged and logged[0].startswith("profile_session_failed")
+    assert done == []
+    assert profiling.profile_for(0.01, str(tmp_path)).join() is None  # lock released
+
+
+def test_cprofile_section_dumps_pstats(tmp_path):
+    path = str(tmp_path / "run.pstats")
+    with profiling.cprofile_section(path):
+        sorted(range(1000), key=lambda x: -x)
+
+    stats = pstats.Stats(path)
+    assert stats.total_calls > 0
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_signal_starts_a_profile_session(tmp_path):
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert profiling.install_signal_handler(0.02, str(tmp_path), 0.005)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        deadline = time.monotonic() + 5
+        while not list(tmp_path.glob("*.stages.json")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert list(tmp_path.glob("*.collapsed"))
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+
+def test_start_profiling_follows_settings(tmp_path):
+    base = {"env": "test", "database_url": "x.db", "api_token": "t"}
+    off = Settings(**base)
+    assert app.start_profiling(off) is False
+
+    if not hasattr(signal, "SIGUSR1"):
+        pytest.skip("needs SIGUSR1")
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        on = Settings(**base, performance=PerformanceSettings(profile_mode="SIGNAL",
+                                                               profile_dir=str(tmp_path)))
+        assert on.performance.profile_mode == "signal"
+        assert app.start_profiling(on) is True
+        assert signal.getsignal(signal.SIGUSR1) is not previous
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
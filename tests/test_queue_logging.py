@@ -0,0 +1,118 @@
+"""Tests for queue-based (non-blocking) logging."""
+import io
+import logging
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.observability.context import correlation_scope
+from src.observability.logs import BoundedQueueHandler
+
+
+class _GatedStream(io.StringIO):
+    """A stream whose writes wait until `gate` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def write(self, text):
+        self.gate.wait(timeout=5)
+        return super().write(text)
+
+
+def _close(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        handler.close()
+    logger.handlers.clear()
+
+
+def test_queued_logger_keeps_format_and_correlation_id():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream, queue_size=100)
+
+    logger.debug("hidden")
+    logger.info("hello")
+    with correlation_scope("req-1"):
+        logger.info("scoped")
+    _close(logger)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].split(",", 2)[1:] == ["INFO", "hello"]
+    assert lines[1].endswith(",scoped correlation_id=req-1")
+
+
+def test_full_queue_drops_and_counts():
+    stream = _GatedStream()
+    logger = app.build_logger("INFO", stream=stream, queue_size=2)
+    handler = logger.handlers[0]
+    assert isinstance(handler, BoundedQueueHandler)
+
+    for i in range(20):
+        logger.info("event %s", i)
+    dropped = handler.dropped
+    stream.gate.set()
+    _close(logger)
+
+    written = stream.getvalue().count("event")
+    assert dropped > 0
+    assert written + dropped == 20
+
+
+def test_unbounded_queue_size_rejected():
+    for maxsize in (0, -1):
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(maxsize)
+
+
+def test_block_policy_never_drops():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream, queue_size=1, queue_policy="block")
+    handler = logger.handlers[0]
+
+    for i in range(200):
+        logger.info("event %s", i)
+    _close(logger)
+
+    assert handler.dropped == 0
+    assert stream.getvalue().count("event") == 200
+
+
+def test_rebuilding_logger_stops_previous_listener():
+    logger = app.build_logger("INFO", stream=io.StringIO(), queue_size=10)
+    listener_thread = logger.handlers[0].listener._thread
+
+    app.build_logger("INFO", stream=io.StringIO())
+
+    assert not listener_thread.is_alive()
+
+
+def test_invalid_level_starts_no_listener():
+    before = {thread.ident for thread in threading.enumerate()}
+
+    with pytest.raises(ValueError):
+        app.build_logger("LOUD", stream=io.StringIO(), queue_size=10)
+
+    assert {thread.ident for thread in threading.enumerate()} <= before
+
+
+def test_queued_logger_renders_tracebacks():
+    stream = io.StringIO()
+    logger = app.build_logger("INFO", stream=stream, queue_size=10)
+
+    try:
+        raise RuntimeError("database write failed")
+    except RuntimeError:
+        logger.exception("alert_processing_failed")
+    _close(logger)
+
+    output = stream.getvalue()
+    assert "ERROR,alert_processing_failed" in output
+    assert "Traceback" in output
+    assert "database write failed" in output
@@ -0,0 +1,183 @@
+"""Tests for the persistence retry policy."""
+import io
+import os
+import sqlite3
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.domain.models import Alert
+from src.infrastructure.database import get_connection, initialize_database
+from src.infrastructure.retry import RetryPolicy, is_retryable
+from src.observability.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def __call__(self):
+        return self.now
+
+
+def _policy(registry, clock, **kwargs):
+    kwargs.setdefault("rng", lambda: 1.0)
+    return RetryPolicy(registry=registry, sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def _flaky(errors):
+    calls = []
+
+    def fn(attempt):
+        calls.append(attempt)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return fn, calls
+
+
+def _invalid_alert_error():
+    with pytest.raises(ValidationError) as info:
+        Alert(timestamp="t", site_id="S", alert_type="LEAK", severity="", latitude=95, longitude=0)
+    return info.value
+
+
+@pytest.mark.parametrize("exc,expected", [
+    (sqlite3.OperationalError("database is locked"), True),
+    (sqlite3.OperationalError("database table is locked"), True),
+    (sqlite3.OperationalError("no such table: alerts"), False),
+    (sqlite3.IntegrityError("UNIQUE constraint failed"), False),
+    (ValueError("bad value"), False),
+    (RuntimeError("temporary failure"), True),
+])
+def test_is_retryable(exc, expected):
+    assert is_retryable(exc) is expected
+
+
+def test_validation_errors_are_permanent():
+    assert is_retryable(_invalid_alert_error()) is False
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    clock = FakeClock()
+    policy = _policy(MetricsRegistry(), clock, max_retries=5, base_delay_seconds=0.01,
+                     max_delay_seconds=0.05)
+    fn, calls = _flaky([sqlite3.OperationalError("database is locked")] * 5)
+
+    assert policy.call(fn) == "ok"
+    assert calls == [0, 1, 2, 3, 4, 5]
+    assert clock.sleeps == pytest.approx([0.01, 0.02, 0.04, 0.05, 0.05])
+
+
+def test_jitter_scales_delay():
+    policy = RetryPolicy(base_delay_seconds=0.1, rng=lambda: 0.25)
+    assert policy.delay(0) == pytest.approx(0.025)
+    assert policy.delay(1) == pytest.approx(0.05)
+
+
+def test_permanent_error_is_not_retried():
+    registry = MetricsRegistry()
+    clock = FakeClock()
+    fn, calls = _flaky([sqlite3.IntegrityError("NOT NULL constraint failed")])
+
+    with pytest.raises(sqlite3.IntegrityError):
+        _policy(registry, clock).call(fn)
+
+    assert calls == [0]
+    assert clock.sleeps == []
+    give_ups = registry.counter("retry.give_ups", {"operation": "persist", "reason": "permanent"})
+    assert give_ups.value == 1
+
+
+def test_exhaustion_reraises_and_counts():
+    registry = MetricsRegistry()
+    clock = FakeClock()
+    fn, calls = _flaky([RuntimeError("down")] * 3)
+    retries = []
+
+    with pytest.raises(RuntimeError):
+        _policy(registry, clock, max_retries=2).call(fn, lambda *args: retries.append(args[0]))
+
+    assert calls == [0, 1, 2]
+    assert retries == [1, 2]
+    tags = {"operation": "persist"}
+    assert registry.counter("retry.attempts", tags).value == 2
+    assert registry.histogram("retry.backoff_ms", tags).count == 2
+    assert registry.counter("retry.give_ups", {**tags, "reason": "exhausted"}).value == 1
+
+
+def test_deadline_stops_retrying_early():
+    registry = MetricsRegistry()
+    clock = FakeClock()
+    policy = _policy(registry, clock, max_retries=10, base_delay_seconds=0.1,
+                     max_delay_seconds=1.0, deadline_seconds=0.25)
+    fn, calls = _flaky([RuntimeError("down")] * 10)
+
+    with pytest.raises(RuntimeError):
+        policy.call(fn)
+
+    # Sleeps of 0.1 then 0.2 would end at 0.3 > 0.25, so only one retry.
+    assert clock.sleeps == pytest.approx([0.1])
+    assert calls == [0, 1]
+    assert registry.counter(
+        "retry.give_ups", {"operation": "persist", "reason": "deadline"}
+    ).value == 1
+
+
+def test_invalid_policy_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay_seconds=1.0, max_delay_seconds=0.5)
+
+
+def test_process_alert_event_does_not_retry_permanent_errors(monkeypatch):
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    stream = io.StringIO()
+    logger = app.build_logger("DEBUG", stream=stream)
+    calls = []
+
+    def failing_insert(*args):
+        calls.append(args)
+        raise sqlite3.IntegrityError("CHECK constraint failed")
+
+    monkeypatch.setattr(app, "insert_alert", failing_insert)
+    with pytest.raises(sqlite3.IntegrityError):
+        app.process_alert_event(conn, logger, "2024-01-26T10:00:00Z", "SITE_1", "LEAK",
+                                29.7, -95.3, max_retries=3)
+
+    assert len(calls) == 1
+    assert "retrying_persist" not in stream.getvalue()
+    assert "alert_processing_failed" in stream.getvalue()
+
+
+def test_process_alert_event_uses_given_policy(monkeypatch):
+    conn = get_connection(":memory:")
+    initialize_database(conn)
+    clock = FakeClock()
+    real_insert = app.insert_alert
+    errors = [sqlite3.OperationalError("database is locked")] * 2
+
+    def locked_insert(*args):
+        if errors:
+            raise errors.pop()
+        real_insert(*args)
+
+    monkeypatch.setattr(app, "insert_alert", locked_insert)
+    policy = _policy(MetricsRegistry(), clock, max_retries=2, base_delay_seconds=0.05)
+    app.process_alert_event(conn, app.build_logger("INFO", stream=io.StringIO()),
+                            "2024-01-26T10:00:00Z", "SITE_1", "LEAK", 29.7, -95.3,
+                            retry_policy=policy)
+
+    assert clock.sleeps == pytest.approx([0.05, 0.1])
@@ -0,0 +1,136 @@
+"""Tests for compiled scope policies."""
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.security import auth
+from src.security.scopes import RoutePolicies, ScopePolicy, ScopeRegistry
+
+
+@pytest.mark.parametrize(
+    "claims,required",
+    [
+        ({"scope": "alerts:read alerts:write"}, {"alerts:read"}),
+        ({"scope": "alerts:read alerts:write"}, {"admin:write"}),
+        ({"scope": "alerts:read"}, {"alerts:read", "alerts:write"}),
+        ({"scopes": ["alerts:read", "admin:write"]}, {"admin:write"}),
+        ({}, {"alerts:read"}),
+        ({"scope": "alerts:read"}, set()),
+    ],
+)
+def test_all_of_policy_matches_token_has_required_scopes(claims, required):
+    policy = ScopePolicy(ScopeRegistry(), all_of=required)
+
+    assert policy.allows(claims) is auth.token_has_required_scopes(claims, required)
+
+
+def test_any_of_groups_require_one_scope_per_group():
+    policy = ScopePolicy(
+        ScopeRegistry(),
+        all_of={"alerts:read"},
+        any_of=[{"sites:north", "sites:south"}],
+    )
+
+    assert policy.allows({"scope": "alerts:read sites:south"}) is True
+    assert policy.allows({"scope": "alerts:read"}) is False
+    assert policy.allows({"scope": "sites:north"}) is False
+
+
+def test_empty_any_of_group_rejected():
+    with pytest.raises(ValueError):
+        ScopePolicy(ScopeRegistry(), any_of=[set()])
+
+
+def test_granted_mask_cached_and_refreshed_when_new_scope_interned():
+    registry = ScopeRegistry()
+    read_policy = ScopePolicy(registry, all_of={"alerts:read"})
+    claims = {"scope": "alerts:read alerts:write"}
+
+    assert read_policy.allows(claims) is True
+    write_policy = ScopePolicy(registry, all_of={"alerts:write"})
+
+    assert write_policy.allows(claims) is True
+    assert len(registry) == 2
+
+
+def test_unknown_granted_scopes_are_not_interned():
+    registry = ScopeRegistry()
+    ScopePolicy(registry, all_of={"alerts:read"})
+
+    registry.granted_mask({"scope": "alerts:read x y z"})
+
+    assert len(registry) == 1
+
+
+def test_route_policies_fail_closed_for_unknown_routes():
+    routes = RoutePolicies()
+    routes.register("GET /alerts", all_of={"alerts:read"})
+
+    assert routes.authorize("GET /alerts", {"scope": "alerts:read"}) is True
+    assert routes.authorize("DELETE /alerts", {"scope": "alerts:read"}) is False
+
+
+def test_granted_mask_cache_is_thread_safe():
+    registry = ScopeRegistry(max_cached_grants=2)
+    registry.mask_for({"a", "b"})
+    claims = [{"scope": "a"}, {"scope": "b"}, {"scope": "a b"}, {"scopes": ["b"]}]
+    errors = []
+
+    def hammer():
+        try:
+            for i in range(5000):
+                registry.granted_mask(claims[i % len(claims)])
+        except Exception as exc:  # pragma: no cover - the failure being tested
+            errors.append(exc)
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert registry.granted_mask({"scope": "a b"}) == registry.mask_for({"a", "b"})
+
+
+def test_concurrent_interns_get_distinct_bits():
+    registry = ScopeRegistry()
+    barrier = threading.Barrier(8)
+    bits = {}
+
+    def register(n):
+        barrier.wait()
+        for i in range(50):
+            bits[f"scope:{n}:{i}"] = registry.intern(f"scope:{n}:{i}")
+
+    threads = [threading.Thread(target=register, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(registry) == 400
+    assert len(set(bits.values())) == 400
+
+
+def test_mask_computed_before_intern_is_not_cached():
+    registry = ScopeRegistry()
+    registry.intern("a")
+    interned = []
+
+    class InternDuringCompute(dict):
+        def get(self, scope, default=None):
+            if scope == "a" and not interned:
+                # Another thread interns "b" after this mask already looked it up.
+                interned.append(registry.intern("b"))
+            return super().get(scope, default)
+
+    registry._bits = InternDuringCompute(registry._bits)
+    stale = registry.granted_mask({"scope": "b a"})
+
+    assert stale == registry.mask_for({"a"})
+    assert registry.granted_mask({"scope": "b a"}) == registry.mask_for({"a", "b"})
@@ -0,0 +1,156 @@
+"""Tests for the cached, hot-reloading settings provider."""
+import io
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.config.provider import SettingsProvider
+
+KEYS = ("APP_ENV", "DATABASE_URL", "API_TOKEN", "LOG_LEVEL")
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    saved = dict(os.environ)
+    for key in KEYS:
+        os.environ.pop(key, None)
+    monkeypatch.delenv("PYTHON_DOTENV_DISABLED", raising=False)
+    path = tmp_path / ".env"
+    yield path
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+def _write(path, mtime: int, **values) -> None:
+    path.write_text("".join(f"{key}={value}\n" for key, value in values.items()))
+    os.utime(path, (mtime, mtime))
+
+
+def _provider(path) -> SettingsProvider:
+    return SettingsProvider(env_file=str(path), check_interval_seconds=0)
+
+
+def test_settings_are_frozen_and_cached(env_file):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+    provider = _provider(env_file)
+
+    first = provider.get()
+    second = provider.get()
+
+    assert first is second
+    with pytest.raises(ValidationError):
+        first.log_level = "DEBUG"
+
+
+def test_reload_on_mtime_change_notifies_subscribers(env_file):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+    provider = _provider(env_file)
+    old = provider.get()
+    changes = []
+    provider.subscribe(lambda before, after: changes.append((before, after)))
+
+    _write(env_file, 2, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t", LOG_LEVEL="debug")
+    new = provider.get()
+
+    assert new.log_level == "DEBUG"
+    assert changes == [(old, new)]
+
+
+def test_invalid_reload_keeps_current_settings(env_file):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+    provider = _provider(env_file)
+    current = provider.get()
+    changes = []
+    provider.subscribe(lambda before, after: changes.append(after))
+
+    _write(env_file, 2, APP_ENV="staging", DATABASE_URL="alerts.db", API_TOKEN="t")
+
+    assert provider.get() is current
+    assert changes == []
+
+
+def test_real_environment_overrides_env_file(env_file):
+    os.environ["APP_ENV"] = "prod"
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+
+    assert _provider(env_file).get().env == "prod"
+
+
+def test_follow_log_level_updates_logger(env_file):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+    provider = _provider(env_file)
+    logger = app.build_logger(provider.get().log_level, stream=io.StringIO())
+    unsubscribe = app.follow_log_level(logger, provider)
+
+    _write(env_file, 2, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t", LOG_LEVEL="ERROR")
+    provider.get()
+    unsubscribe()
+
+    assert logger.level == 40
+
+
+def test_follow_ingest_sizes_updates_both_sizes(env_file):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")
+    provider = _provider(env_file)
+    sizes = app.IngestSizes.from_settings(provider.get())
+    unsubscribe = app.follow_ingest_sizes(sizes, provider)
+
+    _write(env_file, 2, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t",
+           INGEST_BATCH_SIZE="50", INGEST_POOL_SIZE="2")
+    provider.get()
+    unsubscribe()
+
+    assert sizes.get() == (50, 2)
+
+
+def test_ingest_events_uses_followed_sizes(env_file, tmp_path, monkeypatch):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL=str(tmp_path / "alerts.db"), API_TOKEN="t")
+    provider = _provider(env_file)
+    calls = []
+    real_insert = app.insert_alerts
+    monkeypatch.setattr(app, "insert_alerts", lambda c, rows: calls.append(len(rows)) or real_insert(c, rows))
+    events = [{"timestamp": "2026-01-01T00:00:00Z", "site_id": f"SITE-{i}", "alert_type": "LEAK",
+               "latitude": 29.7, "longitude": -95.3} for i in range(5)]
+
+    app.ingest_events(provider.get(), app.build_logger("INFO", stream=io.StringIO()), events,
+                      sizes=app.IngestSizes(batch_size=2, pool_size=1))
+
+    assert calls == [2, 2, 1]
+
+
+def test_provider_owns_env_file_loading(env_file, monkeypatch):
+    # load_dotenv() keys would look like real env vars and never reload.
+    import src.config.settings as settings_module
+
+    calls = []
+    monkeypatch.setattr(settings_module, "load_dotenv", lambda *a, **k: calls.append(a))
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t", LOG_LEVEL="INFO")
+    provider = _provider(env_file)
+    assert provider.get().log_level == "INFO"
+
+    _write(env_file, 2, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t", LOG_LEVEL="ERROR")
+    assert provider.get().log_level == "ERROR"
+    assert calls == []
+
+
+def test_dotenv_disabled_skips_env_file(env_file, monkeypatch):
+    _write(env_file, 1, APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t", LOG_LEVEL="ERROR")
+    monkeypatch.setenv("PYTHON_DOTENV_DISABLED", "1")
+    os.environ.update(APP_ENV="dev", DATABASE_URL="alerts.db", API_TOKEN="t")  # fixture restores
+
+    assert _provider(env_file).get().log_level == "INFO"
+
+
+def test_default_env_file_found_like_load_dotenv(monkeypatch, tmp_path):
+    import src.config.provider as provider_module
+
+    found = str(tmp_path / ".env")
+    monkeypatch.setattr(provider_module, "find_dotenv", lambda: found)
+
+    assert SettingsProvider().env_file == found
+
@@ -0,0 +1,87 @@
+"""Tests for the DDSketch streaming quantile sketch."""
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability.sketch import DDSketch
+
+QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999)
+
+
+def _exact(sorted_values: list[float], q: float) -> float:
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def _samples(distribution: str, n: int = 20_000) -> list[float]:
+    rng = random.Random(7)
+    if distribution == "uniform":
+        return [rng.uniform(0.01, 500.0) for _ in range(n)]
+    if distribution == "exponential":
+        return [rng.expovariate(1 / 20.0) for _ in range(n)]
+    if distribution == "lognormal":
+        return [rng.lognormvariate(2.0, 1.5) for _ in range(n)]
+    raise AssertionError(distribution)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "exponential", "lognormal"])
+def test_quantiles_within_relative_accuracy(distribution):
+    values = _samples(distribution)
+    sketch = DDSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in QUANTILES:
+        exact = _exact(ordered, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+
+
+def test_merged_sketches_match_single_sketch():
+    values = _samples("lognormal")
+    whole = DDSketch()
+    parts = [DDSketch() for _ in range(4)]
+    for i, value in enumerate(values):
+        whole.add(value)
+        parts[i % 4].add(value)
+
+    merged = DDSketch()
+    for part in parts:
+        merged.merge(DDSketch.from_dict(json.loads(json.dumps(part.to_dict()))))
+
+    assert merged.count == whole.count
+    for q in QUANTILES:
+        assert merged.quantile(q) == pytest.approx(whole.quantile(q))
+
+
+def test_memory_bounded_and_high_quantiles_preserved():
+    values = _samples("lognormal")
+    unbounded = DDSketch(relative_accuracy=0.01)
+    sketch = DDSketch(relative_accuracy=0.01, max_bins=256)
+    for value in values:
+        unbounded.add(value)
+        sketch.add(value)
+
+    assert len(unbounded) > 256
+    assert len(sketch) <= 256
+    assert sketch.quantile(0.99) == pytest.approx(_exact(sorted(values), 0.99), rel=0.01)
+
+
+def test_zero_empty_and_invalid_inputs():
+    sketch = DDSketch()
+    assert sketch.quantile(0.5) is None
+
+    sketch.add(0.0)
+    sketch.add(0.0)
+    sketch.add(10.0)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.percentiles((0.5, 1.0)) == {"p50": 0.0, "p100": pytest.approx(10.0, rel=0.01)}
+
+    with pytest.raises(ValueError):
+        sketch.add(-1.0)
+    with pytest.raises(ValueError):
+        sketch.merge(DDSketch(relative_accuracy=0.05))
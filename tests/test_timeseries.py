@@ -0,0 +1,72 @@
+"""Tests for rolling-window sensor aggregation."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.observability.timeseries import RollingAggregator
+
+
+def test_window_stats_match_recent_samples():
+    agg = RollingAggregator(window_seconds=10, bucket_seconds=1)
+    for t in range(20):
+        agg.record("SITE_001", "pressure", float(t), 1000 + t)
+
+    stats = agg.stats("SITE_001", "pressure", now=1019)
+
+    assert stats["count"] == 10
+    assert stats["mean"] == pytest.approx(14.5)
+    assert (stats["min"], stats["max"]) == (10.0, 19.0)
+    assert stats["rate"] == pytest.approx(1.0)
+
+
+def test_window_slides_and_empties():
+    agg = RollingAggregator(window_seconds=5, bucket_seconds=1)
+    agg.record("SITE_001", "pressure", 50.0, 100.0)
+
+    assert agg.stats("SITE_001", "pressure", now=104.9)["count"] == 1
+    assert agg.stats("SITE_001", "pressure", now=105.0) is None
+    assert agg.stats("SITE_002", "pressure", now=100.0) is None
+
+
+def test_samples_older_than_window_rejected():
+    agg = RollingAggregator(window_seconds=5, bucket_seconds=1)
+    agg.record("SITE_001", "pressure", 1.0, 100.0)
+
+    assert agg.record("SITE_001", "pressure", 2.0, 97.0) is True
+    assert agg.record("SITE_001", "pressure", 3.0, 95.0) is False
+    assert agg.stats("SITE_001", "pressure", now=100.0)["count"] == 2
+
+
+def test_max_series_evicts_least_recently_updated():
+    agg = RollingAggregator(window_seconds=10, max_series=2)
+    agg.record("A", "pressure", 1.0, 100.0)
+    agg.record("B", "pressure", 1.0, 100.0)
+    agg.record("A", "pressure", 1.0, 101.0)
+    agg.record("C", "pressure", 1.0, 101.0)
+
+    assert len(agg) == 2
+    assert agg.stats("B", "pressure", now=101.0) is None
+    assert agg.stats("A", "pressure", now=101.0) is not None
+    assert agg.evicted == 1
+
+
+def test_idle_series_evicted():
+    agg = RollingAggregator(window_seconds=10, idle_seconds=60)
+    agg.record("A", "pressure", 1.0, 100.0)
+    agg.record("B", "pressure", 1.0, 200.0)
+
+    assert len(agg) == 1
+    assert agg.stats("A", "pressure", now=100.0) is None
+
+
+def test_severity_uses_check_threshold():
+    agg = RollingAggregator(window_seconds=10)
+    for t, value in enumerate((60.0, 80.0, 100.0)):
+        agg.record("SITE_001", "pressure", value, 100.0 + t)
+
+    assert agg.severity("SITE_001", "pressure", 102.0, warning=70, critical=90) == "warning"
+    assert agg.severity("SITE_001", "pressure", 102.0, 70, 90, stat="max") == "critical"
+    assert agg.severity("SITE_009", "pressure", 102.0, 70, 90) is None
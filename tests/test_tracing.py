@@ -0,0 +1,127 @@
+"""Tests for timed spans and ingest stage instrumentation."""
+import io
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.main as app
+from src.infrastructure.database import initialize_database
+from src.observability import tracing
+from src.observability.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def sampling():
+    tracing.set_sample_rate(1.0)
+    yield
+    tracing.set_sample_rate(0.0)
+
+
+def test_timed_disabled_records_nothing():
+    registry = MetricsRegistry()
+
+    with tracing.timed("work", registry=registry) as span:
+        assert tracing.current_span() is None
+
+    assert span is None
+    assert registry.snapshot() == []
+
+
+def test_nested_spans_share_correlation_id_and_record_histograms(sampling):
+    registry = MetricsRegistry()
+
+    with tracing.timed("outer", registry=registry) as outer:
+        with tracing.timed("inner", registry=registry) as inner:
+            assert tracing.current_span() is inner
+        assert tracing.current_span() is outer
+
+    assert tracing.current_span() is None
+    assert inner.parent is outer
+    assert inner.correlation_id == outer.correlation_id
+    assert inner.duration_ms >= 0
+    assert registry.histogram("outer").count == 1
+    assert registry.histogram("inner").count == 1
+
+
+def test_span_duration_ignores_wall_clock_steps(monkeypatch, sampling):
+    registry = MetricsRegistry()
+    wall = iter([2_000_000_000, 1_000_000_000])
+    monkeypatch.setattr(tracing.time, "time_ns", lambda: next(wall))
+
+    with tracing.timed("work", registry=registry) as span:
+        tracing.time.time_ns()  # the wall clock steps back mid-span
+
+    assert span.started_at_ns == 2_000_000_000
+    assert span.duration_ms >= 0
+    assert registry.histogram("work").count == 1
+
+
+def test_root_spans_get_distinct_correlation_ids(sampling):
+    with tracing.timed("a", registry=MetricsRegistry()) as first:
+        pass
+    with tracing.timed("a", registry=MetricsRegistry()) as second:
+        pass
+
+    assert first.correlation_id != second.correlation_id
+
+
+def test_timed_decorator_records_and_preserves_exceptions(sampling):
+    registry = MetricsRegistry()
+
+    @tracing.timed("fails", registry=registry)
+    def fails():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        fails()
+
+    assert fails.__name__ == "fails"
+    assert registry.histogram("fails").count == 1
+    assert tracing.current_span() is None
+
+
+def test_unsampled_root_suppresses_children(monkeypatch):
+    registry = MetricsRegistry()
+    tracing.set_sample_rate(0.5)
+    monkeypatch.setattr(tracing.random, "random", lambda: 0.9)
+    try:
+        with tracing.timed("root", registry=registry):
+            with tracing.timed("child", registry=registry) as child:
+                pass
+    finally:
+        tracing.set_sample_rate(0.0)
+
+    assert child is None
+    assert registry.snapshot() == []
+
+
+def test_process_alert_event_records_stage_histograms(monkeypatch, sampling):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(tracing, "REGISTRY", registry)
+    attempts = {"count": 0}
+
+    def flaky_insert_alert(*args, **kwargs):
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise RuntimeError("temporary db failure")
+
+    monkeypatch.setattr(app, "insert_alert", flaky_insert_alert)
+    conn = sqlite3.connect(":memory:")
+    initialize_database(conn)
+
+    app.process_alert_event(
+        conn,
+        app.build_logger("INFO", stream=io.StringIO()),
+        timestamp="2024-01-26T10:00:00Z",
+        site_id="SITE_001",
+        alert_type="LEAK",
+        latitude=29.7604,
+        longitude=-95.3698,
+    )
+
+    for stage in ("process_alert", "validate", "classify", "persist", "retry"):
+        assert registry.histogram(f"ingest.{stage}").count == 1
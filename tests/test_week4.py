@@ -12,6 +12,7 @@ from pydantic import ValidationError
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import src.main as app
+from src.config.provider import reset_provider
 from src.config.settings import Settings
 from src.infrastructure.database import initialize_database
 from src.infrastructure.repositories import get_all_alerts
@@ -52,12 +53,17 @@ def test_from_env_defaults_log_level_to_info(monkeypatch):
 def test_load_settings_delegates_to_settings_from_env(monkeypatch):
     sentinel = object()
 
-    def fake_from_env(cls):
+    def fake_from_env(cls, load_env_file=True):
         return sentinel
 
     monkeypatch.setattr(Settings, "from_env", classmethod(fake_from_env))
 
-    assert app.load_settings() is sentinel
+    # load_settings goes through the cached provider; start from a fresh one.
+    reset_provider()
+    try:
+        assert app.load_settings() is sentinel
+    finally:
+        reset_provider()
 
 
 def test_process_alert_reading_wires_domain_and_infra():